@@ -0,0 +1,66 @@
+""" Import-time benchmark
+
+Measures, in fresh interpreters, how long importing `report` and constructing a `Report` take on
+top of numpy and pandas, and checks that no rendering backend is loaded on the way. Exits with a
+non-zero status when the median exceeds the budget.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 7] [--budget-ms 50]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only be imported by the code paths that use them
+lazy_modules = ["requests", "IPython", "altair", "plotly", "http.server", "socketserver", "webbrowser"]
+
+probe = """
+import json, os, sys, time
+sys.path.insert(0, {package_dir!r})
+import numpy, pandas
+start = time.perf_counter()
+import report
+imported = time.perf_counter()
+report.Report("Benchmark", "bench", "none", "import time", filepath=os.path.join({tmp_dir!r}, "report.html"))
+constructed = time.perf_counter()
+print(json.dumps({{"import": imported - start, "construct": constructed - imported,
+                  "loaded": [name for name in {lazy_modules!r} if name in sys.modules]}}))
+"""
+
+def run_once(tmp_dir: str) -> dict:
+    """Runs the probe in a new interpreter and returns its timings."""
+    code = probe.format(package_dir=package_dir, tmp_dir=tmp_dir, lazy_modules=lazy_modules)
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=7, help="Number of fresh interpreters to time.")
+    parser.add_argument("--budget-ms", type=float, default=50.0,
+                        help="Maximum median of import plus construction, in milliseconds.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        runs = [run_once(tmp_dir) for _ in range(args.repeat)]
+
+    import_ms = statistics.median(run["import"] for run in runs) * 1000
+    construct_ms = statistics.median(run["construct"] for run in runs) * 1000
+    loaded = sorted({name for run in runs for name in run["loaded"]})
+
+    print(f"import report:    {import_ms:8.1f} ms")
+    print(f"construct Report: {construct_ms:8.1f} ms")
+    print(f"budget:           {args.budget_ms:8.1f} ms")
+    if loaded:
+        print(f"eagerly loaded:   {', '.join(loaded)}")
+
+    return 0 if import_ms + construct_ms <= args.budget_ms and not loaded else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
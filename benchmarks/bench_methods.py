@@ -0,0 +1,250 @@
+""" Report method benchmark
+
+Times every `Report` method on synthetic DataFrames over a matrix of row counts, column counts and
+dtypes. Each case runs in a fresh interpreter, which also records the import time of `report` and
+the construction time of a `Report`, and reports:
+
+- wall time: the best of `--repeat` runs, each on a new `Report` (so no profile is reused), after
+  an untimed run on the first rows that imports the rendering backends,
+- peak memory: the peak of Python-tracked allocations (NumPy and pandas buffers included) during
+  one extra run under `tracemalloc`,
+- HTML bytes: the size of the returned fragment, or the growth of the report file for methods
+  that write instead of returning.
+
+Results are written as JSON together with the commit they were measured on; `--compare` prints
+the ratios against an earlier file and exits with a non-zero status when a case got slower than
+`--threshold`.
+
+Usage:
+    python benchmarks/bench_methods.py [--rows 1e3,1e5] [--columns 5,50] [--dtypes mixed]
+                                       [--methods histogram,box] [--repeat 3]
+                                       [--output results.json] [--compare baseline.json]
+
+    python benchmarks/bench_methods.py --rows 1e3,1e5,1e6,1e7 --columns 5,50,500 \\
+                                       --dtypes float,int,category,mixed --max-cells 5e7
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+dtypes = ["float", "int", "category", "mixed", "extreme"]
+
+# Method name -> (function of the report and the DataFrame, returning a fragment or None)
+methods = {
+    "add_content": lambda report, df: report.add_content(df.head(50).to_html()),
+    "add_section": lambda report, df: report.add_section("Benchmark"),
+    "add_dataframe": lambda report, df: report.add_dataframe(df, return_html=True),
+    "add_dataframe_virtual": lambda report, df: report.add_dataframe(df, mode="virtual", return_html=True),
+    "countplot": lambda report, df: report.countplot(df, return_html=True),
+    "donut": lambda report, df: report.donut(df, return_html=True),
+    "histogram": lambda report, df: report.histogram(df, return_html=True),
+    "histogram_server": lambda report, df: report.histogram(df, binning="server", return_html=True),
+    "histogram_chunks": lambda report, df: report.histogram([df.iloc[:len(df) // 2], df.iloc[len(df) // 2:]],
+                                                            return_html=True),
+    "box": lambda report, df: report.box(df, return_html=True),
+    "box_server": lambda report, df: report.box(df, stats="server", return_html=True),
+    "violin": lambda report, df: report.violin(df, return_html=True),
+    "correlation_heatmap": lambda report, df: report.correlation_heatmap(df, return_html=True),
+    "pairplot": lambda report, df: report.pairplot(df, max_plots=16, aggregate="grid", return_html=True),
+    "hc_scatter": lambda report, df: report.hc_scatter(df, max_plots=16, return_html=True),
+    "hc_distribution": lambda report, df: report.hc_distribution(df, return_html=True),
+    "histoplot": lambda report, df: report.histoplot(df, return_html=True),
+    "boxplot": lambda report, df: report.boxplot(df, return_html=True),
+    "densityplot": lambda report, df: report.densityplot(df, kde="server", return_html=True),
+}
+
+def make_frame(rows: int, columns: int, dtype: str, seed: int = 0):
+    """
+    Builds a synthetic DataFrame.
+
+    Args:
+        rows (int): Number of rows.
+        columns (int): Number of columns.
+        dtype (str): "float" (normal values with 1% missing), "int" (integers in [0, 1000)),
+            "category" (strings out of 20 categories), "mixed" (the three in turn) or "extreme"
+            (floats as "float" with 1% of them infinite).
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: The DataFrame.
+    """
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    categories = np.array([f"category_{i}" for i in range(20)], dtype=object)
+    data = {}
+    for i in range(columns):
+        kind = ["float", "int", "category"][i % 3] if dtype == "mixed" else dtype
+        if kind in ("float", "extreme"):
+            values = rng.normal(i, 1 + i % 7, rows)
+            values[rng.random(rows) < 0.01] = np.nan
+            if kind == "extreme":
+                values[rng.random(rows) < 0.01] = np.inf
+                values[rng.random(rows) < 0.01] = -np.inf
+        elif kind == "int":
+            values = rng.integers(0, 1000, rows)
+        else:
+            values = categories[rng.zipf(1.5, rows) % len(categories)]
+        data[f"{kind}_{i}"] = values
+    return pd.DataFrame(data)
+
+def run_case(method: str, rows: int, columns: int, dtype: str, repeat: int) -> dict:
+    """Runs one case in this interpreter and returns its measurements."""
+    # Imported first, so they are not part of the import time of `report`
+    import numpy  # noqa: F401
+    import pandas  # noqa: F401
+
+    sys.path.insert(0, package_dir)
+    start = time.perf_counter()
+    import report
+    imported = time.perf_counter()
+
+    df = make_frame(rows, columns, dtype)
+    func = methods[method]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        def new_report(name):
+            return report.Report("Benchmark", "bench", "synthetic", method,
+                                 filepath=os.path.join(tmp_dir, f"{name}.html"))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            constructing = time.perf_counter()
+            new_report("init")
+            constructed = time.perf_counter()
+
+            # Untimed run on a few rows, so the rendering backends are already imported
+            func(new_report("warmup"), df.head(100))
+
+            times = []
+            for i in range(repeat):
+                target = new_report(f"run{i}")
+                size = os.path.getsize(target.filepath)
+                begin = time.perf_counter()
+                html = func(target, df)
+                times.append(time.perf_counter() - begin)
+                target.close()
+            html_bytes = (len(html.encode("utf-8")) if isinstance(html, str)
+                          else os.path.getsize(target.filepath) - size)
+
+            target = new_report("memory")
+            tracemalloc.start()
+            func(target, df)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            target.close()
+
+    return {"method": method, "rows": rows, "columns": columns, "dtype": dtype,
+            "seconds": min(times), "peak_bytes": peak, "html_bytes": html_bytes,
+            "import_seconds": imported - start, "init_seconds": constructed - constructing}
+
+def case_name(result: dict) -> str:
+    return f"{result['method']}[{result['rows']}x{result['columns']} {result['dtype']}]"
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=package_dir, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def parse_counts(text: str) -> list:
+    return [int(float(value)) for value in text.split(",") if value]
+
+def compare(results: list, baseline_path: str, threshold: float) -> int:
+    """Prints time and size ratios against a previous run; returns the number of slower cases."""
+    with open(baseline_path) as f:
+        baseline = {case_name(result): result for result in json.load(f)["results"]}
+    regressions = 0
+    print(f"\n{'case':<52} {'time':>8} {'memory':>8} {'html':>8}")
+    for result in results:
+        previous = baseline.get(case_name(result))
+        if previous is None or "error" in result or "error" in previous:
+            continue
+        ratios = [result[key] / previous[key] if previous[key] else float("nan")
+                  for key in ("seconds", "peak_bytes", "html_bytes")]
+        slower = ratios[0] > threshold
+        regressions += slower
+        print(f"{case_name(result):<52} {ratios[0]:7.2f}x {ratios[1]:7.2f}x {ratios[2]:7.2f}x"
+              f"{'  SLOWER' if slower else ''}")
+    return regressions
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", default="1e3,1e5", help="Comma-separated row counts.")
+    parser.add_argument("--columns", default="5,50", help="Comma-separated column counts.")
+    parser.add_argument("--dtypes", default="mixed", help=f"Comma-separated dtypes out of {', '.join(dtypes)}.")
+    parser.add_argument("--methods", default=",".join(methods), help="Comma-separated methods to run.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case; the best one is kept.")
+    parser.add_argument("--max-cells", type=float, default=5e7,
+                        help="Skip cases with more rows x columns than this.")
+    parser.add_argument("--timeout", type=float, default=1800, help="Seconds allowed per case.")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against.")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Time ratio above which a case counts as a regression.")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        # Worker mode: one case, measured in this fresh interpreter
+        print(json.dumps(run_case(**json.loads(args.case))))
+        return 0
+
+    selected = [name for name in args.methods.split(",") if name]
+    unknown = [name for name in selected + args.dtypes.split(",") if name not in methods and name not in dtypes]
+    if unknown:
+        parser.error(f"unknown methods or dtypes: {', '.join(unknown)}")
+
+    cases = [(method, rows, columns, dtype)
+             for rows in parse_counts(args.rows) for columns in parse_counts(args.columns)
+             for dtype in args.dtypes.split(",") for method in selected
+             if rows * columns <= args.max_cells]
+
+    results = []
+    print(f"{'case':<52} {'time (ms)':>10} {'peak (MB)':>10} {'html (KB)':>10}")
+    for method, rows, columns, dtype in cases:
+        case = json.dumps({"method": method, "rows": rows, "columns": columns, "dtype": dtype,
+                           "repeat": args.repeat})
+        try:
+            process = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", case],
+                                     capture_output=True, text=True, timeout=args.timeout)
+            if process.returncode:
+                raise RuntimeError(process.stderr.strip().splitlines()[-1])
+            result = json.loads(process.stdout.strip().splitlines()[-1])
+        except (RuntimeError, subprocess.TimeoutExpired) as error:
+            result = {"method": method, "rows": rows, "columns": columns, "dtype": dtype, "error": str(error)}
+            print(f"{case_name(result):<52} failed: {error}")
+            results.append(result)
+            continue
+        results.append(result)
+        print(f"{case_name(result):<52} {result['seconds'] * 1000:10.1f} "
+              f"{result['peak_bytes'] / 2 ** 20:10.1f} {result['html_bytes'] / 2 ** 10:10.1f}")
+
+    measured = [result for result in results if "error" not in result]
+    if measured:
+        print(f"\nimport report:    {statistics.median(r['import_seconds'] for r in measured) * 1000:8.1f} ms")
+        print(f"construct Report: {statistics.median(r['init_seconds'] for r in measured) * 1000:8.1f} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"commit": git_commit(), "python": platform.python_version(),
+                       "machine": platform.platform(), "results": results}, f, indent=1)
+
+    regressions = compare(results, args.compare, args.threshold) if args.compare else 0
+    failures = len(results) - len(measured)
+    return 1 if regressions or failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
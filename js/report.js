@@ -8,3 +8,402 @@ function openModal(button) {
 function closeModal() {
     document.getElementById("detailModal").style.display = "none";
 }
+
+// `var` so the script can be included more than once (e.g. in several notebook outputs)
+var PyReport = window.PyReport = window.PyReport || {};
+
+PyReport.payloads = PyReport.payloads || {};
+PyReport.defined = PyReport.defined || {};
+PyReport.loading = PyReport.loading || {};
+
+// Data moved out of the page by `externalize_payloads` lives in `<payloadBase><id>.js` scripts,
+// which call `PyReport.define`. `PyReport.load` injects such a script once and resolves to its value.
+PyReport.define = function (id, value) {
+    PyReport.defined[id] = value;
+};
+
+PyReport.load = function (id) {
+    if (id in PyReport.defined) return Promise.resolve(PyReport.defined[id]);
+    if (!PyReport.loading[id]) {
+        PyReport.loading[id] = new Promise(function (resolve, reject) {
+            const script = document.createElement("script");
+            script.src = PyReport.payloadBase + id + ".js";
+            script.onload = function () { resolve(PyReport.defined[id]); };
+            script.onerror = reject;
+            document.head.appendChild(script);
+        });
+    }
+    return PyReport.loading[id];
+};
+
+// Decodes a base64 payload written by `encode_payload` into a Float32Array / Float64Array.
+// The decoded array is cached, so a column shared by several charts is only decoded once.
+PyReport.payload = function (id) {
+    if (PyReport.payloads[id]) return PyReport.payloads[id];
+
+    const element = document.getElementById(id);
+    const source = element ? {dtype: element.dataset.dtype, data: element.textContent} : PyReport.defined[id];
+    const binary = atob(source.data.trim());
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+
+    const ArrayType = source.dtype === "float32" ? Float32Array : Float64Array;
+    PyReport.payloads[id] = new ArrayType(bytes.buffer);
+    return PyReport.payloads[id];
+};
+
+// Zips two typed arrays into [x, y] points, skipping pairs with a missing value.
+PyReport.points = function (xs, ys) {
+    const points = [];
+    for (let i = 0; i < xs.length; i++) {
+        if (!Number.isNaN(xs[i]) && !Number.isNaN(ys[i])) points.push([xs[i], ys[i]]);
+    }
+    return points;
+};
+
+// Converts a typed array into a plain array of its non-missing values.
+PyReport.values = function (xs) {
+    return Array.from(xs).filter(function (x) { return !Number.isNaN(x); });
+};
+
+// Virtual tables written by `TableNode(mode="virtual")`: the rows live in a columnar spec
+// (see `encode_table`) and only the rows in view, plus a few above and below, are in the DOM.
+PyReport.maxScrollHeight = 10000000;  // Browsers cap element heights around 2^24 px
+
+PyReport.table = function (container, spec) {
+    const element = document.getElementById(container.dataset.table);
+    if (!spec && !element) {
+        // The spec is in a payload script
+        container.dataset.ready = "loading";
+        PyReport.load(container.dataset.table).then(function (value) {
+            const payloads = value.columns.filter(function (column) { return column.payload; });
+            return Promise.all(payloads.map(function (column) { return PyReport.load(column.payload); }))
+                .then(function () { PyReport.table(container, value); });
+        }).catch(console.error);
+        return;
+    }
+    spec = spec || JSON.parse(element.textContent);
+    const rows = spec.rows;
+    const viewport = container.querySelector(".virtual-table-viewport");
+    const thead = container.querySelector("thead");
+    const tbody = container.querySelector("tbody");
+    const status = container.querySelector(".virtual-table-status");
+    const filterInput = container.querySelector(".virtual-table-filter");
+
+    const columns = spec.columns.map(function (column) {
+        if (column.type === "number") {
+            column.data = column.payload ? PyReport.payload(column.payload) : Float64Array.from(
+                column.values, function (v) { return v === null ? NaN : v; });
+            column.text = function (row) {
+                const value = column.data[row];
+                if (Number.isNaN(value)) return "";
+                // Float32 payloads are shown at their own precision, not as the nearest double
+                return String(column.data instanceof Float32Array ? Number(value.toPrecision(7)) : value);
+            };
+            column.keys = column.data;
+        } else {
+            column.data = Int32Array.from(column.codes);
+            // Rows are sorted by the position of their category in sorted order (NaN when missing)
+            const sorted = column.categories.map(function (_, i) { return i; }).sort(function (a, b) {
+                return column.categories[a].localeCompare(column.categories[b], undefined, {numeric: true});
+            });
+            const rank = new Int32Array(column.categories.length);
+            sorted.forEach(function (code, position) { rank[code] = position; });
+            column.text = function (row) {
+                const code = column.data[row];
+                return code < 0 ? "" : column.categories[code];
+            };
+            column.keys = Float64Array.from(column.data, function (code) { return code < 0 ? NaN : rank[code]; });
+        }
+        return column;
+    });
+
+    let order = new Uint32Array(rows).map(function (_, i) { return i; });
+    let sortColumn = -1, sortDirection = 0;
+    let rowHeight = 36, measured = false;
+    const overscan = 10;
+
+    const headerRow = document.createElement("tr");
+    columns.forEach(function (column, index) {
+        const th = document.createElement("th");
+        th.textContent = column.name;
+        th.title = "Sort by " + column.name;
+        th.addEventListener("click", function () {
+            // Ascending, descending, then back to the original order
+            sortDirection = sortColumn !== index ? 1 : (sortDirection === 1 ? -1 : 0);
+            sortColumn = sortDirection === 0 ? -1 : index;
+            Array.from(headerRow.children).forEach(function (cell, i) {
+                cell.dataset.sort = i === sortColumn ? (sortDirection > 0 ? "asc" : "desc") : "";
+            });
+            update();
+        });
+        headerRow.appendChild(th);
+    });
+    thead.appendChild(headerRow);
+
+    function matching(query) {
+        if (!query) return new Uint32Array(rows).map(function (_, i) { return i; });
+        const matches = columns.map(function (column) {
+            if (column.type === "number") return null;
+            // Categories are tested once each, rows only look their code up
+            return column.categories.map(function (category) {
+                return category.toLowerCase().indexOf(query) >= 0;
+            });
+        });
+        const kept = [];
+        for (let row = 0; row < rows; row++) {
+            for (let c = 0; c < columns.length; c++) {
+                const hit = matches[c] ? columns[c].data[row] >= 0 && matches[c][columns[c].data[row]]
+                    : columns[c].text(row).indexOf(query) >= 0;
+                if (hit) { kept.push(row); break; }
+            }
+        }
+        return Uint32Array.from(kept);
+    }
+
+    function update() {
+        order = matching(filterInput.value.trim().toLowerCase());
+        if (sortColumn >= 0) {
+            const keys = columns[sortColumn].keys, direction = sortDirection;
+            // Missing values go last in either direction; ties keep their original order
+            const present = order.filter(function (row) { return !Number.isNaN(keys[row]); });
+            const missing = order.filter(function (row) { return Number.isNaN(keys[row]); });
+            present.sort(function (a, b) { return direction * (keys[a] - keys[b]) || a - b; });
+            order = new Uint32Array(present.length + missing.length);
+            order.set(present);
+            order.set(missing, present.length);
+        }
+        status.textContent = order.length === rows ? rows.toLocaleString() + " rows"
+            : order.length.toLocaleString() + " of " + rows.toLocaleString() + " rows";
+        viewport.scrollTop = 0;
+        draw();
+    }
+
+    function spacer(height) {
+        const tr = document.createElement("tr");
+        tr.className = "virtual-table-spacer";
+        tr.style.height = height + "px";
+        return tr;
+    }
+
+    function draw() {
+        // The viewport only reaches its maximum height once rows are drawn
+        const height = Math.max(viewport.clientHeight, parseFloat(viewport.style.maxHeight) || 0);
+        const visible = Math.ceil(height / rowHeight) + 2 * overscan;
+        // Very long tables scroll in smaller steps than a row so the spacers stay below the height cap
+        const step = Math.min(rowHeight, PyReport.maxScrollHeight / Math.max(order.length, 1));
+        const start = Math.max(0, Math.min(Math.floor(viewport.scrollTop / step) - overscan,
+                                           order.length - visible));
+        const end = Math.min(order.length, start + visible);
+
+        const fragment = document.createDocumentFragment();
+        fragment.appendChild(spacer(start * step));
+        for (let i = start; i < end; i++) {
+            const tr = document.createElement("tr");
+            for (let c = 0; c < columns.length; c++) {
+                const td = document.createElement("td");
+                td.textContent = columns[c].text(order[i]);
+                tr.appendChild(td);
+            }
+            fragment.appendChild(tr);
+        }
+        fragment.appendChild(spacer((order.length - end) * step));
+        tbody.replaceChildren(fragment);
+
+        // Rows have one line each (cells do not wrap), so the first drawn row gives the height of all
+        const first = tbody.children[1];
+        if (!measured && end > start && first.offsetHeight) {
+            measured = true;
+            if (first.offsetHeight !== rowHeight) {
+                rowHeight = first.offsetHeight;
+                draw();
+            }
+        }
+    }
+
+    let frame = null;
+    viewport.addEventListener("scroll", function () {
+        if (frame === null) frame = requestAnimationFrame(function () { frame = null; draw(); });
+    });
+    let timer = null;
+    filterInput.addEventListener("input", function () {
+        clearTimeout(timer);
+        timer = setTimeout(update, 200);
+    });
+
+    container.dataset.ready = "true";
+    update();
+};
+
+// Sets up the virtual tables not set up yet (the script may run once per notebook output)
+PyReport.tables = function () {
+    document.querySelectorAll(".virtual-table[data-table]:not([data-ready])").forEach(PyReport.table);
+};
+
+PyReport.tables();
+
+// Lazy charts. Chart scripts (see `lazy_chart_script`) push {id, library, create} entries to
+// `PyReport.charts`, possibly before this file runs. A chart is created when its container comes
+// within `margin` pixels of the viewport, a few per animation frame, and disposed again when it
+// is more than `disposeMargin` pixels away (keeping its size, so the page does not jump).
+PyReport.lazy = PyReport.lazy || {margin: 400, disposeMargin: 4000, dispose: true, frameBudget: 12};
+PyReport.registry = PyReport.registry || {};
+PyReport.pending = PyReport.pending || new Set();
+
+PyReport.createChart = function (entry) {
+    const element = document.getElementById(entry.id);
+    if (!entry.create) {
+        // The chart and the payloads it uses are in payload scripts
+        element.dataset.chart = "loading";
+        Promise.all([entry.id].concat(entry.requires || []).map(PyReport.load)).then(function (values) {
+            entry.create = values[0];
+            if (element.dataset.chart !== "loading") return;
+            if (PyReport.near(element, PyReport.lazy.disposeMargin)) PyReport.createChart(entry);
+            else element.dataset.chart = "disposed";
+        }, console.error);
+        return;
+    }
+    element.dataset.chart = "created";
+    try {
+        entry.instance = entry.create(element);
+        if (entry.instance && entry.instance.catch) entry.instance.catch(console.error);
+    } catch (error) {
+        console.error(error);
+    }
+};
+
+PyReport.disposeChart = function (entry) {
+    const element = document.getElementById(entry.id);
+    element.style.minHeight = element.offsetHeight + "px";
+    element.dataset.chart = "disposed";
+    const instance = entry.instance;
+    entry.instance = null;
+    if (entry.library === "plotly") {
+        Plotly.purge(element);
+    } else if (entry.library === "highcharts") {
+        if (instance) instance.destroy();
+    } else if (instance) {
+        Promise.resolve(instance).then(function (result) { result.finalize(); }, function () {});
+    }
+    element.replaceChildren();
+};
+
+PyReport.near = function (element, margin) {
+    const rect = element.getBoundingClientRect();
+    return rect.bottom > -margin && rect.top < window.innerHeight + margin;
+};
+
+// Creates pending charts that are still near the viewport, within a time budget per frame
+PyReport.drain = function () {
+    PyReport.frame = null;
+    const start = performance.now();
+    for (const id of PyReport.pending) {
+        if (performance.now() - start > PyReport.lazy.frameBudget) break;
+        PyReport.pending.delete(id);
+        const element = document.getElementById(id);
+        // Charts created above may have pushed this one away
+        const waiting = element && (element.dataset.chart === "pending" || element.dataset.chart === "disposed");
+        if (waiting && PyReport.near(element, PyReport.lazy.margin)) {
+            PyReport.createChart(PyReport.registry[id]);
+        }
+    }
+    if (PyReport.pending.size) PyReport.frame = requestAnimationFrame(PyReport.drain);
+};
+
+PyReport.observers = function () {
+    if (PyReport.nearObserver) return;
+    PyReport.nearObserver = new IntersectionObserver(function (entries) {
+        entries.forEach(function (entry) {
+            if (entry.isIntersecting) PyReport.pending.add(entry.target.id);
+            else PyReport.pending.delete(entry.target.id);
+        });
+        if (PyReport.pending.size && !PyReport.frame) PyReport.frame = requestAnimationFrame(PyReport.drain);
+    }, {rootMargin: PyReport.lazy.margin + "px 0px"});
+    PyReport.farObserver = new IntersectionObserver(function (entries) {
+        entries.forEach(function (entry) {
+            const chart = PyReport.registry[entry.target.id];
+            if (!entry.isIntersecting && PyReport.lazy.dispose && entry.target.dataset.chart === "created") {
+                PyReport.disposeChart(chart);
+            }
+        });
+    }, {rootMargin: PyReport.lazy.disposeMargin + "px 0px"});
+};
+
+PyReport.register = function (entry) {
+    const element = document.getElementById(entry.id);
+    if (!element || PyReport.registry[entry.id]) return;
+    PyReport.registry[entry.id] = entry;
+    element.dataset.chart = "pending";
+    if (!("IntersectionObserver" in window)) {
+        PyReport.createChart(entry);
+        return;
+    }
+    PyReport.observers();
+    PyReport.nearObserver.observe(element);
+    PyReport.farObserver.observe(element);
+};
+
+// Creates every chart not created yet, e.g. before printing
+PyReport.renderAll = function () {
+    Object.keys(PyReport.registry).forEach(function (id) {
+        const element = document.getElementById(id);
+        if (element && element.dataset.chart !== "created" && element.dataset.chart !== "loading") {
+            PyReport.createChart(PyReport.registry[id]);
+        }
+    });
+};
+
+// Registers the queued charts; later pushes register directly (the script may run once per notebook output)
+if (Array.isArray(PyReport.charts)) {
+    const queued = PyReport.charts;
+    PyReport.charts = {push: function () { Array.prototype.forEach.call(arguments, PyReport.register); }};
+    queued.forEach(PyReport.register);
+    window.addEventListener("beforeprint", PyReport.renderAll);
+}
+
+// Live reports (see `LiveChannel`): a page served by `run_server(live=True)` records the sequence
+// number of its last fragment in `PyReport.sequence` and receives the fragments added afterwards
+// as Server-Sent Events. They are appended one after another, running their scripts in order.
+PyReport.liveUrl = PyReport.liveUrl || "/__live__";
+
+PyReport.append = function (container, html) {
+    const template = document.createElement("template");
+    template.innerHTML = html;
+    const scripts = Array.from(template.content.querySelectorAll("script"));
+    container.appendChild(template.content);
+
+    // Parsed scripts do not run; replace each with a copy, waiting for external ones to load
+    return scripts.reduce(function (previous, script) {
+        return previous.then(function () {
+            return new Promise(function (resolve) {
+                const copy = document.createElement("script");
+                Array.from(script.attributes).forEach(function (attribute) {
+                    copy.setAttribute(attribute.name, attribute.value);
+                });
+                copy.textContent = script.textContent;
+                const external = script.src && (!script.type || /javascript|module/.test(script.type));
+                if (external) copy.onload = copy.onerror = resolve;
+                script.replaceWith(copy);
+                if (!external) resolve();
+            });
+        });
+    }, Promise.resolve()).then(PyReport.tables);
+};
+
+PyReport.live = function () {
+    if (PyReport.liveSource || !window.EventSource || !/^https?:$/.test(location.protocol)) return;
+    const container = document.querySelector(".container-fluid") || document.body;
+    let queue = Promise.resolve();
+    const source = PyReport.liveSource = new EventSource(PyReport.liveUrl + "?since=" + PyReport.sequence);
+    source.addEventListener("fragment", function (event) {
+        queue = queue.then(function () { return PyReport.append(container, event.data); }).catch(console.error);
+    });
+    source.addEventListener("reload", function () {
+        source.close();
+        location.reload();
+    });
+};
+
+if (PyReport.sequence !== undefined) PyReport.live();
@@ -28,54 +28,3429 @@ Author: Sagar Paudel
 Date: 2025-04-19
 """
 
+from __future__ import annotations
+
 import os
 import re
+import sys
 import uuid
 import json
-import requests
 import textwrap
-import random
+import base64
+import contextlib
+import contextvars
+import hashlib
+import functools
+import inspect
+import itertools
+import time
+import warnings
+import weakref
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import numpy as np
 import pandas as pd
 
-import http.server
-import socketserver
-import webbrowser
-import threading
+# Rendering backends, the HTTP client and the notebook display are imported by the functions
+# that use them, so importing this module (and writing plain HTML) stays cheap.
+if TYPE_CHECKING:
+    import altair as alt
+    import plotly.graph_objects as go
+    from plotly.basedatatypes import BaseFigure as PlotlyFigure
+
+__version__ = "1.0.0"
+
+# Configuration
+css_url = "https://raw.githubusercontent.com/paudelsagar/pyreport/refs/heads/main/css/report.css"
+js_url = "https://raw.githubusercontent.com/paudelsagar/pyreport/refs/heads/main/js/report.js"
+
+# Stylesheet and script shipped next to this module, used unless a URL is given explicitly
+package_dir = os.path.dirname(os.path.abspath(__file__))
+css_path = os.path.join(package_dir, "css", "report.css")
+js_path = os.path.join(package_dir, "js", "report.js")
+
+# On-disk cache for assets fetched from a URL
+cache_dir = os.environ.get("PYREPORT_CACHE_DIR",
+                           os.path.join(os.path.expanduser("~"), ".cache", "pyreport"))
+asset_timeout = 5
+
+plotly_config = {'displaylogo': False}
+
+# Data accepted by the profiling and distribution methods: a DataFrame, an iterable of DataFrame
+# chunks or the path of a CSV / parquet file read in batches
+DataSource = Union[pd.DataFrame, str, os.PathLike, Iterable[pd.DataFrame]]
+
+def _read_text(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+@functools.lru_cache(maxsize=None)
+def _read_bundled_asset(path: str) -> str:
+    """Reads (once per process) a CSS/JS file shipped with the package."""
+    return _read_text(path)
+
+@functools.lru_cache(maxsize=None)
+def fetch_asset(url: str, timeout: float = asset_timeout) -> str:
+    """
+    Returns the text of a remote asset, using an on-disk cache keyed by package version and ETag.
+
+    A cached copy written by the current `__version__` is returned without touching the network.
+    Otherwise the URL is requested (revalidating with `If-None-Match` when an older copy exists)
+    and the cache is refreshed. If the request fails, a stale cached copy is used when available.
+
+    Args:
+        url (str): The URL of the asset.
+        timeout (float, optional): Request timeout in seconds. Defaults to `asset_timeout`.
+
+    Returns:
+        str: The asset text.
+
+    Raises:
+        requests.RequestException: If the asset cannot be fetched and no cached copy exists.
+    """
+    import requests
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    body_path = os.path.join(cache_dir, f"{key}.asset")
+    meta_path = os.path.join(cache_dir, f"{key}.json")
+
+    meta = {}
+    if os.path.exists(body_path) and os.path.exists(meta_path):
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") == __version__:
+            return _read_text(body_path)
+
+    headers = {"If-None-Match": meta["etag"]} if meta.get("etag") else {}
+    try:
+        response = requests.get(url, headers=headers, timeout=timeout)
+        if response.status_code != 304:
+            response.raise_for_status()
+    except requests.RequestException:
+        if meta:
+            warnings.warn(f"Could not refresh {url}; using a cached copy.")
+            return _read_text(body_path)
+        raise
+
+    os.makedirs(cache_dir, exist_ok=True)
+    if response.status_code != 304:
+        with open(body_path, "w", encoding="utf-8") as f:
+            f.write(response.text)
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump({"url": url, "version": __version__,
+                   "etag": response.headers.get("ETag", meta.get("etag"))}, f)
+
+    return _read_text(body_path)
+
+def load_asset(path: str, url: Optional[str] = None) -> str:
+    """
+    Loads a report asset, from `url` (through the on-disk cache) if given, else from the bundled file.
+
+    Falls back to the bundled file when the URL cannot be fetched, so report construction never
+    depends on network access.
+
+    Args:
+        path (str): Path of the bundled asset.
+        url (Optional[str], optional): Remote location of the asset. Defaults to None.
+
+    Returns:
+        str: The asset text.
+    """
+    if url:
+        import requests
+        try:
+            return fetch_asset(url)
+        except requests.RequestException as e:
+            warnings.warn(f"Could not fetch {url} ({e}); using the bundled asset.")
+    return _read_bundled_asset(path)
+
+# JavaScript libraries the charts depend on. Dependencies are listed in load order, and the URL
+# placeholders are filled from `library_versions()` of the matching Python package.
+js_libraries = {
+    "plotly": {"url": "https://cdn.plot.ly/plotly-{plotly}.min.js", "requires": []},
+    "highcharts": {"url": "https://code.highcharts.com/highcharts.js", "requires": []},
+    "highcharts-bellcurve": {"url": "https://code.highcharts.com/modules/histogram-bellcurve.js",
+                             "requires": ["highcharts"]},
+    "highcharts-heatmap": {"url": "https://code.highcharts.com/modules/heatmap.js", "requires": ["highcharts"]},
+    "vega": {"url": "https://cdn.jsdelivr.net/npm/vega@{vega}", "requires": []},
+    "vega-lite": {"url": "https://cdn.jsdelivr.net/npm/vega-lite@{vega_lite}", "requires": ["vega"]},
+    "vega-embed": {"url": "https://cdn.jsdelivr.net/npm/vega-embed@{vega_embed}",
+                   "requires": ["vega", "vega-lite"]},
+}
+
+# Markers used to find out which libraries a raw HTML fragment needs
+js_library_markers = {
+    "plotly": "Plotly.newPlot",
+    "highcharts": "Highcharts.",
+    "highcharts-bellcurve": "'bellcurve'",
+    "highcharts-heatmap": "'heatmap'",
+    "vega-embed": "vegaEmbed(",
+}
+
+@functools.lru_cache(maxsize=None)
+def library_versions(package: str) -> dict:
+    """
+    Versions of the JavaScript libraries matching an installed Python package.
+
+    Args:
+        package (str): "plotly" or "altair". Only this package is imported.
+
+    Returns:
+        dict: The URL placeholders of `js_libraries` provided by the package.
+    """
+    if package == "plotly":
+        from plotly.offline.offline import get_plotlyjs_version
+        return {"plotly": get_plotlyjs_version()}
+    import altair as alt
+    return {"vega": alt.VEGA_VERSION, "vega_lite": alt.VEGALITE_VERSION,
+            "vega_embed": alt.VEGAEMBED_VERSION}
+
+def library_url(name: str) -> str:
+    """Returns the CDN URL of a library registered in `js_libraries`."""
+    url = js_libraries[name]["url"]
+    if "{plotly}" in url:
+        return url.format(**library_versions("plotly"))
+    if "{vega" in url:
+        return url.format(**library_versions("altair"))
+    return url
+
+def library_source(name: str) -> str:
+    """
+    Returns the JavaScript source of a library registered in `js_libraries`.
+
+    plotly.js ships with the plotly package; the other libraries are fetched from their CDN
+    through the on-disk asset cache.
+    """
+    if name == "plotly":
+        from plotly.offline import get_plotlyjs
+        return get_plotlyjs()
+    return fetch_asset(library_url(name))
+
+def detect_assets(html: str) -> List[str]:
+    """
+    Guesses which registered libraries a raw HTML fragment relies on.
+
+    Args:
+        html (str): The HTML fragment.
+
+    Returns:
+        List[str]: Names of the libraries used by the fragment.
+    """
+    return [name for name, marker in js_library_markers.items() if marker in html]
+
+class AssetManager:
+    """
+    Tracks the JavaScript libraries needed by one report output and emits each of them exactly once.
+
+    Libraries can be embedded in three ways:
+
+    - ``"inline"``: the library source is inlined in a ``<script>`` block (self-contained, works offline).
+    - ``"file"``: the library is written once to a sibling ``<report>_files/`` directory and referenced
+      with a relative ``<script src>``.
+    - ``"cdn"``: the library is referenced from its CDN URL.
+
+    Args:
+        mode (str, optional): One of "inline", "file" or "cdn". Defaults to "inline".
+        filepath (str, optional): Path of the report the assets belong to (used by the "file" mode).
+            Defaults to './eda-report.html'.
+        assets_dir (Optional[str], optional): Directory of the "file" mode, relative to the report.
+            Defaults to `<report>_files`.
+        written (Optional[set], optional): Names of the libraries already written to `assets_dir`, shared
+            by the managers of several pages so each file is written once. Defaults to a new set.
+    """
+
+    modes = ("inline", "file", "cdn")
+
+    def __init__(self, mode: str = "inline", filepath: str = "./eda-report.html",
+                 assets_dir: Optional[str] = None, written: Optional[set] = None) -> None:
+        if mode not in self.modes:
+            raise ValueError(f"asset mode must be one of {self.modes}, got {mode!r}")
+        self.mode = mode
+        self.filepath = filepath
+        self.assets_dir = assets_dir
+        self.written = set() if written is None else written
+        self.required: List[str] = []
+        self.emitted: set = set()
+
+    def _resolve(self, names: List[str]) -> List[str]:
+        """Expands dependencies and returns the libraries in load order."""
+        ordered = []
+        for name in names:
+            for dep in js_libraries[name]["requires"] + [name]:
+                if dep not in ordered:
+                    ordered.append(dep)
+        return ordered
+
+    def _script_tag(self, name: str) -> str:
+        directory, filename = os.path.split(os.path.abspath(self.filepath))
+        assets_dir = self.assets_dir or f"{os.path.splitext(filename)[0]}_files"
+        if self.mode == "file" and name in self.written:
+            return f'<script src="{assets_dir}/{name}.js"></script>'
+
+        if self.mode in ("inline", "file"):
+            import requests
+            try:
+                source = library_source(name)
+            except requests.RequestException:
+                warnings.warn(f"Could not fetch {name}; referencing its CDN instead.")
+                return f'<script src="{library_url(name)}"></script>'
+
+            if self.mode == "inline":
+                return f"<script>{source}</script>"
+
+            os.makedirs(os.path.join(directory, assets_dir), exist_ok=True)
+            with open(os.path.join(directory, assets_dir, f"{name}.js"), "w", encoding="utf-8") as f:
+                f.write(source)
+            self.written.add(name)
+            return f'<script src="{assets_dir}/{name}.js"></script>'
+
+        return f'<script src="{library_url(name)}"></script>'
+
+    def output_bytes(self, name: str) -> int:
+        """
+        Returns the bytes one library adds to the report output, without writing anything: its
+        inline ``<script>`` block, its file plus the tag referencing it, or its CDN tag.
+
+        Args:
+            name (str): Name of a library from `js_libraries`.
+        """
+        cdn_tag = f'<script src="{library_url(name)}"></script>'
+        if self.mode == "cdn":
+            return len(cdn_tag.encode("utf-8"))
+        import requests
+        try:
+            size = len(library_source(name).encode("utf-8"))
+        except requests.RequestException:
+            return len(cdn_tag.encode("utf-8"))
+        if self.mode == "inline":
+            return size + len("<script></script>")
+        assets_dir = self.assets_dir or f"{os.path.splitext(os.path.basename(self.filepath))[0]}_files"
+        return size + len(f'<script src="{assets_dir}/{name}.js"></script>'.encode("utf-8"))
+
+    def tags(self, names: List[str]) -> str:
+        """
+        Returns the ``<script>`` markup for the given libraries (and their dependencies) that
+        have not been emitted yet, and records them as emitted.
+
+        Args:
+            names (List[str]): Names of libraries from `js_libraries`.
+
+        Returns:
+            str: The markup to place before the content using the libraries ("" if nothing is new).
+        """
+        markup = []
+        for name in self._resolve(names):
+            if name not in self.required:
+                self.required.append(name)
+            if name not in self.emitted:
+                self.emitted.add(name)
+                markup.append(self._script_tag(name))
+        return "\n".join(markup)
+
+def _display(content: str, markdown: bool = False) -> None:
+    """
+    Shows HTML (or Markdown) content in the running IPython session.
+
+    Outside IPython there is nothing to display into, so IPython is not imported at all.
+
+    Args:
+        content (str): The HTML or Markdown source.
+        markdown (bool, optional): If True, renders `content` as Markdown. Defaults to False.
+    """
+    if "IPython" not in sys.modules:
+        return
+    from IPython.display import display, HTML, Markdown
+    display(Markdown(content) if markdown else HTML(content))
+
+def lazy_chart_script(element_id: str, library: str, create: str) -> str:
+    """
+    Returns the script registering a chart with the lazy loader of `report.js`.
+
+    The chart is only created when its container nears the viewport, and may be disposed again
+    once it is far off-screen, so the page load does not depend on the number of charts. The
+    registration is queued until `report.js` runs, which comes after the content.
+
+    Args:
+        element_id (str): Id of the chart container.
+        library (str): "plotly", "highcharts" or "vega", which tells the loader how to dispose the chart.
+        create (str): Body of a JavaScript function of the container `element` that creates the chart
+            and returns it (or a promise of it).
+
+    Returns:
+        str: The ``<script>`` block.
+    """
+    return ("\n<script>\n"
+            "var PyReport = window.PyReport = window.PyReport || {};\n"
+            f'(PyReport.charts = PyReport.charts || []).push({{id: "{element_id}", library: "{library}", '
+            f"create: function (element) {{\n{create}\n}}}});\n"
+            "</script>\n")
+
+def plotly_html(fig: PlotlyFigure, div_id: Optional[str] = None) -> str:
+    """
+    Converts a Plotly figure into an HTML fragment without embedding plotly.js.
+
+    The library itself is provided once per report by the `AssetManager`, and the figure is drawn
+    by the lazy loader of `report.js` (see `lazy_chart_script`). Its container reserves the figure's
+    height (450 px if unset, Plotly's default) until then.
+
+    Args:
+        fig (BaseFigure): The Plotly figure.
+        div_id (Optional[str], optional): Id of the chart container. Defaults to a random id.
+
+    Returns:
+        str: The HTML fragment.
+    """
+    div_id = div_id or f"plotly-{uuid.uuid4().hex}"
+    height = fig.layout.height or 450
+    with telemetry_phase("plotly_html"):
+        # "</" would close the script block early
+        figure = fig.to_json().replace("</", "<\\/")
+    create = (f"var figure = {figure};\n"
+              f"return Plotly.newPlot(element, figure.data, figure.layout, {json.dumps(plotly_config)});")
+    return (f'<div id="{div_id}" class="plotly-graph-div" style="height: {height}px; width: 100%;"></div>'
+            + lazy_chart_script(div_id, "plotly", create))
+
+def altair_html(chart: "alt.TopLevelMixin", div_id: Optional[str] = None,
+                embed_options: Optional[dict] = None) -> str:
+    """
+    Converts an Altair chart into an HTML fragment calling `vegaEmbed`, without the per-chart
+    ``<script src>`` tags Altair would add. Vega, Vega-Lite and Vega-Embed are provided once per
+    report by the `AssetManager`, and the chart is drawn by the lazy loader of `report.js`.
+
+    Args:
+        chart (alt.TopLevelMixin): The Altair chart.
+        div_id (Optional[str], optional): Id of the chart container. Defaults to a random id.
+        embed_options (Optional[dict], optional): Options passed to `vegaEmbed`. Defaults to the PNG renderer.
+
+    Returns:
+        str: The HTML fragment.
+    """
+    div_id = div_id or f"altair-{uuid.uuid4().hex}"
+    embed_options = dict(embed_options or {'renderer': 'png'}, mode="vega-lite")
+    with telemetry_phase("altair_html"):
+        spec = chart.to_json(indent=None).replace("</", "<\\/")
+    create = f"return vegaEmbed(element, {spec}, {json.dumps(embed_options)});"
+    return f'\n<div id="{div_id}"></div>' + lazy_chart_script(div_id, "vega", create)
+
+def encode_payload(values: Union[np.ndarray, pd.Series], dtype: str = "float64") -> Tuple[str, str]:
+    """
+    Encodes a numeric array as a base64 little-endian binary payload embedded in the page.
+
+    The payload is placed in a non-executed ``<script type="application/octet-stream">`` block, which
+    `PyReport.payload(id)` in `report.js` decodes straight into a `Float32Array` / `Float64Array`.
+    Missing values are kept as NaN.
+
+    Args:
+        values (Union[np.ndarray, pd.Series]): The numeric values.
+        dtype (str, optional): "float32" or "float64". Defaults to "float64".
+
+    Returns:
+        Tuple[str, str]: The payload id and the HTML block holding it.
+    """
+    if dtype not in ("float32", "float64"):
+        raise ValueError(f"payload dtype must be 'float32' or 'float64', got {dtype!r}")
+    array = np.ascontiguousarray(pd.to_numeric(pd.Series(values), errors="coerce")
+                                 .to_numpy(dtype=f"<f{4 if dtype == 'float32' else 8}",
+                                           na_value=np.nan))
+    payload_id = f"payload-{uuid.uuid4().hex}"
+    encoded = base64.b64encode(array.tobytes()).decode("ascii")
+    return payload_id, (f'<script type="application/octet-stream" id="{payload_id}" '
+                        f'data-dtype="{dtype}">{encoded}</script>')
+
+def encode_table(df: pd.DataFrame, payload: str = "json", payload_dtype: str = "float64") -> Tuple[str, str]:
+    """
+    Encodes the rows of a DataFrame once, column by column, for the virtual table of `report.js`.
+
+    Numeric columns are written as value arrays, or with `payload="binary"` as `encode_payload`
+    buffers. Every other column is dictionary-encoded: its distinct values, as strings, and one
+    integer code per row (-1 for missing values), so repeated labels are only written once. The
+    spec is a JSON document in a non-executed ``<script type="application/json">`` block.
+
+    Args:
+        df (pd.DataFrame): The DataFrame.
+        payload (str, optional): "json" or "binary" encoding of the numeric columns. Defaults to "json".
+        payload_dtype (str, optional): Precision of binary payloads, "float32" or "float64". Defaults to "float64".
+
+    Returns:
+        Tuple[str, str]: The spec id and the HTML blocks holding the spec and its payloads.
+    """
+    if payload not in ("json", "binary"):
+        raise ValueError(f"payload must be 'json' or 'binary', got {payload!r}")
+    blocks, columns = [], []
+    for col in df.columns:
+        series = df[col]
+        column = {"name": str(col)}
+        if dtype_class(series.dtype) == "numeric":
+            column["type"] = "number"
+            if payload == "binary":
+                column["payload"], payload_html = encode_payload(series, payload_dtype)
+                blocks.append(payload_html)
+            elif pd.api.types.is_integer_dtype(series.dtype) and not series.hasnans:
+                column["values"] = series.tolist()
+            else:
+                values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+                # JSON has no NaN or infinity; both are written as null
+                column["values"] = [v if finite else None
+                                    for v, finite in zip(values.tolist(), np.isfinite(values).tolist())]
+        else:
+            codes, uniques = pd.factorize(series)
+            column.update(type="string", categories=pd.Index(uniques).astype(str).tolist(),
+                          codes=codes.tolist())
+        columns.append(column)
+
+    spec_id = f"table-{uuid.uuid4().hex}"
+    # "</" would close the script block early
+    spec = json.dumps({"rows": len(df), "columns": columns}, separators=(",", ":")).replace("</", "<\\/")
+    blocks.append(f'<script type="application/json" id="{spec_id}">{spec}</script>')
+    return spec_id, "".join(blocks)
+
+# Markup of the data embedded by `encode_payload`, `encode_table` and `lazy_chart_script`
+payload_block = re.compile(r'<script type="application/octet-stream" id="([^"]+)" data-dtype="([^"]+)">([^<]*)</script>')
+table_block = re.compile(r'<script type="application/json" id="([^"]+)">(.*?)</script>', re.S)
+chart_block = re.compile(r'push\(\{id: "([^"]+)", library: "([^"]+)", create: function \(element\) \{\n(.*?)\n\}\}\);\n</script>',
+                         re.S)
+
+def externalize_payloads(html: str, directory: str, prefix: str = "payloads") -> str:
+    """
+    Moves the data embedded in a page to separate scripts that `report.js` loads on demand.
+
+    Binary payloads, virtual table specs and lazy chart definitions are each written to
+    `<directory>/<prefix>/<id>.js`, which hands them to `PyReport.define`. The page keeps the chart
+    containers and registrations, which name the payloads each chart needs, so a chart's data is
+    only downloaded when the chart nears the viewport.
+
+    Args:
+        html (str): Page markup.
+        directory (str): Directory of the page.
+        prefix (str, optional): Subdirectory of the payload scripts. Defaults to "payloads".
+
+    Returns:
+        str: The page markup without the data.
+    """
+    os.makedirs(os.path.join(directory, prefix), exist_ok=True)
+
+    def define(item_id: str, value: str) -> None:
+        with open(os.path.join(directory, prefix, f"{item_id}.js"), "w", encoding="utf-8") as f:
+            f.write(f'PyReport.define("{item_id}", {value});\n')
+
+    def chart(match) -> str:
+        item_id, library, create = match.groups()
+        define(item_id, f"function (element) {{\n{create}\n}}")
+        requires = list(dict.fromkeys(re.findall(r"PyReport\.payload\('([^']+)'\)", create)))
+        return f'push({{id: "{item_id}", library: "{library}", requires: {json.dumps(requires)}}});\n</script>'
+
+    def payload(match) -> str:
+        define(match[1], json.dumps({"dtype": match[2], "data": match[3]}))
+        return ""
+
+    def table(match) -> str:
+        define(match[1], match[2])
+        return ""
+
+    # Chart definitions go first: their code may name payloads, never contain their blocks
+    html = chart_block.sub(chart, html)
+    html = payload_block.sub(payload, html)
+    return table_block.sub(table, html)
+
+def dtype_class(dtype) -> str:
+    """
+    Classifies a pandas dtype as "numeric", "boolean", "datetime", "categorical" or "other".
+
+    "numeric" matches `select_dtypes(include=["number"])` and "categorical" matches
+    `select_dtypes(include=["object", "category"])` (plus pandas string dtypes).
+    """
+    if pd.api.types.is_bool_dtype(dtype):
+        return "boolean"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "numeric"
+    if pd.api.types.is_datetime64_any_dtype(dtype) or pd.api.types.is_timedelta64_dtype(dtype):
+        return "datetime"
+    if (pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype)
+            or pd.api.types.is_string_dtype(dtype)):
+        return "categorical"
+    return "other"
+
+def dataframe_fingerprint(df: pd.DataFrame) -> Tuple:
+    """
+    Structural fingerprint of a DataFrame: its shape, columns and dtypes. The content is checked
+    column by column with `column_digest`, see `ColumnProfile.refresh`.
+
+    Args:
+        df (pd.DataFrame): The DataFrame.
+
+    Returns:
+        Tuple: A hashable fingerprint.
+    """
+    return (df.shape, tuple(map(str, df.columns)), tuple(map(str, df.dtypes)))
+
+def column_hashes(column: pd.Series) -> np.ndarray:
+    """Returns the per-row content hashes of a column (its index left out)."""
+    try:
+        return pd.util.hash_pandas_object(column, index=False).to_numpy()
+    except TypeError:
+        # Unhashable cells (e.g. lists); fall back to their text representation
+        return pd.util.hash_pandas_object(column.astype(str), index=False).to_numpy()
+
+def column_digest(column: pd.Series) -> bytes:
+    """Returns a digest of the full content of a column, in row order."""
+    return hashlib.blake2b(column_hashes(column).tobytes(), digest_size=16).digest()
+
+def _merge_moments(a: Tuple[np.ndarray, ...], b: Tuple[np.ndarray, ...]) -> Tuple[np.ndarray, ...]:
+    """
+    Merges two sets of per-column central moment accumulators `(n, mean, M2, M3, M4)`
+    (pairwise update formulas of Chan et al. and Pébay).
+    """
+    na, mean_a, m2a, m3a, m4a = a
+    nb, mean_b, m2b, m3b, m4b = b
+    n = na + nb
+    with np.errstate(invalid="ignore", divide="ignore"):
+        delta = np.where(n > 0, mean_b - mean_a, 0)
+        nb_n = np.where(n > 0, nb / n, 0)
+        na_nb_n = np.where(n > 0, na * nb / n, 0)
+        mean = mean_a + delta * nb_n
+        m2 = m2a + m2b + delta ** 2 * na_nb_n
+        m3 = (m3a + m3b + delta ** 3 * na_nb_n * np.where(n > 0, (na - nb) / n, 0)
+              + 3 * delta * np.where(n > 0, (na * m2b - nb * m2a) / n, 0))
+        m4 = (m4a + m4b + delta ** 4 * na_nb_n * np.where(n > 0, (na ** 2 - na * nb + nb ** 2) / n ** 2, 0)
+              + 6 * delta ** 2 * np.where(n > 0, (na ** 2 * m2b + nb ** 2 * m2a) / n ** 2, 0)
+              + 4 * delta * np.where(n > 0, (na * m3b - nb * m3a) / n, 0))
+    return n, mean, m2, m3, m4
+
+def iter_chunks(source: Union[str, os.PathLike, Iterable[pd.DataFrame]],
+                block_rows: int = 1_000_000) -> Iterator[pd.DataFrame]:
+    """
+    Yields a data source as DataFrame chunks.
+
+    CSV files are read with `pd.read_csv(chunksize=...)` and parquet files batch by batch with
+    pyarrow (an optional dependency); any other iterable is expected to yield DataFrames already.
+
+    Args:
+        source (Union[str, os.PathLike, Iterable[pd.DataFrame]]): A CSV / parquet path or an iterable of DataFrames.
+        block_rows (int, optional): Number of rows per chunk read from a file. Defaults to 1,000,000.
+
+    Returns:
+        Iterator[pd.DataFrame]: The chunks, in order.
+
+    Raises:
+        ImportError: If `source` is a parquet file and pyarrow is not installed.
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        yield from source
+        return
+
+    path = os.fspath(source)
+    if path.lower().endswith((".parquet", ".pq")):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Reading parquet files in batches requires pyarrow") from e
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=block_rows):
+            yield batch.to_pandas()
+    else:
+        with pd.read_csv(path, chunksize=block_rows) as reader:
+            yield from reader
+
+class AdaptiveHistogram:
+    """
+    Equal-width histogram with a fixed number of bins over a stream of values whose range is not
+    known in advance.
+
+    The first values set the range; whenever later values fall outside it, adjacent pairs of bins
+    are merged (doubling the bin width) and the range is extended towards them until they fit. The
+    memory stays `n_bins` counters and the bin width stays within a factor of two of the range of the
+    values seen. Coarser histograms are read from the cumulative counts, assuming the values are
+    spread uniformly within each bin.
+
+    Args:
+        n_bins (int, optional): Number of bins (even). Defaults to 4096.
+    """
+
+    def __init__(self, n_bins: int = 4096) -> None:
+        self.n_bins = n_bins
+        self.start: Optional[float] = None
+        self.width: Optional[float] = None
+        self.counts = np.zeros(n_bins, dtype=np.int64)
+
+    @property
+    def edges(self) -> np.ndarray:
+        """Bin edges (one more than the bins)."""
+        return self.start + self.width * np.arange(self.n_bins + 1)
+
+    def _cover(self, lo: float, hi: float) -> None:
+        if self.start is None:
+            self.start = lo
+            self.width = (hi - lo) / (self.n_bins - 1) if hi > lo else max(abs(lo), 1.0) * 1e-9
+            return
+        half = self.n_bins // 2
+        while lo < self.start or hi >= self.start + self.width * self.n_bins:
+            pairs = self.counts.reshape(half, 2).sum(axis=1)
+            self.counts = np.zeros_like(self.counts)
+            if lo < self.start:
+                # Grow downwards: the current range becomes the upper half
+                self.start -= self.width * self.n_bins
+                self.counts[half:] = pairs
+            else:
+                self.counts[:half] = pairs
+            self.width *= 2
+
+    def add(self, values: np.ndarray) -> None:
+        """Counts the finite values of an array."""
+        values = values[np.isfinite(values)]
+        if not len(values):
+            return
+        self._cover(float(values.min()), float(values.max()))
+        index = np.clip(np.floor((values - self.start) / self.width), 0, self.n_bins - 1).astype(np.int64)
+        self.counts += np.bincount(index, minlength=self.n_bins)
+
+    def cumulative(self, x) -> np.ndarray:
+        """Approximate number of values below each point of `x`."""
+        if self.start is None:
+            return np.zeros(np.shape(x))
+        return np.interp(x, self.edges, np.concatenate([[0], np.cumsum(self.counts)]))
+
+    def rebin(self, edges: np.ndarray) -> np.ndarray:
+        """
+        Redistributes the counts onto coarser bins spanning the whole range of the values.
+
+        Args:
+            edges (np.ndarray): Target bin edges, from the minimum to the maximum value.
+
+        Returns:
+            np.ndarray: The integer counts of each target bin, summing to the total count.
+        """
+        at_edges = np.round(self.cumulative(edges))
+        at_edges[0], at_edges[-1] = 0, self.counts.sum()
+        return np.diff(at_edges).astype(np.int64)
+
+class KLLSketch:
+    """
+    Mergeable KLL quantile sketch (Karnin, Lang and Liberty) of a stream of values.
+
+    Values enter the first of a stack of buffers; a buffer over its capacity is sorted and every
+    other item (from a random offset) is promoted to the next buffer, where each item stands for
+    twice as many values. Capacities shrink geometrically (by 2/3) from the top buffer down, so the
+    sketch keeps O(k) items whatever the number of values, updates take one pass over the values,
+    and two sketches merge by concatenating their buffers level by level.
+
+    Args:
+        accuracy (float, optional): Target normalized rank error of the quantiles (about 99%
+            confidence); the top buffer capacity is `k = ceil(2.5 / accuracy)`. Defaults to 0.01.
+        seed (int, optional): Seed of the compaction offsets. Defaults to 0.
+    """
+
+    def __init__(self, accuracy: float = 0.01, seed: int = 0) -> None:
+        if not 0 < accuracy < 1:
+            raise ValueError(f"accuracy must be between 0 and 1, got {accuracy!r}")
+        self.accuracy = accuracy
+        self.k = max(8, int(np.ceil(2.5 / accuracy)))
+        self.count = 0
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        return max(2, int(np.ceil(self.k * (2 / 3) ** (len(self.levels) - level - 1))))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays at this level
+                odd = len(items) % 2
+                promoted = items[odd:][self._rng.integers(2)::2]
+                self.levels[level] = items[:odd]
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def update(self, values: np.ndarray) -> None:
+        """Adds the non-missing values of an array."""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        self.count += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """
+        Merges another sketch (of other values, e.g. another chunk or worker) into this one.
+
+        Returns:
+            KLLSketch: This sketch.
+        """
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q) -> np.ndarray:
+        """Approximate quantiles at the levels `q` (NaN for an empty sketch)."""
+        if not self.count:
+            return np.full(np.shape(q), np.nan)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2.0 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items, cumulative = items[order], np.cumsum(weights[order])
+        index = np.searchsorted(cumulative, np.asarray(q, dtype=float) * cumulative[-1])
+        return items[np.minimum(index, len(items) - 1)]
+
+class SpaceSaving:
+    """
+    Mergeable Space-Saving summary of the most frequent values of a stream (Metwally et al.).
+
+    At most `capacity` values are tracked, each with an estimated count that never underestimates
+    the true count by more than its `errors` entry. Any untracked value occurred at most `floor`
+    times, and `floor` stays below `total / capacity`. Values arrive in batches: each batch is
+    counted exactly and merged, so memory is bounded by the capacity plus the distinct values of
+    one batch. Two summaries merge the same way (Agarwal et al., "Mergeable summaries").
+
+    Args:
+        capacity (int, optional): Number of tracked values. Defaults to 1000.
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        self.capacity = capacity
+        self.counts = pd.Series(dtype="int64")
+        self.errors = pd.Series(dtype="int64")
+        self.floor = 0
+        self.total = 0
+
+    def _merge(self, counts: pd.Series, errors: pd.Series, floor: int, total: int) -> None:
+        # A value missing from one side occurred at most that side's floor times there
+        index = self.counts.index.union(counts.index)
+        merged = self.counts.reindex(index).fillna(self.floor) + counts.reindex(index).fillna(floor)
+        merged_errors = self.errors.reindex(index).fillna(self.floor) + errors.reindex(index).fillna(floor)
+        merged = merged.astype("int64").sort_values(ascending=False, kind="stable")
+
+        dropped = merged.iloc[self.capacity:]
+        self.counts = merged.iloc[:self.capacity]
+        self.errors = merged_errors[self.counts.index].astype("int64")
+        self.floor = max(self.floor + floor, int(dropped.max()) if len(dropped) else 0)
+        self.total += total
+
+    def update(self, values: pd.Series) -> None:
+        """Adds the non-missing values of a batch."""
+        counts = values.value_counts()
+        self._merge(counts, pd.Series(0, index=counts.index, dtype="int64"), 0, int(counts.sum()))
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """
+        Merges another summary (of other values, e.g. another chunk or worker) into this one.
+
+        Returns:
+            SpaceSaving: This summary.
+        """
+        self._merge(other.counts, other.errors, other.floor, other.total)
+        return self
+
+class ColumnProfile:
+    """
+    Column statistics of a DataFrame, computed once and shared by all plotting methods.
+
+    The constructor only classifies the columns of a DataFrame; every statistic is computed on
+    first request for the requested columns and cached per column, so a chart of a few columns
+    (or of the categorical ones only) does not pay for scanning the others. `stats` scans columns
+    in a single blockwise pass for null counts, min/max (also of the finite values alone) and the
+    first four central moments; `quartiles` computes them exactly or, with `quantile_accuracy`,
+    from a `KLLSketch` per column updated block by block (O(sketch size) memory instead of a sorted
+    copy). Derived aggregates (histogram bins, box statistics, densities, heavy hitters) are cached
+    per column and parameter set in the same way, so several charts of the same data do not repeat
+    the work. The attributes `count`, `min`, `max`, `mean`, `std`, `quantiles`, ... cover all
+    numeric columns.
+
+    The data may also be an iterable of DataFrame chunks or the path of a CSV or parquet file
+    (see `iter_chunks`), which is profiled up front in one pass with bounded memory: besides the moments,
+    every chunk is merged into a `KLLSketch`, an `AdaptiveHistogram`, the `tail_size` lowest and
+    highest values of each numeric column and a `SpaceSaving` summary of the `category_capacity`
+    most frequent values of each categorical column.
+    Quartiles, bins, densities and box statistics are then derived from these aggregates, and `df`
+    is None.
+
+    A `Report` keeps its profiles keyed by DataFrame identity and `dataframe_fingerprint`, see
+    `Report.profile`. The content of every column with cached results is recorded by its
+    `column_digest`, so `refresh` can drop the results of columns edited in place.
+
+    Args:
+        df (DataSource): The DataFrame, DataFrame chunks or CSV / parquet path to profile.
+        columns (Optional[List[str]], optional): Columns to profile. Defaults to all columns.
+        block_rows (int, optional): Number of rows converted to a float block (or read from a file) at a time.
+            Defaults to 1,000,000.
+        quantile_accuracy (Optional[float], optional): Rank error bound of approximate quartiles; None
+            computes exact quartiles of a DataFrame and uses `default_quantile_accuracy` for chunked
+            data. Defaults to None.
+
+    Raises:
+        ValueError: If a chunked source yields no chunks.
+    """
+
+    quantile_levels = (0.25, 0.5, 0.75)
+    stat_names = ("count", "null_count", "min", "max", "finite_min", "finite_max", "mean", "std",
+                  "skew", "kurtosis")
+    default_quantile_accuracy = 0.01
+    # Resolution of the histograms and number of extreme values kept per column for chunked data
+    histogram_bins = 4096
+    tail_size = 256
+    # Number of values tracked by the heavy-hitter summaries
+    category_capacity = 1000
+
+    def __init__(self, df: DataSource, columns: Optional[List[str]] = None,
+                 block_rows: int = 1_000_000, quantile_accuracy: Optional[float] = None) -> None:
+        streaming = not isinstance(df, pd.DataFrame)
+        self.df = None if streaming else df
+        self.source = df
+        self.block_rows = block_rows
+        if streaming and quantile_accuracy is None:
+            quantile_accuracy = self.default_quantile_accuracy
+        self.quantile_accuracy = quantile_accuracy
+        if streaming:
+            chunks = iter_chunks(df, block_rows)
+            first = next(chunks, None)
+            if first is None:
+                raise ValueError("the data source yielded no chunks")
+            chunks = itertools.chain([first], chunks)
+        else:
+            first = df
+
+        self.columns = list(first.columns) if columns is None else list(columns)
+        self.dtype_classes = {col: dtype_class(first[col].dtype) for col in self.columns}
+        self.numeric_columns = [col for col in self.columns if self.dtype_classes[col] == "numeric"]
+        self.categorical_columns = [col for col in self.columns if self.dtype_classes[col] == "categorical"]
+        self._cache: Dict[tuple, dict] = {}
+        self._value_counts: Dict[str, pd.Series] = {}
+        self._digests: Dict[str, bytes] = {}
+        self._heavy_hitters = ({col: SpaceSaving(self.category_capacity) for col in self.categorical_columns}
+                               if streaming else {})
+        self.histograms = ({col: AdaptiveHistogram(self.histogram_bins) for col in self.numeric_columns}
+                           if streaming else None)
+        self.tails = {col: (np.empty(0), np.empty(0)) for col in self.numeric_columns} if streaming else None
+        self.sketches: Optional[Dict[str, KLLSketch]] = {} if quantile_accuracy is not None else None
+
+        if not streaming:
+            self.rows = len(df)
+            return
+        # Chunks are read once, so everything is collected in this pass
+        self.rows = 0
+        self.sketches.update({col: KLLSketch(quantile_accuracy) for col in self.numeric_columns})
+        self._cache[("stats",)] = self._scan(chunks, self.columns, streaming=True)
+        levels = list(self.quantile_levels)
+        self._cache[("quartiles",)] = {col: self.sketches[col].quantile(levels) for col in self.numeric_columns}
+
+    def _scan(self, chunks: Iterable[pd.DataFrame], columns: List[str], streaming: bool = False) -> Dict[str, dict]:
+        """
+        Scans the given columns of the chunks in one pass: null counts of every column, and counts,
+        min/max (also of the finite values alone) and the first four central moments of the
+        numeric ones. Chunked data is also merged into the sketches, histograms, tails and
+        heavy-hitter summaries.
+        """
+        numeric = [col for col in columns if self.dtype_classes[col] == "numeric"]
+        other = [col for col in columns if col not in numeric]
+        k = len(numeric)
+        minimums, maximums = np.full(k, np.inf), np.full(k, -np.inf)
+        finite_minimums, finite_maximums = np.full(k, np.inf), np.full(k, -np.inf)
+        moments = tuple(np.zeros(k) for _ in range(5))
+        null_count = dict.fromkeys(other, 0)
+        rows = 0
+        for chunk in chunks:
+            rows += len(chunk)
+            block = chunk[numeric].to_numpy(dtype=np.float64, na_value=np.nan)
+            missing = np.isnan(block)
+            minimums = np.minimum(minimums, np.where(missing, np.inf, block).min(axis=0, initial=np.inf))
+            maximums = np.maximum(maximums, np.where(missing, -np.inf, block).max(axis=0, initial=-np.inf))
+            finite = np.isfinite(block)
+            finite_minimums = np.minimum(finite_minimums, np.where(finite, block, np.inf).min(axis=0, initial=np.inf))
+            finite_maximums = np.maximum(finite_maximums, np.where(finite, block, -np.inf).max(axis=0, initial=-np.inf))
+
+            n = (~missing).sum(axis=0).astype(float)
+            with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+                mean = np.where(n > 0, np.where(missing, 0, block).sum(axis=0) / n, 0)
+                deviations = np.where(missing, 0, block - mean)
+                block_moments = (n, mean, (deviations ** 2).sum(axis=0),
+                                 (deviations ** 3).sum(axis=0), (deviations ** 4).sum(axis=0))
+            moments = _merge_moments(moments, block_moments)
+
+            for col in other:
+                null_count[col] += int(chunk[col].isna().sum())
+            if streaming:
+                for j, col in enumerate(numeric):
+                    self.sketches[col].update(block[~missing[:, j], j])
+                self._merge_chunk(chunk, block, missing)
+        if streaming:
+            self.rows = rows
+
+        counts = moments[0].astype(np.int64)
+        present = counts > 0
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            std = np.where(counts > 1, np.sqrt(moments[2] / (counts - 1)), np.nan)
+            skew = np.where(moments[2] > 0, np.sqrt(counts) * moments[3] / moments[2] ** 1.5, np.nan)
+            kurtosis = np.where(moments[2] > 0, counts * moments[4] / moments[2] ** 2 - 3, np.nan)
+        stats = {col: dict(count=rows - null_count[col], null_count=null_count[col]) for col in other}
+        for j, col in enumerate(numeric):
+            stats[col] = dict(count=int(counts[j]), null_count=rows - int(counts[j]),
+                              min=minimums[j] if present[j] else np.nan,
+                              max=maximums[j] if present[j] else np.nan,
+                              # Range of the finite values, NaN for columns without any
+                              finite_min=finite_minimums[j] if np.isfinite(finite_minimums[j]) else np.nan,
+                              finite_max=finite_maximums[j] if np.isfinite(finite_maximums[j]) else np.nan,
+                              mean=moments[1][j] if present[j] else np.nan,
+                              std=std[j], skew=skew[j], kurtosis=kurtosis[j])
+        return stats
+
+    def stats(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Returns the scanned statistics of some columns, scanning the columns not seen yet in one
+        blockwise pass.
+
+        Args:
+            columns (Optional[List[str]], optional): Profiled columns. Defaults to all of them.
+
+        Returns:
+            pd.DataFrame: One row per column and the columns `stat_names` (NaN but the counts for
+            non-numeric columns).
+        """
+        columns = self.columns if columns is None else list(columns)
+
+        def compute(missing):
+            chunks = (self.df[missing].iloc[start:start + self.block_rows]
+                      for start in range(0, self.rows, self.block_rows))
+            return self._scan(chunks, missing)
+        stats = self._cached("stats", (), columns, compute)
+        table = pd.DataFrame([stats[col] for col in columns], index=columns, columns=list(self.stat_names))
+        return table.astype({"count": "int64", "null_count": "int64"})
+
+    def quartiles(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Returns the quartiles of some numeric columns (one row per level of `quantile_levels`),
+        computing the columns not seen yet exactly or, with `quantile_accuracy`, from a
+        `KLLSketch` per column updated block by block.
+        """
+        levels = list(self.quantile_levels)
+
+        def compute(missing):
+            if self.sketches is None:
+                quantiles = self.df[missing].quantile(levels)
+                return {col: quantiles[col].to_numpy(dtype=float) for col in missing}
+            for col in missing:
+                self.sketches[col] = KLLSketch(self.quantile_accuracy)
+                for start in range(0, self.rows, self.block_rows):
+                    values = self.df[col].iloc[start:start + self.block_rows].to_numpy(dtype=np.float64,
+                                                                                       na_value=np.nan)
+                    self.sketches[col].update(values[~np.isnan(values)])
+            return {col: self.sketches[col].quantile(levels) for col in missing}
+        quartiles = self._cached("quartiles", (), self._numeric(columns), compute)
+        return pd.DataFrame(quartiles, index=levels, columns=list(quartiles))
+
+    def _merge_chunk(self, chunk: pd.DataFrame, block: np.ndarray, missing: np.ndarray) -> None:
+        """Merges one chunk into the histograms, tails and heavy-hitter summaries of chunked data."""
+        for j, col in enumerate(self.numeric_columns):
+            values = block[~missing[:, j], j]
+            self.histograms[col].add(values)
+            low, high = self.tails[col]
+            low, high = np.concatenate([low, values]), np.concatenate([high, values])
+            if len(low) > self.tail_size:
+                low = np.partition(low, self.tail_size - 1)[:self.tail_size]
+                high = np.partition(high, len(high) - self.tail_size)[-self.tail_size:]
+            self.tails[col] = (low, high)
+
+        for col in self.categorical_columns:
+            self._heavy_hitters[col].update(chunk[col])
+
+    def _statistic(name: str, doc: str) -> property:
+        return property(lambda self: self.stats(self.numeric_columns)[name], doc=doc)
+
+    count = _statistic("count", "Number of non-missing values of each numeric column.")
+    min = _statistic("min", "Minimum of each numeric column.")
+    max = _statistic("max", "Maximum of each numeric column.")
+    finite_min = _statistic("finite_min", "Minimum of the finite values of each numeric column (NaN without any).")
+    finite_max = _statistic("finite_max", "Maximum of the finite values of each numeric column (NaN without any).")
+    mean = _statistic("mean", "Mean of each numeric column.")
+    std = _statistic("std", "Sample standard deviation of each numeric column.")
+    skew = _statistic("skew", "Skewness of each numeric column.")
+    kurtosis = _statistic("kurtosis", "Excess kurtosis of each numeric column.")
+    del _statistic
+
+    @property
+    def null_count(self) -> pd.Series:
+        """Number of missing values of each profiled column."""
+        return self.stats()["null_count"]
+
+    @property
+    def quantiles(self) -> pd.DataFrame:
+        """Quartiles of each numeric column, one row per level of `quantile_levels`."""
+        return self.quartiles()
+
+    @property
+    def iqr(self) -> pd.Series:
+        """Interquartile range of each numeric column."""
+        return self.quantiles.loc[0.75] - self.quantiles.loc[0.25]
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Returns the per-column statistics as a DataFrame (one row per profiled column).
+        """
+        stats = self.stats()
+        quartiles = self.quantiles
+        numeric = stats.loc[self.numeric_columns, ["count", "mean", "std", "min"]].assign(
+            **{"25%": quartiles.loc[0.25], "50%": quartiles.loc[0.5], "75%": quartiles.loc[0.75]})
+        numeric = numeric.join(stats.loc[self.numeric_columns, ["max", "skew", "kurtosis"]])
+        summary = pd.DataFrame({"dtype_class": pd.Series(self.dtype_classes),
+                                "null_count": stats["null_count"]})
+        return summary.join(numeric).loc[self.columns]
+
+    def quantiles_within(self, accuracy: Optional[float]) -> bool:
+        """
+        Whether the quartiles are at least as accurate as `accuracy` asks (None asks for exact
+        quartiles, or the default sketch accuracy for chunked data).
+        """
+        if self.quantile_accuracy is None:
+            return True
+        if accuracy is None:
+            return self.df is None and self.quantile_accuracy <= self.default_quantile_accuracy
+        return self.quantile_accuracy <= accuracy
+
+    def value_counts(self, col: str) -> pd.Series:
+        """
+        Returns the number of occurrences of each value of a column, most frequent first.
+
+        Raises:
+            ValueError: If the data is chunked; use `heavy_hitters` instead.
+        """
+        if self.df is None:
+            raise ValueError("exact value counts are not kept for chunked data, use heavy_hitters()")
+        if col not in self._value_counts:
+            self._track([col])
+            self._value_counts[col] = self.df[col].value_counts()
+        return self._value_counts[col]
+
+    def heavy_hitters(self, col: str, capacity: Optional[int] = None) -> SpaceSaving:
+        """
+        Returns a `SpaceSaving` summary of the most frequent values of a column.
+
+        A DataFrame column is summarized block by block on first request per capacity; chunked data
+        has the summaries collected while it was read.
+
+        Args:
+            col (str): The column.
+            capacity (Optional[int], optional): Number of tracked values. Defaults to `category_capacity`.
+
+        Raises:
+            ValueError: If the data is chunked and `col` is not a categorical column.
+        """
+        if self.df is None:
+            if col not in self._heavy_hitters:
+                raise ValueError(f"heavy hitters of chunked data are only kept for categorical columns, not {col!r}")
+            return self._heavy_hitters[col]
+
+        def compute(missing):
+            summaries = {}
+            for name in missing:
+                summaries[name] = SpaceSaving(capacity or self.category_capacity)
+                for start in range(0, self.rows, self.block_rows):
+                    summaries[name].update(self.df[name].iloc[start:start + self.block_rows])
+            return summaries
+        return self._cached("heavy_hitters", (capacity or self.category_capacity,), [col], compute)[col]
+
+    def correlation(self, columns: Optional[List[str]] = None, method: str = "pearson",
+                    dtype: str = "float32") -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Cached `correlation_matrix` (correlations and pairwise counts) of the profiled numeric columns.
+
+        Raises:
+            ValueError: If the data is chunked.
+        """
+        if self.df is None:
+            raise ValueError("correlations need the data as a DataFrame, not chunks")
+        columns = self._numeric(columns)
+        key = ("correlation", method, dtype, tuple(columns))
+        if key not in self._cache:
+            self._track(columns)
+            self._cache[key] = dict(zip(("corr", "counts"), correlation_matrix(
+                self.df, columns, method=method, dtype=dtype, profile=self)))
+        return self._cache[key]["corr"], self._cache[key]["counts"]
+
+    def _cached(self, name: str, params: tuple, columns: List[str], compute) -> dict:
+        """
+        Returns `{column: result}` for the requested columns, calling `compute(missing_columns)`
+        once for the columns not computed yet with these parameters.
+        """
+        cache = self._cache.setdefault((name,) + params, {})
+        missing = [col for col in columns if col not in cache]
+        if missing:
+            self._track(missing)
+            with telemetry_phase(f"profile.{name}", columns=len(missing)):
+                cache.update(compute(missing))
+        return {col: cache[col] for col in columns if col in cache}
+
+    def _track(self, columns: List[str]) -> None:
+        """Records the content digest of the DataFrame columns whose results are about to be cached."""
+        if self.df is not None:
+            for col in columns:
+                if col not in self._digests:
+                    self._digests[col] = column_digest(self.df[col])
+
+    def refresh(self) -> List[str]:
+        """
+        Drops the cached results of the DataFrame columns whose content changed since they were
+        computed, so they are computed again on next request.
+
+        Returns:
+            List[str]: The changed columns.
+        """
+        if self.df is None:
+            return []
+        changed = [col for col, digest in self._digests.items() if column_digest(self.df[col]) != digest]
+        if not changed:
+            return []
+        for key in list(self._cache):
+            if key[0] == "correlation":
+                if set(key[3]) & set(changed):
+                    del self._cache[key]
+            else:
+                for col in changed:
+                    self._cache[key].pop(col, None)
+        for col in changed:
+            del self._digests[col]
+            self._value_counts.pop(col, None)
+            if self.sketches is not None:
+                self.sketches.pop(col, None)
+        return changed
+
+    def _numeric(self, columns: Optional[List[str]]) -> List[str]:
+        if columns is None:
+            return self.numeric_columns
+        return [col for col in columns if self.dtype_classes.get(col) == "numeric"]
+
+    def bins(self, columns: Optional[List[str]] = None, bins: Optional[int] = None,
+             bin_step: Optional[float] = None, rule: str = "fd",
+             max_bins: int = 200) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Cached `bin_numeric_columns` for the profiled data."""
+        def compute(missing):
+            if self.df is not None:
+                return bin_numeric_columns(self.df, missing, bins=bins, bin_step=bin_step,
+                                           rule=rule, max_bins=max_bins, profile=self)
+            edges = histogram_edges(self, missing, bins=bins, bin_step=bin_step, rule=rule, max_bins=max_bins)
+            return {col: (edges[col], self.histograms[col].rebin(edges[col])) for col in edges}
+        return self._cached("bins", (bins, bin_step, rule, max_bins), self._numeric(columns), compute)
+
+    def kde(self, columns: Optional[List[str]] = None, grid_size: int = 256,
+            bandwidth: Union[str, float] = "scott", cut: float = 3) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Cached `kde_numeric_columns` for the profiled data."""
+        return self._cached("kde", (grid_size, bandwidth, cut), self._numeric(columns),
+                            lambda missing: kde_numeric_columns(self.df, missing, grid_size=grid_size,
+                                                                bandwidth=bandwidth, cut=cut, profile=self))
+
+    def box_stats(self, columns: Optional[List[str]] = None, whisker: float = 1.5,
+                  max_outliers: int = 200) -> Dict[str, dict]:
+        """Cached `box_stats_numeric_columns` for the profiled data."""
+        def compute(missing):
+            if self.df is not None:
+                return box_stats_numeric_columns(self.df, missing, whisker=whisker,
+                                                 max_outliers=max_outliers, profile=self)
+            return self._tail_box_stats(missing, whisker, max_outliers)
+        return self._cached("box_stats", (whisker, max_outliers), self._numeric(columns), compute)
+
+    def _tail_box_stats(self, columns: List[str], whisker: float, max_outliers: int,
+                        seed: int = 0) -> Dict[str, dict]:
+        """
+        Box statistics of chunked data, in the format of `box_stats_numeric_columns`.
+
+        Whisker ends and outlier counts are exact when the kept tails reach past the fences, and
+        read from the histogram otherwise. Outliers are sampled from the tails, always keeping the
+        minimum and the maximum.
+        """
+        rng = np.random.default_rng(seed)
+        stats = {}
+        for col in columns:
+            count = int(self.count[col])
+            if count == 0:
+                continue
+            q1, median, q3 = self.quantiles[col].to_numpy(dtype=float)
+            low_limit = q1 - whisker * (q3 - q1)
+            high_limit = q3 + whisker * (q3 - q1)
+            histogram = self.histograms[col]
+            edges, nonempty = histogram.edges, np.flatnonzero(histogram.counts)
+            low, high = np.sort(self.tails[col][0]), np.sort(self.tails[col][1])
+            # With at most `tail_size` values, each tail holds all of them
+            complete = count <= self.tail_size
+
+            inside = low[low >= low_limit]
+            if len(inside):
+                lowerfence = inside[0]
+            else:
+                first_bin = nonempty[edges[nonempty + 1] > low_limit][0]
+                lowerfence = min(max(edges[first_bin], low_limit), q1)
+            inside = high[high <= high_limit]
+            if len(inside):
+                upperfence = inside[-1]
+            else:
+                last_bin = nonempty[edges[nonempty] < high_limit][-1]
+                upperfence = max(min(edges[last_bin + 1], high_limit), q3)
+
+            low_outliers, high_outliers = low[low < low_limit], high[high > high_limit]
+            n_low = (len(low_outliers) if complete or len(low_outliers) < len(low)
+                     else int(round(float(histogram.cumulative(low_limit)))))
+            n_high = (len(high_outliers) if complete or len(high_outliers) < len(high)
+                      else count - int(round(float(histogram.cumulative(high_limit)))))
+
+            outliers = np.concatenate([low_outliers, high_outliers])
+            if len(outliers) > max_outliers:
+                outliers = rng.choice(outliers, max_outliers, replace=False)
+            if len(outliers):
+                # The extremes are always shown so the axis range stays faithful
+                extremes = [v for v in (self.min[col], self.max[col]) if v < low_limit or v > high_limit]
+                outliers = np.unique(np.concatenate([outliers, extremes]))
+            stats[col] = dict(count=count, mean=float(self.mean[col]), min=float(self.min[col]),
+                              q1=q1, median=median, q3=q3, max=float(self.max[col]),
+                              lowerfence=float(lowerfence), upperfence=float(upperfence),
+                              outliers=np.sort(outliers), n_outliers=n_low + n_high)
+        return stats
+
+def histogram_bin_counts(n: int, value_range: float, iqr: float, rule: str = "fd",
+                         max_bins: int = 200) -> int:
+    """
+    Number of histogram bins given by a binning rule.
+
+    Args:
+        n (int): Number of non-missing values.
+        value_range (float): Max minus min of the values.
+        iqr (float): Interquartile range of the values (used by the Freedman–Diaconis rule).
+        rule (str, optional): "fd" (Freedman–Diaconis) or "sturges". Defaults to "fd".
+        max_bins (int, optional): Upper bound on the number of bins. Defaults to 200.
+
+    Returns:
+        int: The number of bins (at least 1).
+    """
+    if rule not in ("fd", "sturges"):
+        raise ValueError(f"bin rule must be 'fd' or 'sturges', got {rule!r}")
+    if n < 2 or value_range <= 0:
+        return 1
+    sturges = int(np.ceil(np.log2(n))) + 1
+    if rule == "sturges" or not 0 < iqr < np.inf:
+        return min(sturges, max_bins)
+    width = 2 * iqr / np.cbrt(n)
+    return int(np.clip(np.ceil(value_range / width), 1, max_bins))
+
+def histogram_edges(profile: ColumnProfile, columns: Optional[List[str]] = None,
+                    bins: Optional[int] = None, bin_step: Optional[float] = None,
+                    rule: str = "fd", max_bins: int = 200) -> Dict[str, np.ndarray]:
+    """
+    Histogram bin edges of several numeric columns from their profile, as used by `bin_numeric_columns`.
+
+    Args:
+        profile (ColumnProfile): Statistics of the data.
+        columns (Optional[List[str]], optional): Columns to bin. Defaults to all numeric columns.
+        bins (Optional[int], optional): Fixed number of bins per column. Defaults to None.
+        bin_step (Optional[float], optional): Fixed bin width; edges are aligned to multiples of it.
+            Takes precedence over `bins`. A column that would need more than `max_bins` bins gets the
+            smallest multiple of `bin_step` that fits. Defaults to None.
+        rule (str, optional): Rule used when neither `bins` nor `bin_step` is given, "fd"
+            (Freedman–Diaconis) or "sturges". Defaults to "fd".
+        max_bins (int, optional): Upper bound on the number of bins per column given by `bin_step`
+            or `rule`. Defaults to 200.
+
+    Returns:
+        Dict[str, np.ndarray]: Maps each column with at least one finite value to its bin edges,
+        which span the finite values (infinities are left out like missing values).
+    """
+    columns = profile._numeric(columns)
+    stats = profile.stats(columns)
+    counts_non_null = stats["count"]
+    minimums = stats["finite_min"]
+    maximums = stats["finite_max"]
+    quartiles = profile.quartiles(columns)
+    iqrs = quartiles.loc[0.75] - quartiles.loc[0.25]
+
+    edges = {}
+    for col in columns:
+        if counts_non_null[col] == 0 or np.isnan(minimums[col]):
+            continue
+        lo, hi = float(minimums[col]), float(maximums[col])
+        if bin_step:
+            # Too fine a step for the range becomes the smallest multiple of bin_step that fits
+            multiple = max(int(np.ceil((hi - lo) / bin_step / max_bins)), 1)
+            while True:
+                step = bin_step * multiple
+                start = np.floor(lo / step) * step
+                n_bins = max(int(np.ceil((hi - start) / step)), 1)
+                if start + n_bins * step <= hi:
+                    n_bins += 1
+                # Edges aligned to the step always fit the values in two bins
+                if n_bins <= max(max_bins, 2):
+                    break
+                multiple += 1
+            edges[col] = start + step * np.arange(n_bins + 1)
+            continue
+        if hi == lo:
+            lo, hi = lo - 0.5, hi + 0.5
+        n_bins = bins or histogram_bin_counts(int(counts_non_null[col]), hi - lo,
+                                              float(iqrs[col]), rule=rule, max_bins=max_bins)
+        edges[col] = np.linspace(lo, hi, n_bins + 1)
+
+    return edges
+
+def bin_numeric_columns(df: pd.DataFrame, columns: Optional[List[str]] = None,
+                        bins: Optional[int] = None, bin_step: Optional[float] = None,
+                        rule: str = "fd", max_bins: int = 200, block_rows: int = 1_000_000,
+                        profile: Optional[ColumnProfile] = None) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Computes histogram bin edges and counts for several numeric columns in NumPy.
+
+    Bin edges are derived from a fixed number of `bins`, a fixed `bin_step` or a binning `rule`.
+    Counting is done for all columns at once: rows are processed in blocks, every value is mapped
+    to a global bin index (column offset + bin) and a single `np.bincount` per block counts them,
+    so memory stays bounded by `block_rows` and the result size does not depend on the row count.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        columns (Optional[List[str]], optional): Columns to bin. Defaults to all numeric columns.
+        bins (Optional[int], optional): Fixed number of bins per column. Defaults to None.
+        bin_step (Optional[float], optional): Fixed bin width; edges are aligned to multiples of it.
+            Takes precedence over `bins`; widened to a multiple of it past `max_bins`. Defaults to None.
+        rule (str, optional): Rule used when neither `bins` nor `bin_step` is given, "fd"
+            (Freedman–Diaconis) or "sturges". Defaults to "fd".
+        max_bins (int, optional): Upper bound on the number of bins per column given by `bin_step`
+            or `rule`. Defaults to 200.
+        block_rows (int, optional): Number of rows converted to a float block at a time. Defaults to 1,000,000.
+        profile (Optional[ColumnProfile], optional): Precomputed statistics of `df` to reuse. Defaults to None.
+
+    Returns:
+        Dict[str, Tuple[np.ndarray, np.ndarray]]: Maps each column with at least one finite value to
+        its `(edges, counts)`, with `len(edges) == len(counts) + 1`. Infinities are not counted.
+    """
+    if profile is None:
+        profile = ColumnProfile(df, columns)
+    edges = histogram_edges(profile, columns, bins=bins, bin_step=bin_step, rule=rule, max_bins=max_bins)
+
+    binned = list(edges)
+    if not binned:
+        return {}
+
+    n_bins = np.array([len(edges[col]) - 1 for col in binned])
+    offsets = np.concatenate([[0], np.cumsum(n_bins)[:-1]])
+    starts = np.array([edges[col][0] for col in binned])
+    widths = np.array([edges[col][1] - edges[col][0] for col in binned])
+
+    counts = np.zeros(int(n_bins.sum()), dtype=np.int64)
+    for start in range(0, len(df), block_rows):
+        block = df[binned].iloc[start:start + block_rows].to_numpy(dtype=np.float64, na_value=np.nan)
+        index = np.floor((block - starts) / widths)
+        valid = np.isfinite(index)
+        # The maximum falls on the last edge and belongs to the last bin
+        index = np.clip(np.nan_to_num(index), 0, n_bins - 1).astype(np.int64) + offsets
+        counts += np.bincount(index[valid], minlength=len(counts))
+
+    return {col: (edges[col], counts[offsets[i]:offsets[i] + n_bins[i]])
+            for i, col in enumerate(binned)}
+
+def binned_bar_trace(edges: np.ndarray, counts: np.ndarray, name: str = "") -> go.Bar:
+    """
+    Builds a Plotly bar trace drawing precomputed histogram bins.
+
+    Args:
+        edges (np.ndarray): Bin edges (one more than the counts).
+        counts (np.ndarray): Bin counts.
+        name (str, optional): Trace name. Defaults to "".
+
+    Returns:
+        go.Bar: Bars spanning each bin, with the bin range and count in the hover label.
+    """
+    import plotly.graph_objects as go
+    edges = np.asarray(edges, dtype=float)
+    return go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges), name=name,
+                  customdata=np.column_stack([edges[:-1], edges[1:]]),
+                  hovertemplate="%{customdata[0]:.4g} to %{customdata[1]:.4g}<br>Count: %{y}<extra></extra>")
+
+def kde_bandwidth(n: int, std: float, iqr: float, rule: Union[str, float] = "scott") -> float:
+    """
+    Gaussian kernel bandwidth from a rule of thumb.
+
+    Args:
+        n (int): Number of non-missing values.
+        std (float): Standard deviation of the values.
+        iqr (float): Interquartile range of the values.
+        rule (Union[str, float], optional): "scott" (1.06·σ·n^-1/5, Vega's default), "silverman"
+            (0.9·min(σ, IQR/1.34)·n^-1/5) or a fixed bandwidth. Defaults to "scott".
+
+    Returns:
+        float: The bandwidth.
+    """
+    if not isinstance(rule, str):
+        return float(rule)
+    if rule not in ("scott", "silverman"):
+        raise ValueError(f"bandwidth rule must be 'scott', 'silverman' or a number, got {rule!r}")
+    spread = std
+    if rule == "silverman" and iqr > 0:
+        spread = min(std, iqr / 1.34)
+    return (1.06 if rule == "scott" else 0.9) * spread * n ** (-1 / 5)
+
+def kde_numeric_columns(df: Optional[pd.DataFrame], columns: Optional[List[str]] = None,
+                        grid_size: int = 256, bandwidth: Union[str, float] = "scott",
+                        cut: float = 3, block_rows: int = 1_000_000,
+                        profile: Optional[ColumnProfile] = None) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Estimates Gaussian kernel densities of several numeric columns on fixed grids.
+
+    The values are linearly binned onto an evenly spaced grid per column (all columns counted with
+    one weighted `np.bincount` per block of rows), then the binned counts of every column are
+    convolved with their Gaussian kernels in a single batched FFT. The cost is one pass over the
+    data plus O(grid_size · log grid_size) per column, and only the grid points are returned.
+    For a `profile` of chunked data, the bins of its histograms are binned instead of the rows.
+
+    Args:
+        df (Optional[pd.DataFrame]): The input DataFrame; None with a `profile` of chunked data.
+        columns (Optional[List[str]], optional): Columns to estimate. Defaults to all numeric columns.
+        grid_size (int, optional): Number of evaluation points per column. Defaults to 256.
+        bandwidth (Union[str, float], optional): Bandwidth rule ("scott" or "silverman") or a fixed
+            bandwidth. Defaults to "scott".
+        cut (float, optional): How many bandwidths the grid extends beyond the data range. Defaults to 3.
+        block_rows (int, optional): Number of rows converted to a float block at a time. Defaults to 1,000,000.
+        profile (Optional[ColumnProfile], optional): Precomputed statistics of `df` to reuse. Defaults to None.
+
+    Returns:
+        Dict[str, Tuple[np.ndarray, np.ndarray]]: Maps each column with at least one finite value to
+        its `(x, density)` curve, over the range of its finite values. Columns whose grid would
+        overflow (a span near the float limits) are left out.
+    """
+    if profile is None:
+        profile = ColumnProfile(df, columns)
+    stats = profile.stats(profile._numeric(columns))
+    columns = list(stats.index[stats["count"] > 0])
+    if not columns:
+        return {}
+    stats = stats.loc[columns]
+
+    minimums = stats["finite_min"].to_numpy(dtype=float)
+    maximums = stats["finite_max"].to_numpy(dtype=float)
+    quartiles = profile.quartiles(columns)
+    iqrs = (quartiles.loc[0.75] - quartiles.loc[0.25]).to_numpy(dtype=float)
+    # Infinite values (or moments that overflowed) leave the spread to the IQR, or to the range
+    stds = stats["std"].to_numpy(dtype=float)
+    with np.errstate(over="ignore", invalid="ignore"):
+        stds = np.select([np.isfinite(stds), np.isfinite(iqrs)],
+                         [stds, iqrs / 1.34], np.nan_to_num((maximums - minimums) / 4, posinf=0))
+
+    n = stats["count"].to_numpy(dtype=float)
+    bws = np.array([kde_bandwidth(int(n[i]), stds[i], iqrs[i], rule=bandwidth)
+                    for i in range(len(columns))])
+    # Degenerate (constant) columns still get a visible bump
+    bws = np.where(bws > 0, bws, np.maximum(np.abs(minimums), 1) * 1e-3)
+
+    # Constant columns need some padding even with cut=0
+    with np.errstate(over="ignore", invalid="ignore"):
+        pad = np.where(maximums > minimums, cut, max(cut, 1)) * bws
+        lows = minimums - pad
+        deltas = (maximums + pad - lows) / (grid_size - 1)
+    # Columns without finite values, or whose grid does not fit in floats, are left out
+    fits = np.isfinite(lows) & np.isfinite(deltas) & (deltas > 0) & np.isfinite(bws)
+    if not fits.all():
+        columns = [col for col, fit in zip(columns, fits) if fit]
+        if not columns:
+            return {}
+        n, bws, lows, deltas = n[fits], bws[fits], lows[fits], deltas[fits]
+
+    # Linear binning: each value splits its weight between the two nearest grid points
+    offsets = np.arange(len(columns)) * grid_size
+    binned = np.zeros(len(columns) * grid_size)
+    if profile.histograms is None:
+        blocks = ((df[columns].iloc[start:start + block_rows].to_numpy(dtype=np.float64, na_value=np.nan), 1.0)
+                  for start in range(0, len(df), block_rows))
+    else:
+        # Chunked data: the centre of every histogram bin carries the count of the bin
+        histograms = [profile.histograms[col] for col in columns]
+        blocks = [(np.column_stack([h.edges[:-1] + h.width / 2 for h in histograms]),
+                   np.column_stack([h.counts for h in histograms]).astype(float))]
+    for block, weights in blocks:
+        position = (block - lows) / deltas
+        valid = np.isfinite(position)
+        position = np.clip(np.nan_to_num(position), 0, grid_size - 1 - 1e-9)
+        index = position.astype(np.int64)
+        frac = (position - index)[valid]
+        weights = np.broadcast_to(weights, block.shape)[valid]
+        index = (index + offsets)[valid]
+        binned += np.bincount(index, weights=weights * (1 - frac), minlength=len(binned))
+        binned += np.bincount(index + 1, weights=weights * frac, minlength=len(binned))
+    binned = binned.reshape(len(columns), grid_size)
+
+    # Gaussian kernels sampled on each column's grid spacing, convolved in one batched FFT
+    half_width = min(int(np.ceil(4 * np.max(bws / deltas))), grid_size - 1)
+    steps = np.arange(-half_width, half_width + 1)
+    scaled = steps[None, :] * (deltas / bws)[:, None]
+    kernels = np.exp(-0.5 * scaled ** 2) / (np.sqrt(2 * np.pi) * bws[:, None])
+
+    fft_size = 1 << int(np.ceil(np.log2(grid_size + len(steps) - 1)))
+    convolved = np.fft.irfft(np.fft.rfft(binned, fft_size, axis=1) * np.fft.rfft(kernels, fft_size, axis=1),
+                             fft_size, axis=1)
+    density = np.clip(convolved[:, half_width:half_width + grid_size], 0, None) / n[:, None]
+
+    return {col: (lows[i] + deltas[i] * np.arange(grid_size), density[i])
+            for i, col in enumerate(columns)}
+
+def box_stats_numeric_columns(df: pd.DataFrame, columns: Optional[List[str]] = None,
+                              whisker: float = 1.5, max_outliers: int = 200, seed: int = 0,
+                              block_rows: int = 1_000_000,
+                              profile: Optional[ColumnProfile] = None) -> Dict[str, dict]:
+    """
+    Computes box plot statistics for several numeric columns in NumPy.
+
+    Quartiles and means are computed for all columns at once. Whiskers end at the most extreme
+    values within `whisker` × IQR of the box (Tukey's convention, as used by Plotly and Vega). The
+    values beyond the whiskers are reduced, block by block, to a uniform random sample of at most
+    `max_outliers` points (bottom-k on random keys), always keeping the minimum and the maximum.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        columns (Optional[List[str]], optional): Columns to summarize. Defaults to all numeric columns.
+        whisker (float, optional): Whisker length as a multiple of the IQR. Defaults to 1.5.
+        max_outliers (int, optional): Maximum number of outlier points kept per column. Defaults to 200.
+        seed (int, optional): Seed of the outlier sampling. Defaults to 0.
+        block_rows (int, optional): Number of rows converted to a float block at a time. Defaults to 1,000,000.
+        profile (Optional[ColumnProfile], optional): Precomputed statistics of `df` to reuse. Defaults to None.
+
+    Returns:
+        Dict[str, dict]: Maps each column with at least one value to a dict with the keys `count`,
+        `mean`, `min`, `q1`, `median`, `q3`, `max`, `lowerfence`, `upperfence`, `outliers`
+        (sampled outlier values) and `n_outliers` (total number of outliers).
+    """
+    if profile is None:
+        profile = ColumnProfile(df, columns)
+    scanned = profile.stats(profile._numeric(columns))
+    columns = list(scanned.index[scanned["count"] > 0])
+    if not columns:
+        return {}
+    scanned = scanned.loc[columns]
+    counts_non_null = scanned["count"]
+
+    quartiles = profile.quartiles(columns).to_numpy(dtype=float)
+    iqr = quartiles[2] - quartiles[0]
+    low_limit = quartiles[0] - whisker * iqr
+    high_limit = quartiles[2] + whisker * iqr
+
+    rng = np.random.default_rng(seed)
+    lowerfence = np.full(len(columns), np.inf)
+    upperfence = np.full(len(columns), -np.inf)
+    n_outliers = np.zeros(len(columns), dtype=np.int64)
+    sampled = [(np.empty(0), np.empty(0)) for _ in columns]
+    for start in range(0, len(df), block_rows):
+        block = df[columns].iloc[start:start + block_rows].to_numpy(dtype=np.float64, na_value=np.nan)
+        inside = (block >= low_limit) & (block <= high_limit)
+        lowerfence = np.minimum(lowerfence, np.where(inside, block, np.inf).min(axis=0))
+        upperfence = np.maximum(upperfence, np.where(inside, block, -np.inf).max(axis=0))
+
+        outside = ~inside & ~np.isnan(block)
+        n_outliers += outside.sum(axis=0)
+        for j in np.flatnonzero(outside.any(axis=0)):
+            values = np.concatenate([sampled[j][0], block[outside[:, j], j]])
+            keys = np.concatenate([sampled[j][1], rng.random(len(values) - len(sampled[j][0]))])
+            if len(values) > max_outliers:
+                keep = np.argpartition(keys, max_outliers)[:max_outliers]
+                values, keys = values[keep], keys[keep]
+            sampled[j] = (values, keys)
+
+    minimums = scanned["min"].to_numpy(dtype=float)
+    maximums = scanned["max"].to_numpy(dtype=float)
+    means = scanned["mean"].to_numpy(dtype=float)
+
+    stats = {}
+    for i, col in enumerate(columns):
+        outliers = sampled[i][0]
+        if n_outliers[i]:
+            # The extremes are always shown so the axis range stays faithful
+            extremes = [v for v in (minimums[i], maximums[i]) if v < low_limit[i] or v > high_limit[i]]
+            outliers = np.unique(np.concatenate([outliers, extremes]))
+        stats[col] = dict(count=int(counts_non_null[col]), mean=means[i], min=minimums[i],
+                          q1=quartiles[0][i], median=quartiles[1][i], q3=quartiles[2][i], max=maximums[i],
+                          lowerfence=lowerfence[i], upperfence=upperfence[i],
+                          outliers=np.sort(outliers), n_outliers=int(n_outliers[i]))
+    return stats
+
+def box_stats_traces(name: str, stats: dict, x=None, color: str = "#636efa") -> list:
+    """
+    Builds Plotly traces drawing a box plot from precomputed statistics.
+
+    Args:
+        name (str): Name shown for the box.
+        stats (dict): Statistics of one column, as returned by `box_stats_numeric_columns`.
+        x (optional): Position of the box on the x axis. Defaults to `name`.
+        color (str, optional): Color of the box and its outliers. Defaults to "#636efa".
+
+    Returns:
+        list: A `go.Box` with the quartiles, whiskers and mean, and a `go.Scatter` of the sampled outliers.
+    """
+    import plotly.graph_objects as go
+    x = name if x is None else x
+    box = go.Box(x=[x], q1=[stats["q1"]], median=[stats["median"]], q3=[stats["q3"]],
+                 lowerfence=[stats["lowerfence"]], upperfence=[stats["upperfence"]],
+                 mean=[stats["mean"]], name=str(name), boxpoints=False, marker_color=color)
+    outliers = go.Scatter(x=[x] * len(stats["outliers"]), y=stats["outliers"], mode="markers",
+                          name=str(name), marker=dict(size=4, color=color),
+                          hovertemplate="%{y}<extra>outlier</extra>")
+    return [box, outliers]
+
+def violin_stats_traces(name: str, stats: dict, x_grid: np.ndarray, density: np.ndarray,
+                        position: float = 0, half_width: float = 0.4, color: str = "#636efa") -> list:
+    """
+    Builds Plotly traces drawing a violin from a precomputed density outline and box statistics.
+
+    Args:
+        name (str): Name shown for the violin.
+        stats (dict): Statistics of one column, as returned by `box_stats_numeric_columns`.
+        x_grid (np.ndarray): Values at which the density was evaluated.
+        density (np.ndarray): Density at each grid value.
+        position (float, optional): Center of the violin on the x axis. Defaults to 0.
+        half_width (float, optional): Half of the maximal violin width, in x axis units. Defaults to 0.4.
+        color (str, optional): Color of the violin. Defaults to "#636efa".
+
+    Returns:
+        list: A filled outline `go.Scatter` followed by the box plot traces.
+    """
+    import plotly.graph_objects as go
+    scale = half_width / density.max() if density.max() > 0 else 0
+    outline = go.Scatter(x=np.concatenate([position - density * scale, (position + density * scale)[::-1]]),
+                         y=np.concatenate([x_grid, x_grid[::-1]]),
+                         fill="toself", mode="lines", name=str(name), line=dict(width=1, color=color),
+                         hoverinfo="skip")
+    box, outliers = box_stats_traces(name, stats, x=position, color=color)
+    box.update(width=half_width / 4, fillcolor="white", line=dict(width=1))
+    return [outline, box, outliers]
+
+def bin2d_numeric_pairs(df: pd.DataFrame, pairs: List[Tuple[str, str]], grid_size: int = 40,
+                        block_rows: int = 1_000_000,
+                        profile: Optional[ColumnProfile] = None) -> Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Reduces pairs of numeric columns to fixed-resolution 2D count grids.
+
+    Every column taking part in a pair is mapped to its bin codes once per block of rows; each pair
+    is then counted with a single `np.bincount` over the combined codes. The grids span the finite
+    values; rows missing either value or holding an infinity are ignored. The output size depends
+    only on `grid_size`, not on the number of rows.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        pairs (List[Tuple[str, str]]): The `(x, y)` column pairs.
+        grid_size (int, optional): Number of square bins along each axis. Defaults to 40.
+        block_rows (int, optional): Number of rows converted to a float block at a time. Defaults to 1,000,000.
+        profile (Optional[ColumnProfile], optional): Precomputed statistics of `df` to reuse. Defaults to None.
+
+    Returns:
+        Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray, np.ndarray]]: Maps each pair of columns with
+        finite values to its x edges, y edges and `(grid_size, grid_size)` count matrix indexed as
+        `[x bin, y bin]`.
+    """
+    if profile is None:
+        profile = ColumnProfile(df, list(dict.fromkeys(col for pair in pairs for col in pair)))
+    # Columns without a finite value have no range to grid
+    stats = profile.stats(list(dict.fromkeys(col for pair in pairs for col in pair)))
+    pairs = [(x, y) for x, y in pairs if not np.isnan(stats.loc[[x, y], "finite_min"]).any()]
+    columns = list(dict.fromkeys(col for pair in pairs for col in pair))
+    if not columns:
+        return {}
+
+    lows = stats.loc[columns, "finite_min"].to_numpy(dtype=float)
+    highs = stats.loc[columns, "finite_max"].to_numpy(dtype=float)
+    highs = np.where(highs > lows, highs, lows + 1)
+    widths = (highs - lows) / grid_size
+    position = {col: i for i, col in enumerate(columns)}
+
+    counts = {pair: np.zeros(grid_size * grid_size, dtype=np.int64) for pair in pairs}
+    for start in range(0, len(df), block_rows):
+        block = df[columns].iloc[start:start + block_rows].to_numpy(dtype=np.float64, na_value=np.nan)
+        codes = np.floor((block - lows) / widths)
+        missing = ~np.isfinite(codes)
+        codes = np.clip(np.nan_to_num(codes), 0, grid_size - 1).astype(np.int64)
+        codes[missing] = -1
+        for x, y in pairs:
+            cx, cy = codes[:, position[x]], codes[:, position[y]]
+            valid = (cx >= 0) & (cy >= 0)
+            counts[(x, y)] += np.bincount(cx[valid] * grid_size + cy[valid], minlength=grid_size * grid_size)
+
+    edges = {col: lows[i] + widths[i] * np.arange(grid_size + 1) for i, col in enumerate(columns)}
+    return {(x, y): (edges[x], edges[y], counts[(x, y)].reshape(grid_size, grid_size))
+            for x, y in pairs}
+
+def correlation_matrix(df: pd.DataFrame, columns: Optional[List[str]] = None, method: str = "pearson",
+                       dtype: str = "float32", block_rows: Optional[int] = None,
+                       profile: Optional["ColumnProfile"] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Computes the pairwise-complete correlation matrix of numeric columns with blocked matrix products.
+
+    The columns are standardized and split into blocks of rows; each block contributes four
+    `p x p` matrix products (pairwise counts, sums, sums of squares and cross products over the
+    rows where both values are present, infinities counting as missing like pandas) computed in
+    `dtype` and accumulated in float64. Blocks
+    without missing values only need the cross product. Memory is bounded by the block and the
+    `p x p` accumulators, whatever the number of rows.
+
+    Spearman correlation is the Pearson correlation of the ranks. Each column is ranked once over
+    its present values, so with missing values the result can differ slightly from pandas, which
+    re-ranks every pair over the rows where both are present.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame.
+        columns (Optional[List[str]], optional): Numeric columns to correlate. Defaults to all numeric columns.
+        method (str, optional): "pearson" or "spearman". Defaults to "pearson".
+        dtype (str, optional): Precision of the block products, "float32" or "float64". Defaults to "float32".
+        block_rows (Optional[int], optional): Number of rows per block. Defaults to about 16M values per block.
+        profile (Optional[ColumnProfile], optional): Profile of `df`, whose means and standard deviations
+            standardize the Pearson input. Defaults to None.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: The correlation matrix (NaN where a pair has fewer than two
+        rows or a constant column) and the number of rows where both values are present.
+
+    Raises:
+        ValueError: If `method` or `dtype` is not supported.
+    """
+    if method not in ("pearson", "spearman"):
+        raise ValueError(f"method must be 'pearson' or 'spearman', got {method!r}")
+    if dtype not in ("float32", "float64"):
+        raise ValueError(f"dtype must be 'float32' or 'float64', got {dtype!r}")
+    if columns is None:
+        columns = [col for col in df.columns if dtype_class(df[col].dtype) == "numeric"]
+    p = len(columns)
+    block_rows = block_rows or max(1024, (1 << 24) // max(p, 1))
+
+    data = df[columns]
+    if method == "spearman":
+        # Infinities are missing values, as in the Pearson blocks
+        data = data.astype(np.float64).mask(np.isinf).rank()
+    if profile is not None and method == "pearson":
+        stats = profile.stats(columns)
+        center, scale = stats["mean"], stats["std"]
+    else:
+        with np.errstate(invalid="ignore"):
+            center, scale = data.mean(), data.std()
+    center = center.to_numpy(dtype=np.float64, copy=True)
+    scale = scale.to_numpy(dtype=np.float64, copy=True)
+    # Columns holding infinities (or too few values) are standardized on their finite values
+    for j in np.flatnonzero(~(np.isfinite(center) & np.isfinite(scale))):
+        values = data.iloc[:, j].to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[np.isfinite(values)]
+        center[j] = values.mean() if len(values) else 0
+        scale[j] = values.std() if len(values) > 1 else 1
+    scale = np.where(scale > 0, scale, 1)
+
+    pairs = np.zeros((p, p))
+    sums, squares, products = np.zeros((p, p)), np.zeros((p, p)), np.zeros((p, p))
+    for start in range(0, len(data), block_rows):
+        block = data.iloc[start:start + block_rows].to_numpy(dtype=np.float64, na_value=np.nan)
+        block = np.where(np.isfinite(block), block, np.nan)
+        with np.errstate(over="ignore"):
+            block = ((block - center) / scale).astype(dtype)
+        # Non-finite values (and values out of range of `dtype`) count as missing
+        missing = ~np.isfinite(block)
+        if missing.any():
+            present = (~missing).astype(dtype)
+            block[missing] = 0
+            pairs += present.T @ present
+            sums += block.T @ present
+            squares += (block * block).T @ present
+        else:
+            pairs += len(block)
+            sums += block.sum(axis=0, dtype=np.float64)[:, None]
+            squares += (block * block).sum(axis=0, dtype=np.float64)[:, None]
+        products += block.T @ block
+
+    # sums[i, j] is the sum of column i over the rows where column j is also present
+    with np.errstate(invalid="ignore", divide="ignore"):
+        covariance = products - sums * sums.T / pairs
+        variance = squares - sums ** 2 / pairs
+        # Standardized columns have a variance close to the pair count; far below is a constant column
+        variance = np.where(variance > 1e-8 * pairs, variance, np.nan)
+        corr = np.clip(covariance / np.sqrt(variance * variance.T), -1, 1)
+    corr[pairs < 2] = np.nan
+    diagonal = np.arange(p)
+    corr[diagonal, diagonal] = np.where(np.isnan(corr[diagonal, diagonal]), np.nan, 1)
+    return (pd.DataFrame(corr, index=columns, columns=columns),
+            pd.DataFrame(pairs.astype(np.int64), index=columns, columns=columns))
+
+def top_correlated_pairs(corr: pd.DataFrame, k: int) -> List[Tuple[str, str]]:
+    """
+    Returns the `k` pairs of the upper triangle of a correlation matrix with the largest absolute
+    correlation, strongest first. Each pair appears once, in column order, and never with itself.
+    """
+    values = np.abs(corr.to_numpy())
+    rows, cols = np.triu_indices(len(corr), k=1)
+    strength = values[rows, cols]
+    keep = ~np.isnan(strength)
+    rows, cols, strength = rows[keep], cols[keep], strength[keep]
+    order = np.argsort(-strength, kind="stable")[:k]
+    return [(corr.index[rows[i]], corr.columns[cols[i]]) for i in order]
+
+def map_columns(func, tasks: List[tuple], workers: Optional[int] = None,
+                executor: str = "thread") -> list:
+    """
+    Calls `func(*task)` for every task, optionally fanned out to a `concurrent.futures` pool.
+
+    Results are returned in the order of `tasks`, whichever worker finishes first. Each task should
+    carry only what its figure needs (a column slice or its precomputed statistics), so process
+    workers never receive the whole DataFrame.
+
+    Args:
+        func: A module-level callable, so that it can be sent to process workers.
+        tasks (List[tuple]): Positional arguments of each call.
+        workers (Optional[int], optional): Number of workers; None, 0 or 1 runs the calls in the
+            current thread and -1 uses every CPU. Defaults to None.
+        executor (str, optional): "thread" or "process". Defaults to "thread".
+
+    Returns:
+        list: The return value of each call.
+
+    Raises:
+        ValueError: If `executor` is not "thread" or "process".
+    """
+    if executor not in ("thread", "process"):
+        raise ValueError(f"executor must be 'thread' or 'process', got {executor!r}")
+    if workers is not None and workers < 0:
+        workers = os.cpu_count() or 1
+    if not workers or workers <= 1 or len(tasks) <= 1:
+        return [func(*task) for task in tasks]
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    workers = min(workers, len(tasks))
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Each task runs in a copy of the caller's context, so its telemetry phases are recorded
+            futures = [pool.submit(contextvars.copy_context().run, func, *task) for task in tasks]
+            return [future.result() for future in futures]
+    # Batch the tasks so that each process round-trip builds several charts
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, *zip(*tasks), chunksize=max(1, len(tasks) // (workers * 4))))
+
+class BudgetExceededError(ValueError):
+    """Raised when a chart or the report would exceed its output size budget (see `Report`)."""
+
+# Approximate HTML bytes per embedded value, measured on float64 columns: Plotly traces (binary
+# arrays), Highcharts JSON points, Vega-Lite inline records and base64 payloads
+plotly_value_bytes = 14
+json_value_bytes = 21
+vega_value_bytes = 27
+payload_value_bytes = {"float64": 11, "float32": 6}
+# Markup of one chart apart from its data, and of a chart drawn from pre-aggregated statistics
+chart_overhead_bytes = 4096
+aggregated_chart_bytes = 16384
+# One cell of a 2D-binned scatter plot
+grid_cell_bytes = 32
+
+# Arguments tried in turn, cumulatively, when a chart is estimated over its budget
+chart_degradations = {
+    "histogram": [{"binning": "server"}],
+    "histoplot": [{"binning": "server"}],
+    "box": [{"stats": "server"}],
+    "boxplot": [{"stats": "server"}],
+    "violin": [{"stats": "server"}],
+    "densityplot": [{"kde": "server"}],
+    "hc_distribution": [{"payload": "binary", "payload_dtype": "float32"}],
+    "pairplot": [{"aggregate": "sample"}, {"aggregate": "grid"}],
+    "hc_scatter": [{"payload": "binary", "payload_dtype": "float32"}, {"aggregate": "sample"},
+                   {"aggregate": "grid"}],
+}
+
+def estimate_chart_bytes(method: str, profile: ColumnProfile, arguments: dict) -> Optional[int]:
+    """
+    Estimates the HTML size of a chart method's output from the profile of its data, without rendering it.
+
+    Args:
+        method (str): Name of the `Report` chart method.
+        profile (ColumnProfile): Profile of the method's input.
+        arguments (dict): The method's arguments.
+
+    Returns:
+        Optional[int]: Estimated bytes, or None for methods whose output does not grow with the data
+        (`countplot`, `donut`, `correlation_heatmap`).
+    """
+    if method not in chart_degradations:
+        return None
+    include_cols, exclude_cols = arguments.get("include_cols"), arguments.get("exclude_cols")
+    columns = [col for col in profile.numeric_columns
+               if (col in include_cols if include_cols else not exclude_cols or col not in exclude_cols)]
+    max_plots = arguments.get("max_plots") or float("inf")
+    rows = profile.rows
+
+    if method in ("pairplot", "hc_scatter"):
+        charts = min(arguments.get("top_pairs") or len(columns) ** 2, max_plots)
+        aggregate, max_points = arguments.get("aggregate"), arguments.get("max_points", 5000)
+        if aggregate is not None and rows > max_points:
+            if aggregate == "grid":
+                return int(charts * (chart_overhead_bytes + arguments.get("grid_size", 40) ** 2 * grid_cell_bytes))
+            rows = max_points
+        if method == "pairplot":
+            # One inline dataset with every column of the DataFrame, shared by all the charts
+            return int(charts * chart_overhead_bytes + rows * len(profile.columns) * vega_value_bytes)
+        if arguments.get("payload") == "binary":
+            # One payload per column, shared by the charts using it
+            value_bytes = payload_value_bytes.get(arguments.get("payload_dtype"), 11)
+            return int(charts * chart_overhead_bytes + rows * min(len(columns), 2 * charts) * value_bytes)
+        return int(charts * (chart_overhead_bytes + 2 * rows * json_value_bytes))
+
+    charts = min(len(columns), max_plots)
+    if "server" in (arguments.get("binning"), arguments.get("stats"), arguments.get("kde")):
+        return int(charts * aggregated_chart_bytes)
+    if method in ("histogram", "box", "violin"):
+        value_bytes = plotly_value_bytes
+    elif method == "hc_distribution":
+        value_bytes = (payload_value_bytes.get(arguments.get("payload_dtype"), 11)
+                       if arguments.get("payload") == "binary" else json_value_bytes)
+    else:
+        value_bytes = vega_value_bytes
+    return int(charts * (chart_overhead_bytes + rows * value_bytes))
+
+def budgeted(method):
+    """
+    Decorator of `Report` chart methods enforcing the report's output size budgets.
+
+    Before rendering, the output size is estimated with `estimate_chart_bytes`. If it is over the
+    chart budget (the smaller of `chart_budget` and what is left of `report_budget`), the arguments
+    of `chart_degradations` are applied in turn until the estimate fits (`over_budget="degrade"`).
+    A chart that still does not fit, estimated or once rendered, raises `BudgetExceededError`
+    (a warning with `over_budget="warn"`). Returned fragments are remembered, so the size ledger
+    can name the method they came from.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, df, *args, **kwargs):
+        budget = self._chart_budget()
+        if budget is None:
+            return self._register_fragment(method(self, df, *args, **kwargs), method.__name__)
+
+        bound = signature.bind(self, df, *args, **kwargs)
+        bound.apply_defaults()
+        return_html = bound.arguments["return_html"]
+        name = method.__name__
+        options = [{}] + (chart_degradations.get(name, []) if self.over_budget == "degrade" else [])
+        profile = self.profile(df) if name in chart_degradations else None
+
+        changes: dict = {}
+        estimate = None
+        for option in options:
+            changes.update(option)
+            estimate = estimate_chart_bytes(name, profile, {**bound.arguments, **changes}) if profile else None
+            if estimate is None or estimate <= budget:
+                break
+        described = ", ".join(f"{key}={value!r}" for key, value in changes.items())
+        message = (f"{name} would emit about {{size:,}} bytes of HTML, over its budget of {budget:,} bytes"
+                   + (f" even with {described}" if changes else "")
+                   + ". Select fewer columns (include_cols, max_plots), aggregate the data or raise"
+                   " chart_budget / report_budget.")
+        if estimate is not None and estimate > budget:
+            if self.over_budget != "warn":
+                raise BudgetExceededError(message.format(size=estimate))
+            warnings.warn(message.format(size=estimate))
+        elif changes:
+            warnings.warn(f"{name}: the output was estimated over the budget of {budget:,} bytes; "
+                          f"using {described} instead.")
+
+        bound.arguments.update(changes)
+        bound.arguments["return_html"] = True
+        html = method(*bound.args, **bound.kwargs)
+        if html is None:
+            return None
+        size = len(html.encode("utf-8"))
+        if size > budget and (estimate is None or estimate <= budget):
+            # The estimate was too optimistic (or there is none)
+            if self.over_budget != "warn":
+                raise BudgetExceededError(message.format(size=size))
+            warnings.warn(message.format(size=size))
+        label = f"{name} ({described})" if changes else name
+        self._register_fragment(html, label)
+        return html if return_html else None
+
+    return wrapper
+
+# Element ids generated by this module (`<kind>-<uuid4 hex>`), rewritten by `stable_ids`
+generated_id = re.compile(r"\b(plotly|altair|payload|table|highchart)-[0-9a-f]{32}\b")
+
+def stable_ids(html: str, seed: str) -> str:
+    """
+    Replaces the random element ids of a fragment by ids derived from `seed` and their order of
+    appearance, so the same fragment rendered from the same seed is byte-identical.
+
+    Args:
+        html (str): The fragment.
+        seed (str): Seed of the ids, unique within the report.
+
+    Returns:
+        str: The fragment with deterministic ids.
+    """
+    mapping: Dict[str, str] = {}
+
+    def replace(match):
+        if match.group(0) not in mapping:
+            digest = hashlib.blake2b(f"{seed}:{len(mapping)}".encode("utf-8"), digest_size=16).hexdigest()
+            mapping[match.group(0)] = f"{match.group(1)}-{digest}"
+        return mapping[match.group(0)]
+
+    return generated_id.sub(replace, html)
+
+class FragmentCache:
+    """
+    Content-addressed on-disk cache of rendered chart fragments, with least-recently-used eviction.
+
+    A fragment is keyed by the chart method, its parameters and a hash of the whole input data
+    (`pd.util.hash_pandas_object` per column, or the path, size and modification time of a file),
+    so re-running a notebook reuses every chart whose input did not change. Fragments are stored
+    with deterministic ids (see `stable_ids`). Iterators of chunks cannot be hashed without being
+    consumed and are never cached.
+
+    Args:
+        directory (Optional[str], optional): Cache directory. Defaults to `<cache_dir>/fragments`.
+        max_bytes (int, optional): Size above which the least recently used fragments are removed.
+            Defaults to 256 MiB.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 256 << 20) -> None:
+        self.directory = directory or os.path.join(cache_dir, "fragments")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def data_hash(data: DataSource) -> Optional[str]:
+        """Returns a hex digest of the content of a DataFrame or data file, or None for an iterator."""
+        digest = hashlib.blake2b(digest_size=16)
+        if isinstance(data, pd.DataFrame):
+            digest.update(repr((data.shape, list(map(str, data.columns)), list(map(str, data.dtypes)))).encode("utf-8"))
+            for i in range(data.shape[1]):
+                digest.update(column_hashes(data.iloc[:, i]).tobytes())
+        elif isinstance(data, (str, os.PathLike)):
+            stat = os.stat(data)
+            digest.update(repr((os.path.abspath(data), stat.st_size, stat.st_mtime_ns)).encode("utf-8"))
+        else:
+            return None
+        return digest.hexdigest()
+
+    def key(self, name: str, data: DataSource, params: dict) -> Optional[str]:
+        """
+        Returns the cache key of a chart, or None if its data cannot be hashed.
+
+        Args:
+            name (str): Name of the chart method.
+            data (DataSource): Input data.
+            params (dict): Remaining arguments of the method; their `repr` is part of the key.
+        """
+        content = self.data_hash(data)
+        if content is None:
+            return None
+        text = repr((__version__, name, content, sorted(params.items())))
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.html")
+
+    def get(self, key: str) -> Optional[Tuple[str, List[str]]]:
+        """Returns the cached fragment and the libraries it needs, marking it as recently used, or None."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                requires = f.readline().split()
+                html = f.read()
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return html, requires
+
+    def put(self, key: str, html: str, requires: List[str]) -> None:
+        """
+        Stores a fragment, then evicts the least recently used ones beyond `max_bytes`.
+
+        Args:
+            key (str): Cache key, see `key`.
+            html (str): The fragment.
+            requires (List[str]): Libraries used by the fragment, stored on its first line so a hit
+                does not scan the markup for them.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(" ".join(requires) + "\n")
+            f.write(html)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes least recently used fragments until the cache fits in `max_bytes`."""
+        entries = [(entry.stat().st_mtime_ns, entry.stat().st_size, entry.path)
+                   for entry in os.scandir(self.directory) if entry.name.endswith(".html")]
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self) -> None:
+        """Removes every cached fragment."""
+        if os.path.isdir(self.directory):
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".html"):
+                    os.remove(entry.path)
+
+def cached_fragment(method):
+    """
+    Decorator of `Report` chart methods returning an HTML fragment, reusing it from the report's
+    `fragment_cache` when the data and arguments did not change.
+
+    On a hit the cached fragment is displayed in the notebook instead of being rebuilt. Returned
+    fragments get deterministic ids, numbered by how often the same chart occurs in the report.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, df, *args, **kwargs):
+        cache = self.fragment_cache
+        if cache is None:
+            return method(self, df, *args, **kwargs)
+        bound = signature.bind(self, df, *args, **kwargs)
+        bound.apply_defaults()
+        return_html = bound.arguments["return_html"]
+        params = {name: value for name, value in bound.arguments.items()
+                  if name not in ("self", "df", "return_html", "workers")}
+        with telemetry_phase("fragment_cache") as event:
+            key = cache.key(method.__name__, df, params)
+            cached = cache.get(key) if key is not None else None
+            if event is not None:
+                event["hit"] = cached is not None
+        if key is None:
+            return method(self, df, *args, **kwargs)
+
+        if cached is None:
+            bound.arguments["return_html"] = True
+            html = method(*bound.args, **bound.kwargs)
+            if html is None:
+                return None
+            html = stable_ids(html, key)
+            cache.put(key, html, detect_assets(html))
+        else:
+            html, requires = cached
+            self._render_in_notebook(html, requires=requires)
+
+        uses = self._fragment_uses[key] = self._fragment_uses.get(key, 0) + 1
+        if uses > 1:
+            # The same chart again in this report; its ids must not collide with the first one
+            html = stable_ids(html, f"{key}:{uses}")
+        return html if return_html else None
+
+    return wrapper
+
+def _plotly_card(fig: go.Figure, height: int, class_name: str, margin_top: int = 20) -> str:
+    """Applies the shared chart layout and wraps a figure in a grid card."""
+    with telemetry_phase("figure"):
+        fig.update_layout(height=height, template="plotly_white",
+                          title=dict(font=dict(size=18, weight=500), xanchor="left", yanchor="top",
+                                     x=0, y=0.97, pad={"l": 10}),
+                          margin=dict(t=margin_top, b=10, l=10, r=10))
+    return f"""
+            <div class="{class_name}">
+                <div class="card">
+                    {plotly_html(fig)}
+                </div>
+            </div>
+            """
+
+def _count_data(col: str, counts: Union[pd.Series, SpaceSaving], max_categories: int) -> pd.DataFrame:
+    """
+    Returns the counts and percentages of the `max_categories` most frequent values of a column.
+
+    From a `SpaceSaving` summary, the table also has an `error` column (each count overestimates
+    the true count by at most its error) and an "Other" row with the remaining values, whose count
+    is underestimated by at most the sum of the shown errors.
+    """
+    summary = counts if isinstance(counts, SpaceSaving) else None
+    count_data = (counts if summary is None else summary.counts).reset_index()
+    count_data.columns = [col, 'count']
+
+    # Limit the categories to the top 'max_categories' if needed
+    if len(count_data) > max_categories:
+        count_data = count_data.head(max_categories)
+
+    if summary is not None:
+        count_data['error'] = summary.errors.iloc[:len(count_data)].to_numpy()
+        other = summary.total - count_data['count'].sum()
+        if other > 0:
+            count_data = pd.concat([count_data, pd.DataFrame({col: ['Other'], 'count': [other],
+                                                              'error': [count_data['error'].sum()]})],
+                                   ignore_index=True)
+
+    total_count = count_data['count'].sum()
+    count_data['percentage'] = (count_data['count'] / total_count) * 100
+    return count_data
+
+def _countplot_card(col: str, counts: Union[pd.Series, SpaceSaving], height: int, max_categories: int,
+                    class_name: str) -> str:
+    """Builds the count plot card of one column from its value counts or heavy hitters, for `Report.countplot`."""
+    import plotly.express as px
+    with telemetry_phase("data"):
+        count_data = _count_data(col, counts, max_categories)
+
+    with telemetry_phase("figure"):
+        fig = px.bar(count_data, x=col, y='percentage', title=f"Count Plot of {col}",
+                     labels={'percentage': 'Percentage'})
+
+        # Use hover data to show the actual count (and its error bound)
+        error_html = '<br>Error bound: %{customdata[1]}' if 'error' in count_data else ''
+        fig.update_traces(hovertemplate=f'{col}: %{{x}}<br>Count: %{{customdata[0]}}{error_html}<br>Percentage: %{{y}}%',
+                          customdata=count_data[['count', 'error'] if error_html else ['count']])
+    return _plotly_card(fig, height, class_name, margin_top=50)
+
+def _donut_card(col: str, counts: Union[pd.Series, SpaceSaving], height: int, max_categories: int,
+                class_name: str, hole: float) -> str:
+    """Builds the donut chart card of one column from its value counts or heavy hitters, for `Report.donut`."""
+    import plotly.express as px
+    with telemetry_phase("data"):
+        count_data = _count_data(col, counts, max_categories)
+
+    with telemetry_phase("figure"):
+        fig = px.pie(count_data, names=col, values='count',
+                     hole=hole, title=f'Dunut Chart of {col}')
+        error_html = '<br>Error bound: %{customdata[0]}' if 'error' in count_data else ''
+        fig.update_traces(
+            textinfo='percent',
+            hovertemplate=f'{col}: %{{label}}<br>Count: %{{value}}{error_html}<br>Percentage: %{{percent}}'
+        )
+        if error_html:
+            fig.update_traces(customdata=count_data[['error']])
+        fig.update_layout(showlegend=True)
+    return _plotly_card(fig, height, class_name, margin_top=50)
+
+def _histogram_card(col: str, data: Union[pd.Series, Tuple[np.ndarray, np.ndarray]], height: int,
+                    class_name: str, bins: Optional[int] = None) -> str:
+    """Builds the histogram card of one column from its values or its server-side `(edges, counts)`."""
+    import plotly.graph_objects as go
+    import plotly.express as px
+    with telemetry_phase("figure"):
+        if isinstance(data, pd.Series):
+            fig = px.histogram(data.to_frame(), x=col, nbins=bins)
+        else:
+            fig = go.Figure(binned_bar_trace(*data))
+            fig.update_layout(bargap=0, xaxis_title=col, yaxis_title="count")
+    return _plotly_card(fig, height, class_name)
+
+def _box_card(col: str, data: Union[pd.Series, dict], height: int, class_name: str) -> str:
+    """Builds the box plot card of one column from its values or its server-side statistics."""
+    import plotly.graph_objects as go
+    import plotly.express as px
+    with telemetry_phase("figure"):
+        if isinstance(data, pd.Series):
+            fig = px.box(data.to_frame(), y=col)
+        else:
+            fig = go.Figure(box_stats_traces(col, data))
+            fig.update_layout(showlegend=False, yaxis_title=col)
+    return _plotly_card(fig, height, class_name)
+
+def _violin_card(col: str, data: Union[pd.Series, dict], height: int, class_name: str,
+                 density: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> str:
+    """Builds the violin plot card of one column from its values or its server-side statistics and density."""
+    import plotly.graph_objects as go
+    import plotly.express as px
+    with telemetry_phase("figure"):
+        if isinstance(data, pd.Series):
+            fig = px.violin(data.to_frame(), y=col, box=True, points="outliers")
+        else:
+            fig = go.Figure(violin_stats_traces(col, data, *density))
+            fig.update_layout(showlegend=False, yaxis_title=col,
+                              xaxis=dict(showticklabels=False, zeroline=False))
+    return _plotly_card(fig, height, class_name)
+
+def _bellcurve_card(col: str, series: pd.Series, height: int, class_name: str,
+                    payload: str = "json", payload_dtype: str = "float64") -> str:
+    """Builds the Highcharts bell-curve card of one column for `Report.hc_distribution`."""
+    payload_html = ""
+    if payload == "binary":
+        payload_id, payload_html = encode_payload(series.dropna(), payload_dtype)
+        js_data = f"PyReport.values(PyReport.payload('{payload_id}'))"
+    else:
+        js_data = json.dumps(series.dropna().tolist())
+    container_id = f"highchart-{uuid.uuid4().hex}"
+
+    options = f"""{{
+                        chart: {{
+                            height: {height},
+                            spacing: [0, 10, 0, 0]
+                        }},
+                        title: {{
+                            text: null
+                        }},
+                        xAxis: [{{
+                            title: {{
+                                text: '{col}'
+                            }},
+                            alignTicks: false
+                        }}, {{
+                            title: {{
+                                text: null
+                            }},
+                            alignTicks: false,
+                            opposite: true
+                        }}],
+                        yAxis: [{{
+                            title: {{ text: '{col}' }}
+                        }}, {{
+                            title: {{ text: null }},
+                            opposite: true
+                        }}],
+                        legend: {{ enabled: false }},
+                        series: [{{
+                            name: 'Bell curve',
+                            type: 'bellcurve',
+                            xAxis: 1,
+                            yAxis: 1,
+                            baseSeries: 1,
+                            zIndex: -1
+                        }}, {{
+                            name: 'Data',
+                            type: 'scatter',
+                            data: {js_data},
+                            marker: {{
+                                radius: 1.5
+                            }},
+                            accessibility: {{
+                                exposeAsGroupOnly: true
+                            }}
+                        }}],
+                        credits: {{ enabled: false }}
+                    }}"""
+
+    script = lazy_chart_script(container_id, "highcharts", f"return Highcharts.chart(element, {options});")
+    return payload_html + f"""
+            <div class="{class_name}">
+                <div class="card">
+                    <div id="{container_id}" style="width: 100%; height: {height}px;"></div>
+                    {script}
+                </div>
+            </div>
+            """
+
+def _histoplot_chart(col: str, data: Union[pd.Series, Tuple[np.ndarray, np.ndarray]], width: int,
+                     height: int, bin_step: Optional[float] = None) -> "alt.Chart":
+    """Builds the Altair histogram of one column from its values or its server-side `(edges, counts)`."""
+    import altair as alt
+    if isinstance(data, pd.Series):
+        chart = alt.Chart(data.to_frame()).mark_bar(opacity=0.75).encode(
+            x=alt.X(col, bin=alt.Bin(step=bin_step) if bin_step else True,
+                    axis=alt.Axis(titleFontWeight='normal')),
+            y=alt.Y('count()', axis=alt.Axis(title='Count', titleFontWeight='normal'))
+        )
+    else:
+        edges, counts = data
+        bins_df = pd.DataFrame({'bin_start': edges[:-1], 'bin_end': edges[1:], 'count': counts})
+        chart = alt.Chart(bins_df).mark_bar(opacity=0.75).encode(
+            x=alt.X('bin_start:Q', bin='binned', axis=alt.Axis(title=str(col), titleFontWeight='normal')),
+            x2='bin_end:Q',
+            y=alt.Y('count:Q', axis=alt.Axis(title='Count', titleFontWeight='normal'))
+        )
+    return chart.properties(width=width, height=height)
 
-from IPython.display import display, HTML, Markdown
-import altair as alt
-from plotly.basedatatypes import BaseFigure as PlotlyFigure
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+# Innermost open span of a `Telemetry`, shared by the phases of the call being measured
+_telemetry_span: contextvars.ContextVar = contextvars.ContextVar("pyreport_telemetry_span", default=None)
 
-__version__ = "1.0.0"
+class Telemetry:
+    """
+    Opt-in timings of a report build, enabled with `Report(telemetry=True)`.
 
-# Configuration
-css_url = "https://raw.githubusercontent.com/paudelsagar/pyreport/refs/heads/main/css/report.css"
-js_url = "https://raw.githubusercontent.com/paudelsagar/pyreport/refs/heads/main/js/report.js"
+    Every public `Report` call is recorded as a "call" event, and the work it does as nested "phase"
+    events: `profile` / `profile.<statistic>` and `data` (data preparation), `figure` (building and
+    validating Plotly figures), `fragment_cache`, `plotly_html` and `altair_html` (figure
+    serialization), `table_html`, `write` (file I/O) and `display` (notebook output). Events are dicts with the `name`, `category`, `start` and `duration` (in
+    seconds), `self` time (without nested events), `thread`, `depth`, `rows` / `columns` of the
+    input DataFrame, `html_bytes` returned, `bytes_written` to the report file and, with `memory`,
+    the `peak_bytes` allocated during each top-level call (`tracemalloc`).
 
-plotly_config = {'displaylogo': False}
+    Args:
+        memory (bool, optional): Whether to trace the peak memory of top-level calls. Tracing slows
+            allocations down noticeably. Defaults to False.
+        callbacks (Optional[List[Callable[[dict], None]]], optional): Functions called with every
+            finished event, e.g. to forward them to a metrics system. Defaults to None.
+    """
+
+    def __init__(self, memory: bool = False, callbacks: Optional[List[Callable[[dict], None]]] = None) -> None:
+        import threading
+
+        self.memory = memory
+        self.callbacks = list(callbacks or [])
+        self.events: List[dict] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter_ns()
+
+    def add_callback(self, callback: Callable[[dict], None]) -> None:
+        """Registers a function called with every finished event."""
+        self.callbacks.append(callback)
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str = "phase", data=None, **fields):
+        """
+        Context manager recording one event around its body, which can add fields to the yielded dict.
+
+        Args:
+            name (str): Name of the event.
+            category (str, optional): "call" or "phase". Defaults to "phase".
+            data (optional): Input of the call; the shape of a DataFrame is recorded. Defaults to None.
+            **fields: Extra fields of the event.
+        """
+        import threading
+
+        parent = _telemetry_span.get()
+        if parent is not None and parent["telemetry"] is not self:
+            parent = None
+        event = {"name": name, "category": category, "thread": threading.get_ident(),
+                 "depth": parent["event"]["depth"] + 1 if parent else 0,
+                 "html_bytes": 0, "bytes_written": 0, **fields}
+        if isinstance(data, pd.DataFrame):
+            event["rows"], event["columns"] = data.shape
+
+        trace_memory = self.memory and parent is None
+        if trace_memory:
+            import tracemalloc
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            else:
+                tracemalloc.reset_peak()
+
+        state = {"telemetry": self, "event": event, "children": 0}
+        token = _telemetry_span.set(state)
+        start = time.perf_counter_ns()
+        try:
+            yield event
+        finally:
+            duration = time.perf_counter_ns() - start
+            _telemetry_span.reset(token)
+            if trace_memory:
+                event["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+                if started_tracing:
+                    tracemalloc.stop()
+            event["start"] = (start - self._origin) / 1e9
+            event["duration"] = duration / 1e9
+            # Children run on worker threads may overlap, so the difference can be negative
+            event["self"] = max(duration - state["children"], 0) / 1e9
+            with self._lock:
+                if parent is not None:
+                    parent["children"] += duration
+                    parent["event"]["bytes_written"] += event["bytes_written"]
+                self.events.append(event)
+            for callback in self.callbacks:
+                callback(event)
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Aggregates the events by name, slowest first.
+
+        Returns:
+            pd.DataFrame: Per name: category, calls, total / self / mean / max seconds, HTML bytes
+            and bytes written, the largest input shape and, with `memory`, the largest peak in MB.
+        """
+        columns = ["name", "category", "calls", "total_s", "self_s", "mean_s", "max_s",
+                   "html_bytes", "bytes_written", "rows", "columns", "peak_mb"]
+        if not self.events:
+            return pd.DataFrame(columns=columns)
+        events = pd.DataFrame(self.events)
+        for column in ("rows", "columns", "peak_bytes"):
+            if column not in events:
+                events[column] = np.nan
+        grouped = events.groupby(["name", "category"], sort=False)
+        table = grouped.agg(calls=("duration", "size"), total_s=("duration", "sum"), self_s=("self", "sum"),
+                            mean_s=("duration", "mean"), max_s=("duration", "max"),
+                            html_bytes=("html_bytes", "sum"), bytes_written=("bytes_written", "sum"),
+                            rows=("rows", "max"), columns=("columns", "max"), peak_mb=("peak_bytes", "max"))
+        table["peak_mb"] /= 2 ** 20
+        # Only top-level events count towards the bytes written, nested ones are included in them
+        top = events[events["depth"] == 0].groupby(["name", "category"], sort=False)["bytes_written"].sum()
+        table["bytes_written"] = top.reindex(table.index).fillna(table["bytes_written"])
+        return table.reset_index().sort_values("total_s", ascending=False, ignore_index=True)[columns]
+
+    def to_chrome_trace(self, filepath: Optional[str] = None) -> dict:
+        """
+        Converts the events to the Chrome trace-event format, viewable in `chrome://tracing` or Perfetto.
+
+        Args:
+            filepath (Optional[str], optional): Also write the trace to this JSON file. Defaults to None.
+
+        Returns:
+            dict: The trace.
+        """
+        pid = os.getpid()
+        trace_events = []
+        for event in self.events:
+            args = {key: value for key, value in event.items()
+                    if key not in ("name", "category", "start", "duration", "thread")}
+            trace_events.append({"name": event["name"], "cat": event["category"], "ph": "X",
+                                 "ts": event["start"] * 1e6, "dur": event["duration"] * 1e6,
+                                 "pid": pid, "tid": event["thread"], "args": args})
+        trace = {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+        if filepath:
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(trace, f, default=str)
+        return trace
+
+    def clear(self) -> None:
+        """Forgets the recorded events."""
+        with self._lock:
+            self.events.clear()
+
+@contextlib.contextmanager
+def telemetry_phase(name: str, **fields):
+    """
+    Records a phase of the `Report` call being measured, if any (see `Telemetry`); otherwise does nothing.
+
+    Yields:
+        Optional[dict]: The event, to add fields to, or None.
+    """
+    parent = _telemetry_span.get()
+    if parent is None:
+        yield None
+        return
+    with parent["telemetry"].span(name, "phase", **fields) as event:
+        yield event
+
+def traced(method):
+    """Decorator of `Report` methods recording each call in the report's `telemetry`, if enabled."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.telemetry is None:
+            return method(self, *args, **kwargs)
+        data = args[0] if args else kwargs.get("df")
+        with self.telemetry.span(method.__name__, "call", data=data) as event:
+            result = method(self, *args, **kwargs)
+            if isinstance(result, str):
+                event["html_bytes"] = len(result.encode("utf-8"))
+            return result
+
+    return wrapper
+
+class _ReportWriter:
+    """
+    Append-only writer for the report HTML file.
+
+    The file is opened once and kept open. The head of the template is written on creation and
+    every fragment is written at a tracked byte offset, immediately followed by the closing tail,
+    so the file on disk is always a complete, viewable document while appends stay O(fragment).
+
+    Args:
+        filepath (str): Path to the HTML file to be created.
+        head (str): Template markup preceding the content area.
+        tail (str): Template markup following the content area (closing tags and scripts).
+
+    Attributes:
+        marker (str): Markup kept between the content and the tail, replaced by the next write and
+            dropped on `close()` (the sequence number of a live report, see `LiveChannel`).
+    """
+
+    def __init__(self, filepath: str, head: str, tail: str) -> None:
+        self.filepath = filepath
+        self.marker = ""
+        self._tail = tail.encode("utf-8")
+        self._file = open(filepath, "wb")
+        self._file.write(head.encode("utf-8"))
+        self._offset = self._file.tell()
+        self._write_tail()
+
+        # Make sure the handle is released even if the report is never closed explicitly
+        self._finalizer = weakref.finalize(self, self._file.close)
+
+    def _write_tail(self) -> None:
+        self._file.write(self.marker.encode("utf-8") + self._tail)
+        self._file.truncate()
+        self._file.flush()
+
+    def write(self, fragment: Union[str, "Node"]) -> int:
+        """
+        Writes a fragment (or a rendered document node) at the current content offset and
+        re-appends the tail after it.
+
+        Args:
+            fragment (Union[str, Node]): The HTML fragment or node to append.
+
+        Returns:
+            int: Number of bytes appended.
+        """
+        if self._file.closed:
+            self._file = open(self.filepath, "r+b")
+            self._finalizer = weakref.finalize(self, self._file.close)
+
+        with telemetry_phase("write") as event:
+            start = self._offset
+            self._file.seek(self._offset)
+            if isinstance(fragment, Node):
+                # Nodes stream their pieces straight into the file buffer
+                fragment.render(lambda piece: self._file.write(piece.encode("utf-8")))
+            else:
+                self._file.write(fragment.encode("utf-8"))
+            self._offset = self._file.tell()
+            self._write_tail()
+            if event is not None:
+                event["bytes_written"] = self._offset - start
+        return self._offset - start
+
+    def close(self) -> None:
+        """Writes the final tail and closes the file handle."""
+        self.marker = ""
+        if self._file.closed:
+            return
+        self._file.seek(self._offset)
+        self._write_tail()
+        self._finalizer()
+
+class Node:
+    """
+    Base class of the in-memory report document tree.
+
+    Nodes only hold the data needed to produce their markup. Nothing is turned into HTML until the
+    tree is rendered, which happens once per `Report.render()` / `Report.save()` call (or once per
+    node when the report streams its content).
+
+    Args:
+        children (Optional[List[Node]], optional): Child nodes rendered inside this node. Defaults to None.
+    """
+
+    # Names of the `js_libraries` the node's own markup depends on
+    requires: List[str] = []
+
+    def __init__(self, children: Optional[List["Node"]] = None) -> None:
+        self.children = list(children) if children else []
+
+    def required_assets(self) -> List[str]:
+        """Returns the JavaScript libraries needed by this node and its subtree, in first-use order."""
+        names = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            names.extend(name for name in node.requires if name not in names)
+            stack.extend(reversed(node.children))
+        return names
+
+    def append(self, node: "Node") -> "Node":
+        self.children.append(node)
+        return node
+
+    def render(self, write) -> None:
+        """
+        Serializes the node by passing its markup, piece by piece, to `write`.
+
+        Args:
+            write (Callable[[str], Any]): Sink receiving the HTML fragments in document order.
+        """
+        for child in self.children:
+            child.render(write)
+
+    def to_html(self) -> str:
+        """Renders the node into a single HTML string."""
+        parts = []
+        self.render(parts.append)
+        return "".join(parts)
+
+class HTMLNode(Node):
+    """A raw HTML fragment, as passed to `Report.add_content`."""
+
+    def __init__(self, html: str, requires: Optional[List[str]] = None) -> None:
+        super().__init__()
+        self.html = html
+        self.requires = requires if requires is not None else detect_assets(str(html))
+
+    def render(self, write) -> None:
+        write(f"\n{self.html}\n")
+
+class SectionNode(Node):
+    """
+    A titled section. Content added after the section header becomes its children until a section
+    of the same or a higher level is started.
+    """
+
+    def __init__(self, title: str, level: int = 1, icon: str = "📁") -> None:
+        super().__init__()
+        self.title = title
+        self.level = level
+        self.icon = icon
+
+    def render_header(self, write) -> None:
+        write(textwrap.dedent(f"""
+        <div class="report-section level-{self.level}">
+            <div class="section-header">
+                <span class="icon">{self.icon}</span>
+                <span class="title">{self.title}</span>
+            </div>
+        </div>
+        """))
+
+    def render(self, write) -> None:
+        self.render_header(write)
+        super().render(write)
+
+class ColumnNode(Node):
+    """A grid column (`<div class="{class_name}">`) holding child nodes."""
+
+    def __init__(self, children: List[Node], class_name: str = "col") -> None:
+        super().__init__(children)
+        self.class_name = class_name
+
+    def render(self, write) -> None:
+        write(f'\n<div class="{self.class_name}">\n')
+        super().render(write)
+        write("\n</div>\n")
+
+class RowNode(Node):
+    """A grid row (`<div class="row">`) holding columns."""
+
+    def render(self, write) -> None:
+        write('\n<div class="row">\n')
+        super().render(write)
+        write("\n</div>\n")
+
+class CardNode(Node):
+    """
+    A styled card container.
+
+    Args:
+        children (List[Node]): The card body.
+        title (Optional[str], optional): Header text shown above the body. Defaults to None.
+        body_style (Optional[str], optional): Inline style of a wrapper div around the body
+            (e.g. scrolling). If None, the body is not wrapped. Defaults to None.
+        description (bool, optional): Whether to add the "Explaination" button below the body. Defaults to False.
+    """
+
+    def __init__(self, children: List[Node], title: Optional[str] = None,
+                 body_style: Optional[str] = None, description: bool = False) -> None:
+        super().__init__(children)
+        self.title = title
+        self.body_style = body_style
+        self.description = description
+
+    def render(self, write) -> None:
+        write('\n<div class="card">\n')
+        if self.title:
+            write(f'<div class="card-header">{self.title}</div>\n')
+        if self.body_style:
+            write(f'<div style="{self.body_style}">\n')
+        super().render(write)
+        if self.body_style:
+            write("\n</div>\n")
+        if self.description:
+            write('<div class="card-description">\n'
+                  '<button class="toggle-btn" onclick="openModal(this)" data-details="">Explaination</button>\n'
+                  '</div>\n')
+        write("\n</div>\n")
+
+class FigureNode(Node):
+    """A Plotly figure, converted to HTML only when the node is rendered."""
+
+    requires = ["plotly"]
+
+    def __init__(self, fig: PlotlyFigure) -> None:
+        super().__init__()
+        self.fig = fig
+
+    def render(self, write) -> None:
+        write(plotly_html(self.fig))
+
+class TableNode(Node):
+    """
+    A pandas DataFrame, converted to an HTML table only when the node is rendered.
+
+    The DataFrame is kept by reference, so changes made to it before rendering show up in the output.
+
+    Args:
+        df (pd.DataFrame): The DataFrame.
+        max_rows (int, optional): Maximum number of rows of the "html" table. Defaults to 20.
+        mode (str, optional): "html" writes a static table of at most `max_rows` rows; "virtual" embeds
+            every row once with `encode_table` and lets `report.js` draw the visible rows only, with
+            sorting and filtering. Defaults to "html".
+        max_height (int, optional): Height of the scrolling area of the "virtual" table. Defaults to 500.
+        payload (str, optional): Encoding of the numeric columns of the "virtual" table, see `encode_table`.
+            Defaults to "json".
+        payload_dtype (str, optional): Precision of binary payloads. Defaults to "float64".
+    """
+
+    def __init__(self, df: pd.DataFrame, max_rows: int = 20, mode: str = "html", max_height: int = 500,
+                 payload: str = "json", payload_dtype: str = "float64") -> None:
+        super().__init__()
+        self.df = df
+        self.max_rows = max_rows
+        self.mode = mode
+        self.max_height = max_height
+        self.payload = payload
+        self.payload_dtype = payload_dtype
+
+    def render(self, write) -> None:
+        if self.mode == "html":
+            with telemetry_phase("table_html", data=self.df):
+                html = self.df.to_html(max_rows=self.max_rows, escape=False, index=False)
+            write(html)
+            return
+        with telemetry_phase("table_html", data=self.df):
+            spec_id, payload_html = encode_table(self.df, self.payload, self.payload_dtype)
+        write(payload_html)
+        write(f'''
+<div class="virtual-table" data-table="{spec_id}">
+    <div class="virtual-table-toolbar">
+        <input type="search" class="virtual-table-filter" placeholder="Filter rows">
+        <span class="virtual-table-status"></span>
+    </div>
+    <div class="virtual-table-viewport" style="max-height: {self.max_height}px;">
+        <table class="dataframe"><thead></thead><tbody></tbody></table>
+    </div>
+</div>
+''')
+
+class Document(Node):
+    """
+    Root of the report document tree.
+
+    Appended sections nest according to their level, and any other node is attached to the most
+    recently opened section (or to the root before the first section).
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._open_sections: List[SectionNode] = []
+
+    def append(self, node: Node) -> Node:
+        if isinstance(node, SectionNode):
+            while self._open_sections and self._open_sections[-1].level >= node.level:
+                self._open_sections.pop()
+        parent = self._open_sections[-1] if self._open_sections else self
+        parent.children.append(node)
+        if isinstance(node, SectionNode):
+            self._open_sections.append(node)
+        return node
+
+    def sections(self, level: Optional[int] = None) -> List[SectionNode]:
+        """
+        Lists the sections of the document in document order.
+
+        Args:
+            level (Optional[int], optional): Only return sections of this level. Defaults to None (all levels).
+
+        Returns:
+            List[SectionNode]: The matching sections.
+        """
+        found = []
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, SectionNode):
+                if level is None or node.level == level:
+                    found.append(node)
+                stack.extend(reversed(node.children))
+        return found
+
+    def path(self) -> List[str]:
+        """Returns the titles of the open sections, outermost first (where the next node goes)."""
+        return [str(section.title) for section in self._open_sections]
+
+    def find(self, title: str) -> Optional[SectionNode]:
+        """Returns the first section with the given title, or None."""
+        return next((section for section in self.sections() if section.title == title), None)
+
+    def remove(self, node: Node) -> None:
+        """
+        Removes a node (and its subtree) from wherever it is attached in the document.
+
+        Raises:
+            ValueError: If the node is not part of the document.
+        """
+        stack = [self]
+        while stack:
+            parent = stack.pop()
+            if node in parent.children:
+                parent.children.remove(node)
+                # Sections below a removed one can no longer receive content
+                if node in self._open_sections:
+                    del self._open_sections[self._open_sections.index(node):]
+                return
+            stack.extend(parent.children)
+        raise ValueError("node is not part of this document")
+
+class LiveChannel:
+    """
+    Feed of the fragments appended to a streaming report, pushed to browsers as Server-Sent Events.
+
+    Each published fragment gets the next sequence number. The report file carries the number of the
+    last fragment it contains (see `marker`), so a page subscribes with `?since=<number>` and receives
+    exactly the fragments added after it was served; reconnecting clients resume from `Last-Event-ID`.
+    Clients too far behind the kept history, and every client after the document was rewritten as a
+    whole, are told to reload.
+
+    Args:
+        max_history (int, optional): Bytes of past events kept for late or reconnecting clients.
+            Defaults to 64 MiB.
+        keepalive (float, optional): Seconds between comments sent to idle clients, so proxies keep the
+            connection open. Defaults to 15.
+    """
+
+    def __init__(self, max_history: int = 64 << 20, keepalive: float = 15.0) -> None:
+        import threading
+        from collections import deque
+
+        self.max_history = max_history
+        self.keepalive = keepalive
+        # Also guards the report file, so a page is never read halfway through an append
+        self.condition = threading.Condition()
+        self.sequence = 0
+        self.closed = False
+        self._history: "deque[Tuple[int, bytes]]" = deque()
+        self._history_bytes = 0
+        # Clients that have not seen this sequence number must reload the page
+        self._floor = 0
+
+    @staticmethod
+    def _event(sequence: int, event: str, data: str) -> bytes:
+        lines = "".join(f"data: {line}\n" for line in re.split(r"\r\n|\r|\n", data))
+        return f"id: {sequence}\nevent: {event}\n{lines}\n".encode("utf-8")
+
+    def marker(self) -> str:
+        """Returns the script recording the current sequence number in the report file."""
+        # The marker may be written before report.js is loaded
+        return (f"<script>var PyReport = window.PyReport = window.PyReport || {{}}; "
+                f"PyReport.sequence = {self.sequence};</script>")
+
+    def _push(self, event: str, data: str) -> int:
+        with self.condition:
+            self.sequence += 1
+            message = self._event(self.sequence, event, data)
+            self._history.append((self.sequence, message))
+            self._history_bytes += len(message)
+            while self._history_bytes > self.max_history and len(self._history) > 1:
+                self._floor = self._history[0][0]
+                self._history_bytes -= len(self._history.popleft()[1])
+            self.condition.notify_all()
+            return self.sequence
+
+    def publish(self, fragment: str) -> int:
+        """
+        Sends an HTML fragment to every subscriber.
+
+        Args:
+            fragment (str): Markup appended to the report.
+
+        Returns:
+            int: The sequence number of the fragment.
+        """
+        return self._push("fragment", fragment)
+
+    def reload(self) -> int:
+        """Asks every subscriber to reload the page, e.g. after the whole report file was rewritten."""
+        with self.condition:
+            sequence = self._push("reload", "")
+            self._floor = sequence
+            return sequence
+
+    def events(self, since: int) -> Iterator[bytes]:
+        """
+        Yields the encoded events after `since`, waiting for new ones until the channel is closed.
+
+        Args:
+            since (int): Sequence number of the last fragment the client has.
+
+        Yields:
+            bytes: Server-Sent Events messages and keep-alive comments.
+        """
+        while True:
+            with self.condition:
+                if since < self._floor or since > self.sequence:
+                    # Missed events are gone (or the page is outdated); start from a fresh page
+                    yield self._event(self.sequence, "reload", "")
+                    return
+                pending = [message for sequence, message in self._history if sequence > since]
+                if not pending and not self.closed:
+                    self.condition.wait(self.keepalive)
+                    pending = [message for sequence, message in self._history if sequence > since]
+                if self.closed and not pending:
+                    return
+                since = max(since, self.sequence)
+            yield b"".join(pending) if pending else b": keepalive\n\n"
+
+    def close(self) -> None:
+        """Ends every subscription."""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+class ReportServer:
+    """
+    Threaded HTTP server for report files, started in the background.
+
+    Every request is handled on its own thread, so a slow client does not hold up the others.
+    Text files (HTML, scripts, stylesheets) are sent as gzip or, with the optional brotli package,
+    brotli variants compressed once and stored next to the file (`<name>.gz` / `<name>.br`, redone
+    when the file changes, and skipped when the directory is not writable). Responses carry an ETag, and `If-None-Match` requests for an unchanged
+    file get an empty 304. Files named after a random id (chart payloads) never change and are cached
+    by browsers for a year; everything else is revalidated. Uncompressed responses accept single
+    byte `Range` requests.
+
+    With a `LiveChannel`, the server also streams its events at `live_path`, and HTML pages are read
+    whole while the channel is locked, so they always match a sequence number.
+
+    Args:
+        directory (str): Directory to serve.
+        port (int, optional): Port to listen on; 0 lets the system pick a free one. Defaults to 0.
+        host (str, optional): Interface to bind, "" for all of them. Defaults to "".
+        compress (bool, optional): Whether to send compressed variants to clients accepting them. Defaults to True.
+        quiet (bool, optional): Whether to silence the per-request log lines. Defaults to False.
+        live (Optional[LiveChannel], optional): Channel of a report receiving content. Defaults to None.
+    """
+
+    compressible = (".html", ".htm", ".js", ".css", ".json", ".svg", ".txt", ".csv")
+    # Smaller files are not worth a compressed variant
+    min_compress_size = 1024
+    # A 32-digit hex id (uuid4 hex) in the name marks files whose content never changes
+    immutable_name = re.compile(r"[0-9a-f]{32}")
+    chunk_size = 1 << 16
+    live_path = "/__live__"
+
+    def __init__(self, directory: str, port: int = 0, host: str = "", compress: bool = True,
+                 quiet: bool = False, live: Optional[LiveChannel] = None) -> None:
+        import http.server
+        import importlib.util
+        import threading
+
+        self.directory = os.path.abspath(directory)
+        self.compress = compress
+        self.live = live
+        self.encodings = (["br"] if importlib.util.find_spec("brotli") else []) + ["gzip"]
+        self._lock = threading.Lock()
+        self._file_locks: Dict[str, "threading.Lock"] = {}
+        self._thread = None
+        server = self
+
+        class Handler(http.server.SimpleHTTPRequestHandler):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, directory=server.directory, **kwargs)
+
+            def log_message(self, format, *args):
+                if not quiet:
+                    super().log_message(format, *args)
+
+            def do_GET(self):
+                if server.live is not None and self.path.split("?")[0] == server.live_path:
+                    server._send_events(self)
+                else:
+                    super().do_GET()
+
+            def send_head(self):
+                path = self.translate_path(self.path)
+                if os.path.isdir(path) and self.path.split("?")[0].endswith("/"):
+                    index = os.path.join(path, "index.html")
+                    path = index if os.path.isfile(index) else path
+                if not os.path.isfile(path):
+                    # Directory redirects and listings, and 404s
+                    return super().send_head()
+                if server.live is not None and path.endswith((".html", ".htm")):
+                    return server._send_snapshot(self, path)
+                return server._send_file(self, path)
+
+            def copyfile(self, source, outputfile):
+                remaining = getattr(self, "remaining", None)
+                if remaining is None:
+                    # Responses not sent by the server itself, e.g. directory listings
+                    return super().copyfile(source, outputfile)
+                self.remaining = None
+                while remaining > 0:
+                    chunk = source.read(min(server.chunk_size, remaining))
+                    if not chunk:
+                        break
+                    try:
+                        outputfile.write(chunk)
+                    except ConnectionError:
+                        # The browser cancelled the request, e.g. after a page navigation
+                        break
+                    remaining -= len(chunk)
+
+        self.httpd = http.server.ThreadingHTTPServer((host, port), Handler)
+        self.host = host or "localhost"
+        self.port = self.httpd.server_address[1]
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        return f"http://{self.host}:{self.port}/"
+
+    def _variant(self, path: str, encoding: str) -> Optional[str]:
+        """
+        Returns the path of the compressed variant of a file, (re)writing it if it is missing or
+        stale, or None if it cannot be written (e.g. in a read-only directory).
+
+        The file is compressed in chunks, under a lock of its own so that other files are served
+        meanwhile.
+        """
+        import shutil
+        import threading
+
+        variant = path + (".br" if encoding == "br" else ".gz")
+        with self._lock:
+            lock = self._file_locks.setdefault(variant, threading.Lock())
+        with lock:
+            try:
+                if os.path.isfile(variant) and os.path.getmtime(variant) >= os.path.getmtime(path):
+                    return variant
+                with open(path, "rb") as source, open(variant + ".tmp", "wb") as target:
+                    if encoding == "br":
+                        import brotli
+                        compressor = brotli.Compressor()
+                        for chunk in iter(lambda: source.read(self.chunk_size), b""):
+                            target.write(compressor.process(chunk))
+                        target.write(compressor.finish())
+                    else:
+                        import gzip
+                        with gzip.GzipFile(fileobj=target, mode="wb", compresslevel=6, mtime=0) as stream:
+                            shutil.copyfileobj(source, stream, self.chunk_size)
+                os.replace(variant + ".tmp", variant)
+            except OSError:
+                with contextlib.suppress(OSError):
+                    os.remove(variant + ".tmp")
+                return None
+        return variant
+
+    def _send_file(self, handler, path: str):
+        """Sends the headers of a file response and returns the file positioned at the body, or None."""
+        from email.utils import formatdate
+
+        stat = os.stat(path)
+        headers = handler.headers
+        byte_range = headers.get("Range")
+        encoding = None
+        if self.compress and path.endswith(self.compressible) and stat.st_size >= self.min_compress_size:
+            # Ranges refer to the uncompressed bytes
+            if not byte_range:
+                accepted = headers.get("Accept-Encoding", "")
+                encoding = next((name for name in self.encodings if name in accepted), None)
+        variant = self._variant(path, encoding) if encoding else None
+        if variant is None:
+            # Not compressible, or the variant could not be written: the file is sent as is
+            encoding = None
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{"-" + encoding if encoding else ""}"'
+        immutable = self.immutable_name.search(os.path.basename(path)) is not None
+        cache_control = "public, max-age=31536000, immutable" if immutable else "no-cache"
+
+        def common_headers():
+            handler.send_header("ETag", etag)
+            handler.send_header("Cache-Control", cache_control)
+            if path.endswith(self.compressible):
+                handler.send_header("Vary", "Accept-Encoding")
+
+        if etag in [tag.strip() for tag in headers.get("If-None-Match", "").split(",")]:
+            handler.send_response(304)
+            common_headers()
+            handler.end_headers()
+            return None
+
+        f = open(variant or path, "rb")
+        size = os.fstat(f.fileno()).st_size
+        start, end = 0, size - 1
+        # Only single ranges are served; other forms (and stale If-Range) get the whole file
+        match = re.fullmatch(r"bytes=(\d*)-(\d*)", (byte_range or "").strip())
+        if match and (match.group(1) or match.group(2)) and headers.get("If-Range", etag) == etag:
+            if match.group(1):
+                start = int(match.group(1))
+                end = min(int(match.group(2)), size - 1) if match.group(2) else size - 1
+            else:
+                start = max(size - int(match.group(2)), 0)
+            if start > end:
+                f.close()
+                handler.send_response(416)
+                handler.send_header("Content-Range", f"bytes */{size}")
+                handler.send_header("Content-Length", "0")
+                handler.end_headers()
+                return None
+            handler.send_response(206)
+            handler.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        else:
+            handler.send_response(200)
+
+        handler.send_header("Content-Type", handler.guess_type(path))
+        handler.send_header("Content-Length", str(end - start + 1))
+        handler.send_header("Last-Modified", formatdate(stat.st_mtime, usegmt=True))
+        handler.send_header("Accept-Ranges", "bytes")
+        if encoding:
+            handler.send_header("Content-Encoding", encoding)
+        common_headers()
+        handler.end_headers()
+        f.seek(start)
+        handler.remaining = end - start + 1
+        return f
+
+    def _send_snapshot(self, handler, path: str):
+        """Sends a page of a live report as read in one go, uncached, and returns its body."""
+        import io
+
+        with self.live.condition:
+            with open(path, "rb") as f:
+                data = f.read()
+        encoding = None
+        if self.compress and "gzip" in handler.headers.get("Accept-Encoding", ""):
+            import gzip
+            data = gzip.compress(data, compresslevel=6, mtime=0)
+            encoding = "gzip"
+
+        handler.send_response(200)
+        handler.send_header("Content-Type", handler.guess_type(path))
+        handler.send_header("Content-Length", str(len(data)))
+        handler.send_header("Cache-Control", "no-store")
+        handler.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            handler.send_header("Content-Encoding", encoding)
+        handler.end_headers()
+        handler.remaining = len(data)
+        return io.BytesIO(data)
+
+    def _send_events(self, handler) -> None:
+        """Streams the live channel to a client as Server-Sent Events until either side closes."""
+        from urllib.parse import parse_qs, urlsplit
+
+        # Reconnecting browsers send the id of the last event they received
+        query = parse_qs(urlsplit(handler.path).query)
+        since = handler.headers.get("Last-Event-ID") or query.get("since", ["0"])[0]
+        try:
+            since = int(since)
+        except ValueError:
+            handler.send_error(400, "since must be an integer")
+            return
+
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.send_header("Cache-Control", "no-store")
+        handler.end_headers()
+        handler.close_connection = True
+        try:
+            for message in self.live.events(since):
+                handler.wfile.write(message)
+                handler.wfile.flush()
+        except ConnectionError:
+            pass
+
+    def start(self) -> "ReportServer":
+        """Starts serving on a background thread and returns the server."""
+        import threading
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving, ends the live subscriptions, waits for the server thread and releases the port."""
+        if self.live is not None:
+            self.live.close()
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.httpd.server_close()
+
+    def __enter__(self) -> "ReportServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
 
 class Report:
+    # Number of DataFrame profiles kept by `Report.profile`
+    max_profiles = 8
+
     def __init__(self, title: str, author: str, data_source: str, objective: str,
-                 filepath: str = "./eda-report.html") -> None:
+                 filepath: str = "./eda-report.html", deferred: bool = False,
+                 css_url: Optional[str] = None, js_url: Optional[str] = None,
+                 asset_mode: str = "inline", workers: Optional[int] = None,
+                 executor: str = "thread", output: str = "file",
+                 fragment_cache: Union[bool, str, FragmentCache] = False,
+                 telemetry: Union[bool, Telemetry] = False, chart_budget: Optional[int] = None,
+                 report_budget: Optional[int] = None, over_budget: str = "degrade") -> None:
         """
         Initializes a new HTML report template with inlined CSS and JS.
 
+        The CSS and JS are read from the files bundled with the package, so no network request is
+        made unless `css_url` / `js_url` are given.
+
+        Every `add_*` call appends a node to `self.document`. By default each node is streamed to
+        `filepath` as soon as it is added; with `deferred=True` nothing is written until `save()`.
+
         Args:
             title (str): Title of the report.
             author (str): Author's name.
             data_source (str): Source of the data used in the report.
             objective (str): Purpose or goal of the report.
             filepath (str, optional): Path to the HTML file to be created. Defaults to './eda-report.html'.
+            deferred (bool, optional): If True, builds the document in memory and writes it once on
+                `save()` / `close()`. Defaults to False.
+            css_url (Optional[str], optional): Load the stylesheet from this URL (cached on disk)
+                instead of the bundled `css/report.css`. Defaults to None.
+            js_url (Optional[str], optional): Load the script from this URL (cached on disk)
+                instead of the bundled `js/report.js`. Defaults to None.
+            asset_mode (str, optional): How chart libraries (plotly.js, Highcharts, Vega) are embedded,
+                each exactly once per report: "inline", "file" (sibling `<report>_files/` directory)
+                or "cdn". Defaults to "inline".
+            workers (Optional[int], optional): Default number of workers building per-column charts in
+                parallel; None or 1 builds them one after another and -1 uses every CPU. Defaults to None.
+            executor (str, optional): Pool used by `workers`, "thread" or "process". Process workers
+                receive one column slice (or its precomputed statistics) per chart, never the whole
+                DataFrame. Defaults to "thread".
+            output (str, optional): "file" writes one HTML file; "pages" writes the directory `filepath`
+                (without its ".html" suffix) on `save()` / `close()`, with one page per level-1 section,
+                an `index.html` holding the content before the first section and the navigation, the
+                stylesheet, script and chart libraries as shared files in `assets/` ("cdn" libraries
+                stay on their CDN), and each chart's data in `payloads/`, loaded when the chart nears
+                the viewport. "pages" implies `deferred`. Defaults to "file".
+            fragment_cache (Union[bool, str, FragmentCache], optional): Reuse the HTML of chart methods
+                whose data and arguments did not change from an on-disk `FragmentCache`: True uses the
+                default directory, a string the given one. Cached charts get deterministic ids.
+                Defaults to False.
+            telemetry (Union[bool, Telemetry], optional): Record the timings of every call and of its
+                phases in `report.telemetry` (a new `Telemetry` if True), exportable with `summary()`
+                and `to_chrome_trace()`. Defaults to False.
+            chart_budget (Optional[int], optional): Maximum HTML bytes of one chart method call. Before
+                rendering, the size is estimated from the data (see `estimate_chart_bytes`); a chart over
+                budget is switched to its aggregated / downsampled form (`chart_degradations`) or refused.
+                Defaults to None (no limit).
+            report_budget (Optional[int], optional): Maximum bytes of the report content, chart libraries
+                included. Charts also degrade to fit what is left of it, and content that does not fit
+                is refused. `size_ledger()` shows which sections used it. Defaults to None (no limit).
+            over_budget (str, optional): "degrade" (aggregate or downsample charts, then refuse),
+                "raise" (refuse at once, with `BudgetExceededError`) or "warn" (emit anyway, with a
+                warning). Defaults to "degrade".
         """      
+        if executor not in ("thread", "process"):
+            raise ValueError(f"executor must be 'thread' or 'process', got {executor!r}")
+        if output not in ("file", "pages"):
+            raise ValueError(f"output must be 'file' or 'pages', got {output!r}")
+        if over_budget not in ("degrade", "raise", "warn"):
+            raise ValueError(f"over_budget must be 'degrade', 'raise' or 'warn', got {over_budget!r}")
+        self.output = output
+        self.title = title
+        self.author = author
+        if output == "pages":
+            self.directory = filepath[:-len(".html")] if filepath.endswith(".html") else filepath
+            filepath = os.path.join(self.directory, "index.html")
+            deferred = True
         self.filepath = filepath
+        self.workers = workers
+        self.executor = executor
+        self.telemetry: Optional[Telemetry] = (
+            telemetry if isinstance(telemetry, Telemetry) else Telemetry() if telemetry else None)
+        if isinstance(fragment_cache, FragmentCache):
+            self.fragment_cache: Optional[FragmentCache] = fragment_cache
+        elif isinstance(fragment_cache, str):
+            self.fragment_cache = FragmentCache(fragment_cache)
+        else:
+            self.fragment_cache = FragmentCache() if fragment_cache else None
+        # Occurrences of each cached chart in this report, see `cached_fragment`
+        self._fragment_uses: Dict[str, int] = {}
+        self.chart_budget = chart_budget
+        self.report_budget = report_budget
+        self.over_budget = over_budget
+        # One entry per added node (and per chart library written): section, source and bytes
+        self.ledger: List[dict] = []
+        # Recent chart fragments by identity, so the ledger can name the method a fragment came from
+        self._fragment_sources: "OrderedDict[int, Tuple[str, str]]" = OrderedDict()
                    
-        self.css_content = requests.get(css_url).text
-        self.js_content = requests.get(js_url).text
+        self.css_content = load_asset(css_path, css_url)
+        self.js_content = load_asset(js_path, js_url)
 
         self.template = f"""
         <!DOCTYPE html>
@@ -100,36 +3475,310 @@ class Report:
         </html>
         """
 
-        with open(self.filepath, "w") as f:
-            f.write(self.template)
+        # Everything before the placeholder is written once; everything after it is the
+        # closing tail that the writer keeps behind the last appended fragment.
+        self._head, self._tail = self.template.split("<content></content>")
+
+        self.deferred = deferred
+        self.document = Document()
+        self._profiles: "OrderedDict[tuple, ColumnProfile]" = OrderedDict()
+        self.assets = AssetManager(asset_mode, self.filepath)
+        self._notebook_assets = AssetManager("cdn" if asset_mode == "file" else asset_mode, self.filepath)
+        self._writer = None if deferred else _ReportWriter(self.filepath, self._head, self._tail)
+        # Set by `run_server(live=True)`
+        self._live: Optional[LiveChannel] = None
 
         report_info = self._show_report_info(title, author, data_source, objective)
 
         self.add_content(report_info)
         
-        display(Markdown(f"[View Report]({self.filepath})"))
+        _display(f"[View Report]({self.filepath})", markdown=True)
+
+    def _append(self, node: Node) -> Node:
+        """
+        Attaches a node to the document tree and, unless the report is deferred, streams it to the file.
+
+        Args:
+            node (Node): The node to add.
+
+        Returns:
+            Node: The added node.
+
+        Raises:
+            BudgetExceededError: If the node does not fit in what is left of `report_budget`.
+        """
+        self.document.append(node)
+        section = " / ".join(self.document.path())
+        entry = {"section": section, "source": self._fragment_source(node), "bytes": None, "node": node}
+        entries = [entry]
+        emitted = set(self.assets.emitted)
+        new_assets = [name for name in self.assets._resolve(node.required_assets()) if name not in emitted]
+        # Libraries the node needs are written right before their first use (on save when deferred)
+        asset_tags = "" if self.deferred else self.assets.tags(node.required_assets())
+        if new_assets:
+            # Charged where they are first needed, whatever the output mode
+            self.assets.emitted.update(new_assets)
+            entries.insert(0, {"section": section, "source": "assets", "node": None,
+                               "bytes": sum(self.assets.output_bytes(name) for name in new_assets)})
+        if self._live is not None and self._live.closed:
+            self._live = None
+            self._writer.marker = ""
+
+        fragment = None
+        if self.report_budget is not None or self._live is not None:
+            fragment = node.to_html()
+            entry["bytes"] = len(fragment.encode("utf-8"))
+        if self.report_budget is not None:
+            size = sum(item["bytes"] for item in entries)
+            used = self._ledger_bytes()
+            if used + size > self.report_budget:
+                message = (f"Adding {size:,} bytes to section {section or '(top)'!r} would exceed the report "
+                           f"budget of {self.report_budget:,} bytes ({used:,} used, mostly by "
+                           f"{self._largest_sections()}). See `size_ledger()`.")
+                if self.over_budget != "warn":
+                    self.document.remove(node)
+                    self.assets.emitted = emitted
+                    raise BudgetExceededError(message)
+                warnings.warn(message)
+        self.ledger.extend(entries)
+        if self.deferred:
+            return node
+
+        if self._live is None:
+            if asset_tags:
+                self._writer.write(asset_tags)
+            entry["bytes"] = self._writer.write(fragment if fragment is not None else node)
+        else:
+            # Live pages receive exactly the markup appended to the file
+            fragment = asset_tags + fragment
+            with self._live.condition:
+                self._live.publish(fragment)
+                self._writer.marker = self._live.marker()
+                self._writer.write(fragment)
+        return node
+
+    def _fragment_source(self, node: Node) -> str:
+        """Names what produced a node for the ledger: the chart method of a fragment, or the node type."""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, HTMLNode) and id(current.html) in self._fragment_sources:
+                html, label = self._fragment_sources[id(current.html)]
+                if html is current.html:
+                    return label
+            stack.extend(current.children)
+        return type(node).__name__.replace("Node", "").lower()
+
+    def _register_fragment(self, html: Optional[str], label: str) -> Optional[str]:
+        """Remembers which chart method returned `html`, see `_fragment_source`."""
+        if isinstance(html, str):
+            self._fragment_sources[id(html)] = (html, label)
+            while len(self._fragment_sources) > 64:
+                self._fragment_sources.popitem(last=False)
+        return html
+
+    def _ledger_bytes(self) -> int:
+        return sum(entry["bytes"] or 0 for entry in self.ledger)
+
+    def _largest_sections(self, count: int = 3) -> str:
+        table = self.size_ledger()
+        return ", ".join(f"{row.section or '(top)'!r} ({row.bytes:,} bytes)" for row in table.head(count).itertuples())
+
+    def _chart_budget(self) -> Optional[int]:
+        """The budget of the next chart: the smaller of `chart_budget` and what is left of `report_budget`."""
+        budgets = [self.chart_budget] if self.chart_budget is not None else []
+        if self.report_budget is not None:
+            budgets.append(max(self.report_budget - self._ledger_bytes(), 0))
+        return min(budgets) if budgets else None
+
+    def size_ledger(self, by: str = "section") -> pd.DataFrame:
+        """
+        Summarizes which parts of the report its bytes went to, largest first.
+
+        Sizes are measured as nodes are written (or, for a deferred report without `report_budget`,
+        by rendering them now). Chart libraries count as the "assets" source of the section where
+        they were first needed.
+
+        Args:
+            by (str, optional): "section" (the path of section titles, "" before the first section),
+                "source" (chart method, "assets", or node type such as "table" or "html"), or "entry"
+                for one row per added node. Defaults to "section".
 
+        Returns:
+            pd.DataFrame: Bytes, number of nodes and share of the total per group.
+
+        Raises:
+            ValueError: If `by` is not "section", "source" or "entry".
+        """
+        if by not in ("section", "source", "entry"):
+            raise ValueError(f"by must be 'section', 'source' or 'entry', got {by!r}")
+        for entry in self.ledger:
+            if entry["bytes"] is None:
+                entry["bytes"] = len(entry["node"].to_html().encode("utf-8"))
+        table = pd.DataFrame([{key: entry[key] for key in ("section", "source", "bytes")} for entry in self.ledger],
+                             columns=["section", "source", "bytes"])
+        if by != "entry":
+            table = table.groupby(by, sort=False).agg(bytes=("bytes", "sum"), nodes=("bytes", "size")).reset_index()
+        total = table["bytes"].sum()
+        table["share"] = table["bytes"] / total if total else 0.0
+        return table.sort_values("bytes", ascending=False, ignore_index=True)
+
+    @traced
     def add_content(self, content: Union[str, None]) -> None:
         """
-        Inserts the provided HTML content into the report by replacing the <content></content> placeholder.
+        Appends the provided HTML content to the report, right before the closing tail.
+
+        The report file is kept open by a streaming writer, so each call only writes the new
+        fragment (plus the constant-size tail) instead of re-reading and rewriting the whole file.
+        In deferred mode the content is only added to the document tree until `save()` is called.
 
         Args:
             content (str): The HTML content to insert into the report.
         """
-        with open(self.filepath, "r") as f:
-            full_html = f.read()
+        self._append(HTMLNode(content))
+
+    def render(self) -> str:
+        """
+        Renders the whole document tree into a complete HTML page.
+
+        Returns:
+            str: The report HTML.
+        """
+        assets = AssetManager(self.assets.mode, self.filepath)
+        asset_tags = assets.tags(self.document.required_assets())
+        return self._head + asset_tags + self.document.to_html() + self._tail
+
+    @traced
+    def save(self, filepath: Optional[str] = None) -> None:
+        """
+        Walks the document tree once and writes the complete report through a single buffered writer.
+
+        Sections and nodes that were reordered or removed from `report.document` are written as they
+        are now, which makes it cheap to restructure a report before committing it to disk.
+
+        Args:
+            filepath (Optional[str], optional): Destination file (directory with `output="pages"`).
+                Defaults to the report's `filepath`.
+        """
+        if self.output == "pages":
+            self._save_pages(filepath or self.directory)
+            return
+
+        filepath = filepath or self.filepath
+        same_file = os.path.abspath(filepath) == os.path.abspath(self.filepath)
+        if same_file and self._writer is not None:
+            self._writer.close()
+
+        assets = AssetManager(self.assets.mode, filepath)
+        writer = _ReportWriter(filepath, self._head, self._tail)
+        writer.write(assets.tags(self.document.required_assets()))
+        writer.write(self.document)
+
+        if same_file and not self.deferred:
+            # Keep streaming subsequent content after the re-rendered document
+            self._writer = writer
+            self.assets = assets
+            if self._live is not None and not self._live.closed:
+                with self._live.condition:
+                    self._live.reload()
+                    writer.marker = self._live.marker()
+                    writer.write("")
+        else:
+            writer.close()
+
+    def _save_pages(self, directory: str) -> None:
+        """
+        Writes the report as a directory of pages, one per level-1 section, see `output="pages"`.
+
+        Each page is rendered one top-level node at a time, and the data of its charts and tables
+        is moved to `payloads/` with `externalize_payloads`.
+
+        Args:
+            directory (str): Destination directory.
+        """
+        os.makedirs(os.path.join(directory, "assets"), exist_ok=True)
+        for name, content in (("report.css", self.css_content), ("report.js", self.js_content)):
+            with open(os.path.join(directory, "assets", name), "w", encoding="utf-8") as f:
+                f.write(content)
+
+        sections = [node for node in self.document.children if isinstance(node, SectionNode)]
+        overview = [node for node in self.document.children if not isinstance(node, SectionNode)]
+        pages = [("index.html", "Overview", overview)]
+        for i, section in enumerate(sections, start=1):
+            slug = re.sub(r"[^\w]+", "-", str(section.title).lower()).strip("-")
+            pages.append((f"{i:02d}-{slug or 'section'}.html", section.title, [section]))
+
+        contents = "".join(
+            f'<li><a href="{filename}">{title}</a>'
+            + "".join(f'<div class="report-toc-sub">{sub.title}</div>'
+                      for sub in section.children if isinstance(sub, SectionNode))
+            + "</li>"
+            for (filename, title, _), section in zip(pages[1:], sections))
+        toc = (CardNode([HTMLNode(f'<ul class="report-toc">{contents}</ul>')], title="Contents")
+               if sections else None)
+
+        # "inline" libraries are shared files too, so each page only loads what it uses
+        mode = "cdn" if self.assets.mode == "cdn" else "file"
+        written: set = set()
+        for filename, title, nodes in pages:
+            nav = "".join(f'<a href="{name}" class="{"active" if name == filename else ""}">{label}</a>'
+                          for name, label, _ in pages)
+            if toc is not None and filename == "index.html":
+                nodes = nodes + [RowNode([ColumnNode([toc])])]
+            required = []
+            for node in nodes:
+                required.extend(name for name in node.required_assets() if name not in required)
+            assets = AssetManager(mode, os.path.join(directory, filename), assets_dir="assets", written=written)
+
+            with open(os.path.join(directory, filename), "w", encoding="utf-8") as f:
+                f.write(textwrap.dedent(f"""\
+                <!DOCTYPE html>
+                <html lang="en">
+                <head>
+                    <meta charset="UTF-8">
+                    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+                    <meta name="author" content="{self.author}">
+                    <title>{title} - {self.title}</title>
+                    <link rel="stylesheet" href="assets/report.css">
+                    <script>
+                        var PyReport = window.PyReport = window.PyReport || {{}};
+                        PyReport.payloadBase = "payloads/";
+                    </script>
+                </head>
+                <body>
+                    <nav class="report-nav">{nav}</nav>
+                    <div class="container-fluid">
+                """))
+                f.write(assets.tags(required))
+                for node in nodes:
+                    f.write(externalize_payloads(node.to_html(), directory))
+                f.write(textwrap.dedent("""
+                    </div>
+                    <script src="assets/report.js"></script>
+                </body>
+                </html>
+                """))
+
+    @traced
+    def close(self) -> None:
+        """
+        Finalizes the report file and releases the underlying file handle.
 
-        content = f"""
-        {content}
-        <content></content>
+        Content added after `close()` reopens the file and keeps appending at the tracked offset.
+        For a deferred report, closing saves the document.
         """
+        if self.deferred:
+            self.save()
+        else:
+            self._writer.close()
 
-        # Replace the placeholder using a regular expression
-        full_html = full_html.replace("<content></content>", content)
+    def __enter__(self) -> "Report":
+        return self
 
-        with open(self.filepath, "w") as f:
-            f.write(full_html)
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
+    @traced
     def add_section(self, title: str, level: int = 1, icon: str = "📁",
                     return_html: bool = False) -> Union[None, str]:
         """
@@ -145,21 +3794,14 @@ class Report:
             Union[None, str]: Returns HTML if return_html is True; otherwise, adds it directly to the report.
         """
         assert 1 <= level <= 5, "Level must be between 1 and 5"
-        full_html = f"""
-        <div class="report-section level-{level}">
-            <div class="section-header">
-                <span class="icon">{icon}</span>
-                <span class="title">{title}</span>
-            </div>
-        </div>
-        """
-        full_html = textwrap.dedent(full_html)
+        section = SectionNode(title, level=level, icon=icon)
 
         if return_html:
-            return full_html
+            return section.to_html()
 
-        self.add_content(full_html)
+        self._append(section)
     
+    @traced
     def add_row(self, contents: List[str], classes: Optional[Union[List[str], str]] = None) -> None:
         """
         Adds a row of HTML content to the report layout using Bootstrap-like column classes.
@@ -182,22 +3824,14 @@ class Report:
         elif len(contents) != len(classes):
             raise ValueError("Length of cols and classes must be equal!!!")
     
-        full_contents = ""
-        for content, class_name in zip(contents, classes):
-            full_contents += f"""
-            <div class="{class_name}">
-                {content}
-            </div>
-            """
-    
-        full_html = f"""
-        <div class="row">
-            {full_contents}
-        </div>
-        """
+        row = RowNode([
+            ColumnNode([HTMLNode(content)], class_name=class_name)
+            for content, class_name in zip(contents, classes)
+        ])
         
-        self.add_content(full_html)
+        self._append(row)
     
+    @traced
     def add_column(self, content: str, card: bool = True) -> None:
         """
         Wraps the given HTML content inside a styled column and card container,
@@ -212,26 +3846,14 @@ class Report:
             `True`, which is the default behavior.
 
         Returns:
-            None: The function modifies the report in-place by injecting formatted HTML via `self.add_content`.
+            None: The function modifies the report in-place by appending the column to the document.
         """
         
+        node = HTMLNode(content)
         if card:
-            content = f"""
-            <div class="card">
-                <div style="overflow: auto;">
-                    {content}
-                </div>
-            </div>
-            """
+            node = CardNode([node], body_style="overflow: auto;")
         
-        full_html = f"""
-        <div class="row">
-            <div class="col">
-                {content}
-            </div>
-        </div>
-        """
-        self.add_content(full_html)
+        self._append(RowNode([ColumnNode([node])]))
     
     def _show_report_info(self, title: str, author: str, data_source: str,
                          objective: str, return_html: bool = True) -> Optional[str]:
@@ -263,32 +3885,100 @@ class Report:
         </div>
         """
         html = textwrap.dedent(html)
-        display(HTML(html))
+        _display(html)
 
         if return_html:
             return html
     
-    def _render_in_notebook(self, html_content: str) -> None:
+    def profile(self, df: DataSource, quantile_accuracy: Optional[float] = None) -> ColumnProfile:
+        """
+        Returns the `ColumnProfile` of a DataFrame, computing it on first use.
+
+        Profiles are cached by DataFrame identity and structure (`dataframe_fingerprint`), so every
+        plotting method called on the same DataFrame reuses its scans; a reused profile is
+        `refresh`ed first, which recomputes the columns edited in place since. Files are keyed by
+        path, modification time and size, and other chunk iterables by identity, so a one-shot
+        iterator can be passed to several methods after its first (and only) pass. A cached profile
+        is reused when its quartiles are at least as accurate as `quantile_accuracy` asks (always,
+        for one-shot iterators). The most recently used `max_profiles` profiles are kept.
+
+        Args:
+            df (DataSource): The DataFrame, DataFrame chunks or CSV / parquet path.
+            quantile_accuracy (Optional[float], optional): Rank error bound of sketched quartiles, see
+                `ColumnProfile`. Defaults to None (exact quartiles for DataFrames).
+
+        Returns:
+            ColumnProfile: The column statistics of `df`.
+        """
+        if isinstance(df, pd.DataFrame):
+            key = (id(df), dataframe_fingerprint(df))
+        elif isinstance(df, (str, os.PathLike)):
+            stat = os.stat(df)
+            key = (os.path.abspath(df), stat.st_mtime_ns, stat.st_size)
+        else:
+            # The profile references the iterable, so its id is not reused while cached
+            key = (id(df),)
+        profile = self._profiles.pop(key, None)
+        one_shot = len(key) == 1
+        if profile is None or not (one_shot or profile.quantiles_within(quantile_accuracy)):
+            with telemetry_phase("profile", data=df):
+                profile = ColumnProfile(df, quantile_accuracy=quantile_accuracy)
+        elif profile.df is not None:
+            with telemetry_phase("profile.refresh", data=df):
+                profile.refresh()
+        self._profiles[key] = profile
+        while len(self._profiles) > self.max_profiles:
+            self._profiles.popitem(last=False)
+        return profile
+
+    def _map_columns(self, func, tasks: List[tuple], workers: Optional[int] = None) -> list:
+        """
+        Builds one chart per task with `map_columns`, using the report's `workers` unless overridden.
+
+        Args:
+            func: The module-level chart builder.
+            tasks (List[tuple]): Arguments of each chart, in column order.
+            workers (Optional[int], optional): Number of workers for this call. Defaults to `self.workers`.
+
+        Returns:
+            list: The charts, in the order of `tasks`.
+        """
+        return map_columns(func, tasks, self.workers if workers is None else workers, self.executor)
+
+    def _render_in_notebook(self, html_content: str, requires: Optional[List[str]] = None) -> None:
         """
         Renders the current report content inline in a Jupyter Notebook,
         including custom CSS and JS styles.
+
+        Chart libraries are included the first time this report displays a chart needing them.
         
         Args:
             html_content (str): The HTML content to be rendered.
+            requires (Optional[List[str]], optional): Libraries used by the content. Detected from
+                the markup if not given.
         """
+        with telemetry_phase("display"):
+            self._display_in_notebook(html_content, requires)
+
+    def _display_in_notebook(self, html_content: str, requires: Optional[List[str]]) -> None:
+        if requires is None:
+            requires = detect_assets(html_content)
         full_render = f"""
         <style>
         {self.css_content}
         </style>
+        {self._notebook_assets.tags(requires)}
         {html_content}
         <script>
         {self.js_content}
         </script>
         """
-        display(HTML(full_render))
+        _display(full_render)
     
+    @traced
     def add_dataframe(self, df: pd.DataFrame, title: Optional[str] = None,
-                      max_rows: int = 20, max_height: int = 500,
+                      max_rows: int = 20, max_height: int = 500, mode: str = "html",
+                      payload: str = "json", payload_dtype: str = "float64",
                       return_html: bool = False, add_row: bool = True) -> Optional[str]:
         """
         Add a pandas DataFrame to the HTML report as a styled card component.
@@ -296,64 +3986,47 @@ class Report:
         Args:
             df (pd.DataFrame): The DataFrame to be rendered.
             title (Optional[str], optional): Optional title to display above the table. Defaults to None.
-            max_rows (int, optional): Maximum number of rows to display in the HTML table. Defaults to 20.
+            max_rows (int, optional): Maximum number of rows to display in the HTML table. Ignored in the
+                "virtual" mode, which keeps every row. Defaults to 20.
             max_height (int, optional): Maximum height of the table container (scrolls if exceeded). Defaults to 500.
+            mode (str, optional): "html" writes a static HTML table; "virtual" embeds the rows once as a
+                columnar payload and renders only the rows in view, with sorting (click a header) and
+                filtering in the browser, so large tables do not build a huge DOM. Cells of the "virtual"
+                table are shown as text, not HTML. Defaults to "html".
+            payload (str, optional): Encoding of the numeric columns in the "virtual" mode, "json" or "binary"
+                (base64 typed arrays). Defaults to "json".
+            payload_dtype (str, optional): Precision of binary payloads, "float32" or "float64". Defaults to "float64".
             return_html (bool, optional): If True, returns the HTML string instead of adding to report content. Defaults to False.
-            add_row (bool, optional): If True, adds a row to the report content. Defaults to True.
-    
-        Returns:
-            Optional[str]: Rendered HTML string if return_html is True, else None.
-        """
-        
-        if not isinstance(df, pd.DataFrame):
-            raise TypeError("df must be a pandas DataFrame")
-            
-        # Generate the HTML table from the DataFrame
-        html_table = df.to_html(max_rows=max_rows, escape=False, index=False)
-
-        # Conditionally add title only if provided
-        title_html = (
-            f'<div class="card-header">{title}</div>'
-            if title else ""
-        )
-        
-        if add_row:
-            # Combine the HTML template and the generated DataFrame table
-            full_html = f"""
-            <div class="row">
-                <div class="col">
-                    <div class="card">
-                        {title_html}
-                        <div style="overflow: auto; max-height: {max_height}px;">
-                            {html_table}
-                        </div>
-                        <div class="card-description">
-                            <button class="toggle-btn" onclick="openModal(this)" data-details="">Explaination</button>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            """
-        else:
-            full_html = f"""
-            <div class="card">
-                {title_html}
-                <div style="overflow: auto; max-height: {max_height}px;">
-                    {html_table}
-                </div>
-                <div class="card-description">
-                    <button class="toggle-btn" onclick="openModal(this)" data-details="">Explaination</button>
-                </div>
-            </div>
-            """
+            add_row (bool, optional): If True, adds a row to the report content. Defaults to True.
+    
+        Returns:
+            Optional[str]: Rendered HTML string if return_html is True, else None.
+        """
+        
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("df must be a pandas DataFrame")
+        if mode not in ("html", "virtual"):
+            raise ValueError(f"mode must be 'html' or 'virtual', got {mode!r}")
+        if payload not in ("json", "binary"):
+            raise ValueError(f"payload must be 'json' or 'binary', got {payload!r}")
             
-        full_html = full_html.replace('\n', '').strip()
+        # The HTML table itself is only generated when the document is rendered
+        table = TableNode(df, max_rows=max_rows, mode=mode, max_height=max_height,
+                          payload=payload, payload_dtype=payload_dtype)
+        # The virtual table scrolls its own viewport
+        node = CardNode([table], title=title,
+                        body_style=f"overflow: auto; max-height: {max_height}px;" if mode == "html" else None,
+                        description=True)
+        
+        if add_row:
+            node = RowNode([ColumnNode([node])])
 
         if return_html:
-            return full_html
+            return node.to_html().replace('\n', '').strip()
         
-        self.add_content(full_html)
+        self._append(node)
     
+    @traced
     def add_plotly_figure(self, fig: PlotlyFigure, return_html: bool = False,
                           add_row: bool = True) -> Optional[str]:
         """
@@ -370,6 +4043,7 @@ class Report:
         Raises:
             TypeError: If `fig` is not an instance of Plotly's BaseFigure.
         """
+        from plotly.basedatatypes import BaseFigure as PlotlyFigure
         
         if not isinstance(fig, PlotlyFigure):
             raise TypeError("fig must be a valid Plotly figure object (e.g., go.Figure)")
@@ -378,55 +4052,49 @@ class Report:
                           title=dict(font=dict(size=18, weight=500), xanchor="left", yanchor="top",
                                      x=0, y=0.97, pad={"l": 10}))
 
+        node = CardNode([FigureNode(fig)], description=True)
+
         if add_row:
-            full_html = f"""
-            <div class="row">
-                <div class="col">
-                    <div class="card">
-                        {fig.to_html(full_html=False, include_plotlyjs=True,
-                        config=plotly_config, div_id=f"plotly-{uuid.uuid4().hex}")}
-                        <div class="card-description">
-                            <button class="toggle-btn" onclick="openModal(this)" data-details="">Explaination</button>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            """
-        else:
-            full_html = f"""
-            <div class="card">
-                {fig.to_html(full_html=False, include_plotlyjs=True,
-                config=plotly_config, div_id=f"plotly-{uuid.uuid4().hex}")}
-                <div class="card-description">
-                    <button class="toggle-btn" onclick="openModal(this)" data-details="">Explaination</button>
-                </div>
-            </div>
-            """
+            node = RowNode([ColumnNode([node])])
 
         if return_html:
-            return full_html
+            return node.to_html()
         
-        self.add_content(full_html)
+        self._append(node)
     
-    def countplot(self, df: pd.DataFrame, title: Optional[str] = None,
+    @traced
+    @budgeted
+    @cached_fragment
+    def countplot(self, df: DataSource, title: Optional[str] = None,
                   height: int = 400, include_cols: Optional[List[str]] = None,
                   exclude_cols: Optional[List[str]] = None,
                   max_plots: Optional[int] = None, max_categories: int = 20,
-                  class_name: Optional[str] = None, return_html: bool = False) -> Optional[str]:
+                  category_counts: str = "exact", sketch_capacity: Optional[int] = None,
+                  class_name: Optional[str] = None, workers: Optional[int] = None,
+                  return_html: bool = False) -> Optional[str]:
         """
         Generates and renders a grid of Plotly count plots (bar charts) for categorical columns in the given DataFrame.
 
         Each chart shows the percentage distribution of categories and is embedded inside a styled HTML card. The full set of cards is wrapped in a responsive grid layout and rendered inline in a Jupyter Notebook. Optionally, the generated HTML can also be returned.
 
         Args:
-            df (pd.DataFrame): The input DataFrame containing the data to visualize.
+            df (DataSource): The input DataFrame containing the data to visualize.
+                Also accepts DataFrame chunks or a CSV / parquet path, profiled in one bounded-memory pass.
             title (Optional[str]): Optional title displayed at the top of the grid of charts.
             height (int, optional): The height (in pixels) of each count plot chart. Defaults to 400.
             include_cols (Optional[List[str]], optional): Specific column names to include. If None, all object or categorical columns are used.
             exclude_cols (Optional[List[str]], optional): Specific column names to exclude from plotting. Defaults to None.
             max_plots (Optional[int], optional): The maximum number of count plots to generate. If None, plots all matching columns.
             max_categories (int, optional): Maximum number of categories to display in each count plot. Defaults to 20.
+            category_counts (str, optional): "exact" counts every value of each column; "sketch" keeps a bounded
+                Space-Saving summary of the most frequent values (one pass, block by block), adds an "Other"
+                bucket for the remaining values and shows the error bound of each count. Chunked input always
+                uses "sketch". Defaults to "exact".
+            sketch_capacity (Optional[int], optional): Number of values tracked by the "sketch" summaries.
+                Defaults to `ColumnProfile.category_capacity`.
             class_name (Optional[str], optional): CSS class name for each chart container. Defaults to a responsive Bootstrap-like layout.
+            workers (Optional[int], optional): Number of workers building the charts in parallel, in column order;
+                -1 uses every CPU. Defaults to the report's `workers`.
             return_html (bool, optional): If True, returns the generated HTML string instead of injecting it into the report.
 
         Returns:
@@ -435,6 +4103,8 @@ class Report:
     
         if not class_name:
             class_name = "col-xl-6 col-lg-6 col-md-6 col-sm-12 col-xs"
+        if category_counts not in ("exact", "sketch"):
+            raise ValueError(f"category_counts must be 'exact' or 'sketch', got {category_counts!r}")
         
         # Conditionally add title only if provided
         title_html = (
@@ -443,7 +4113,13 @@ class Report:
         )
                     
         # Identify categorical columns
-        cat_cols = df.select_dtypes(include=["object", "category"]).columns
+        profile = self.profile(df)
+        if profile.df is None:
+            # Chunked data is only available as heavy-hitter summaries
+            category_counts = "sketch"
+        counts = (profile.value_counts if category_counts == "exact"
+                  else functools.partial(profile.heavy_hitters, capacity=sketch_capacity))
+        cat_cols = profile.categorical_columns
         if include_cols:
             cat_cols = include_cols
         elif exclude_cols:
@@ -452,45 +4128,9 @@ class Report:
         if max_plots:
             cat_cols = cat_cols[:max_plots]
 
-        contents = ""
-        for col in cat_cols:
-            # Calculate frequency for each category
-            count_data = df[col].value_counts().reset_index()
-            count_data.columns = [col, 'count']
-
-            # Limit the categories to the top 'max_categories' if needed
-            if len(count_data) > max_categories:
-                count_data = count_data.head(max_categories)
-
-            # Calculate percentage for each category
-            total_count = count_data['count'].sum()
-            count_data['percentage'] = (count_data['count'] / total_count) * 100
-
-            # Create the count plot (bar chart)
-            fig = px.bar(count_data, x=col, y='percentage', title=f"Count Plot of {col}",
-                         labels={'percentage': 'Percentage'})
-            
-            # Use hover data to show the actual count
-            fig.update_traces(hovertemplate=f'{col}: %{{x}}<br>Count: %{{customdata[0]}}<br>Percentage: %{{y}}%')
-
-            # Add custom data for hover to display counts
-            fig.update_traces(customdata=count_data[['count']])
-
-            fig.update_layout(height=height, template="plotly_white",
-                              title=dict(font=dict(size=18, weight=500),
-                                         xanchor="left", yanchor="top",
-                                         x=0, y=0.97, pad={"l": 10}),
-                              margin=dict(t=50, b=10, l=10, r=10))
-            
-            # Add the chart HTML to the content
-            contents += f"""
-            <div class="{class_name}">
-                <div class="card">
-                    {fig.to_html(full_html=False, include_plotlyjs=True,
-                    config=plotly_config, div_id=f"plotly-{uuid.uuid4().hex}")}
-                </div>
-            </div>
-            """
+        contents = "".join(self._map_columns(
+            _countplot_card, [(col, counts(col), height, max_categories, class_name)
+                              for col in cat_cols], workers))
 
         # Combine everything into a full HTML grid
         full_html = f"""
@@ -500,17 +4140,22 @@ class Report:
         </div>
         """
 
-        self._render_in_notebook(full_html)
+        self._render_in_notebook(full_html, requires=["plotly"])
         
         if return_html:
             return full_html
    
-    def donut(self, df: pd.DataFrame, title: Optional[str] = None,
+    @traced
+    @budgeted
+    @cached_fragment
+    def donut(self, df: DataSource, title: Optional[str] = None,
               height: int = 400, include_cols: Optional[List[str]] = None,
               exclude_cols: Optional[List[str]] = None,
               dunut_hole: float = 0.4,
               max_plots: Optional[int] = None, max_categories: int = 20,
-              class_name: Optional[str] = None, return_html: bool = False) -> Optional[str]:
+              category_counts: str = "exact", sketch_capacity: Optional[int] = None,
+              class_name: Optional[str] = None, workers: Optional[int] = None,
+              return_html: bool = False) -> Optional[str]:
         """
         Generates and renders a grid of Plotly donut charts for categorical columns in the given DataFrame.
 
@@ -519,7 +4164,8 @@ class Report:
         the generated HTML can be returned instead of only rendering it in the notebook.
 
         Args:
-            df (pd.DataFrame): The input DataFrame containing the data to visualize.
+            df (DataSource): The input DataFrame containing the data to visualize.
+                Also accepts DataFrame chunks or a CSV / parquet path, profiled in one bounded-memory pass.
             title (Optional[str]): Optional title displayed above the grid of charts.
             height (int, optional): The height of each donut chart in pixels. Defaults to 400.
             include_cols (Optional[List[str]], optional): A list of column names to include in the donut charts.
@@ -528,8 +4174,16 @@ class Report:
             dunut_hole (float, optional): Size of the hole in the donut chart (0 for full pie, up to 1 for fully hollow). Defaults to 0.4.
             max_plots (Optional[int], optional): Maximum number of donut charts to generate. If None, plots all matching columns.
             max_categories (int, optional): Maximum number of categories to display per chart. Defaults to 20.
+            category_counts (str, optional): "exact" counts every value of each column; "sketch" keeps a bounded
+                Space-Saving summary of the most frequent values (one pass, block by block), adds an "Other"
+                bucket for the remaining values and shows the error bound of each count. Chunked input always
+                uses "sketch". Defaults to "exact".
+            sketch_capacity (Optional[int], optional): Number of values tracked by the "sketch" summaries.
+                Defaults to `ColumnProfile.category_capacity`.
             class_name (Optional[str], optional): CSS class for the outer container of each donut chart card.
                 Controls layout responsiveness. Defaults to a responsive grid layout class.
+            workers (Optional[int], optional): Number of workers building the charts in parallel, in column order;
+                -1 uses every CPU. Defaults to the report's `workers`.
             return_html (bool, optional): If True, returns the generated HTML string instead of just rendering it in the notebook.
 
         Returns:
@@ -537,10 +4191,18 @@ class Report:
         """
         if not class_name:
             class_name = "col-xl-6 col-lg-6 col-md-6 col-sm-12 col-xs"
+        if category_counts not in ("exact", "sketch"):
+            raise ValueError(f"category_counts must be 'exact' or 'sketch', got {category_counts!r}")
 
         title_html = f'<div class="card-header">{title}</div>' if title else ""
 
-        cat_cols = df.select_dtypes(include=["object", "category"]).columns
+        profile = self.profile(df)
+        if profile.df is None:
+            # Chunked data is only available as heavy-hitter summaries
+            category_counts = "sketch"
+        counts = (profile.value_counts if category_counts == "exact"
+                  else functools.partial(profile.heavy_hitters, capacity=sketch_capacity))
+        cat_cols = profile.categorical_columns
         if include_cols:
             cat_cols = include_cols
         elif exclude_cols:
@@ -549,44 +4211,9 @@ class Report:
         if max_plots:
             cat_cols = cat_cols[:max_plots]
 
-        contents = ""
-        for col in cat_cols:
-            count_data = df[col].value_counts().reset_index()
-            count_data.columns = [col, 'count']
-
-            if len(count_data) > max_categories:
-                count_data = count_data.head(max_categories)
-
-            total_count = count_data['count'].sum()
-            count_data['percentage'] = (count_data['count'] / total_count) * 100
-
-            # Create a donut chart
-            fig = px.pie(count_data, names=col, values='count',
-                         hole=dunut_hole, title=f'Dunut Chart of {col}')
-
-            fig.update_traces(
-                textinfo='percent',
-                hovertemplate=f'{col}: %{{label}}<br>Count: %{{value}}<br>Percentage: %{{percent}}'
-            )
-
-            fig.update_layout(
-                height=height,
-                template="plotly_white",
-                margin=dict(t=50, b=10, l=10, r=10),
-                title=dict(font=dict(size=18, weight=500),
-                           xanchor="left", yanchor="top",
-                           x=0, y=0.97, pad={"l": 10}),
-                showlegend=True
-            )
-
-            contents += f"""
-            <div class="{class_name}">
-                <div class="card">
-                    {fig.to_html(full_html=False, include_plotlyjs=True,
-                    config=plotly_config, div_id=f"plotly-{uuid.uuid4().hex}")}
-                </div>
-            </div>
-            """
+        contents = "".join(self._map_columns(
+            _donut_card, [(col, counts(col), height, max_categories, class_name, dunut_hole)
+                          for col in cat_cols], workers))
 
         full_html = f"""
         <div class="row">
@@ -595,15 +4222,20 @@ class Report:
         </div>
         """
 
-        self._render_in_notebook(full_html)
+        self._render_in_notebook(full_html, requires=["plotly"])
         
         if return_html:
             return full_html
 
-    def histogram(self, df: pd.DataFrame, title: Optional[str] = None,
+    @traced
+    @budgeted
+    @cached_fragment
+    def histogram(self, df: DataSource, title: Optional[str] = None,
                   bins: Optional[int] = None, include_cols: Optional[List[str]] = None,
                   exclude_cols: Optional[List[str]] = None, max_plots: Optional[int] = None, height: int = 300,
-                  class_name: Optional[str] = None, return_html: bool = False) -> Optional[str]:
+                  class_name: Optional[str] = None, binning: str = "client", bin_rule: str = "fd",
+                  workers: Optional[int] = None,
+                  return_html: bool = False) -> Optional[str]:
         """
         Generates and renders a grid of Plotly histogram charts for numeric columns in the given DataFrame.
 
@@ -612,7 +4244,9 @@ class Report:
         for further use or export.
 
         Args:
-            df (pd.DataFrame): The input DataFrame containing the data to visualize.
+            df (DataSource): The input DataFrame containing the data to visualize.
+                Also accepts DataFrame chunks or a CSV / parquet path, profiled in one bounded-memory pass;
+                such data is always summarized on the server.
             title (Optional[str]): Optional title displayed above the grid of histogram charts.
             bins (Optional[int], optional): Number of bins for each histogram. If None, Plotly determines bin size automatically.
             include_cols (Optional[List[str]], optional): A list of numeric column names to include in the histograms.
@@ -622,6 +4256,13 @@ class Report:
             height (int, optional): Height of each histogram chart in pixels. Defaults to 300.
             class_name (Optional[str], optional): CSS class for the outer container of each histogram card.
                 Controls layout responsiveness. Defaults to "col-xl-3 col-lg-4 col-md-6 col-sm-6 col-xs".
+            binning (str, optional): "client" lets Plotly bin the raw values in the browser; "server" computes
+                the bins in NumPy and only embeds edges and counts, so the output size does not depend on
+                the number of rows. Defaults to "client".
+            bin_rule (str, optional): Rule used for server-side binning when `bins` is None, "fd"
+                (Freedman–Diaconis) or "sturges". Defaults to "fd".
+            workers (Optional[int], optional): Number of workers building the charts in parallel, in column order;
+                -1 uses every CPU. Defaults to the report's `workers`.
             return_html (bool, optional): If True, returns the generated HTML string instead of just rendering it in the notebook.
 
         Returns:
@@ -629,6 +4270,8 @@ class Report:
         """
         if not class_name:
             class_name = "col-xl-3 col-lg-4 col-md-6 col-sm-6 col-xs"
+        if binning not in ("client", "server"):
+            raise ValueError(f"binning must be 'client' or 'server', got {binning!r}")
             
         # Conditionally add title only if provided
         title_html = (
@@ -636,7 +4279,11 @@ class Report:
             if title else ""
         )
             
-        numeric_cols = df.select_dtypes(include=["number"]).columns
+        profile = self.profile(df)
+        if profile.df is None:
+            # Chunked data is only available as aggregates
+            binning = "server"
+        numeric_cols = list(profile.numeric_columns)
         if include_cols:
             numeric_cols = include_cols
         elif exclude_cols:
@@ -645,21 +4292,13 @@ class Report:
         if max_plots:
             numeric_cols = numeric_cols[:max_plots]
 
-        contents = ""
-        for col in numeric_cols:
-            fig = px.histogram(df, x=col, nbins=bins)
-            fig.update_layout(height=height, template="plotly_white",
-                              title=dict(font=dict(size=18, weight=500), xanchor="left", yanchor="top",
-                                     x=0, y=0.97, pad={"l": 10}),
-                              margin=dict(t=20, b=10, l=10, r=10))
-            contents += f"""
-            <div class="{class_name}">
-                <div class="card">
-                    {fig.to_html(full_html=False, include_plotlyjs=True,
-                    config=plotly_config, div_id=f"plotly-{uuid.uuid4().hex}")}
-                </div>
-            </div>
-            """
+        if binning == "server":
+            # All columns are binned in one vectorized pass
+            binned = profile.bins(list(numeric_cols), bins=bins, rule=bin_rule)
+            tasks = [(col, binned[col], height, class_name) for col in numeric_cols if col in binned]
+        else:
+            tasks = [(col, df[col], height, class_name, bins) for col in numeric_cols]
+        contents = "".join(self._map_columns(_histogram_card, tasks, workers))
 
         full_html = f"""
         <div class="row">
@@ -668,15 +4307,20 @@ class Report:
         </div>
         """
 
-        self._render_in_notebook(full_html)
+        self._render_in_notebook(full_html, requires=["plotly"])
         
         if return_html:
             return full_html
         
-    def box(self, df: pd.DataFrame, title: Optional[str] = None,
+    @traced
+    @budgeted
+    @cached_fragment
+    def box(self, df: DataSource, title: Optional[str] = None,
             height: int = 300, include_cols: Optional[List[str]] = None,
             exclude_cols: Optional[List[str]] = None,
             max_plots: Optional[int] = None, class_name: Optional[str] = None,
+            stats: str = "client", max_outliers: int = 200, quantile_accuracy: Optional[float] = None,
+            workers: Optional[int] = None,
             return_html: bool = False) -> Optional[str]:
         """
         Generates and renders a grid of Plotly box plots for numeric columns in the given DataFrame.
@@ -686,7 +4330,9 @@ class Report:
         Optionally, the resulting HTML string can be returned for further use or export.
 
         Args:
-            df (pd.DataFrame): The input DataFrame containing numeric data to visualize.
+            df (DataSource): The input DataFrame containing numeric data to visualize.
+                Also accepts DataFrame chunks or a CSV / parquet path, profiled in one bounded-memory pass;
+                such data is always summarized on the server.
             title (Optional[str], optional): Optional title displayed above the grid of box plots.
             height (int, optional): Height of each box plot chart in pixels. Defaults to 300.
             include_cols (Optional[List[str]], optional): A list of numeric column names to include in the plots.
@@ -695,6 +4341,15 @@ class Report:
             max_plots (Optional[int], optional): Maximum number of box plots to generate. If None, plots all available.
             class_name (Optional[str], optional): CSS class for the outer container div of each chart card.
                 Controls layout responsiveness. Defaults to "col-xl-3 col-lg-4 col-md-6 col-sm-6 col-xs".
+            stats (str, optional): "client" embeds the raw column and lets Plotly compute the statistics in the
+                browser; "server" computes quartiles, whiskers, mean and a capped sample of outliers in NumPy
+                for all columns at once, so each chart stays a few kilobytes. Defaults to "client".
+            max_outliers (int, optional): Maximum number of outlier points per chart with server-side statistics. Defaults to 200.
+            quantile_accuracy (Optional[float], optional): Rank error bound of the server-side quartiles; if given,
+                they come from mergeable KLL sketches updated block by block instead of an exact sort.
+                Defaults to None (exact quartiles).
+            workers (Optional[int], optional): Number of workers building the charts in parallel, in column order;
+                -1 uses every CPU. Defaults to the report's `workers`.
             return_html (bool, optional): If True, returns the generated HTML string instead of just rendering it in the notebook.
 
         Returns:
@@ -702,6 +4357,8 @@ class Report:
         """
         if not class_name:
             class_name = "col-xl-3 col-lg-4 col-md-6 col-sm-6 col-xs"
+        if stats not in ("client", "server"):
+            raise ValueError(f"stats must be 'client' or 'server', got {stats!r}")
         
         # Conditionally add title only if provided
         title_html = (
@@ -709,7 +4366,11 @@ class Report:
             if title else ""
         )
             
-        numeric_cols = df.select_dtypes(include=["number"]).columns
+        profile = self.profile(df, quantile_accuracy)
+        if profile.df is None:
+            # Chunked data is only available as aggregates
+            stats = "server"
+        numeric_cols = list(profile.numeric_columns)
         if include_cols:
             numeric_cols = include_cols
         elif exclude_cols:
@@ -718,21 +4379,12 @@ class Report:
         if max_plots:
             numeric_cols = numeric_cols[:max_plots]
 
-        contents = ""
-        for col in numeric_cols:
-            fig = px.box(df, y=col)
-            fig.update_layout(height=height, template="plotly_white",
-                              title=dict(font=dict(size=18, weight=500), xanchor="left", yanchor="top",
-                                     x=0, y=0.97, pad={"l": 10}),
-                              margin=dict(t=20, b=10, l=10, r=10))
-            contents += f"""
-            <div class="{class_name}">
-                <div class="card">
-                    {fig.to_html(full_html=False, include_plotlyjs=True,
-                    config=plotly_config, div_id=f"plotly-{uuid.uuid4().hex}")}
-                </div>
-            </div>
-            """
+        if stats == "server":
+            box_stats = profile.box_stats(list(numeric_cols), max_outliers=max_outliers)
+            tasks = [(col, box_stats[col], height, class_name) for col in numeric_cols if col in box_stats]
+        else:
+            tasks = [(col, df[col], height, class_name) for col in numeric_cols]
+        contents = "".join(self._map_columns(_box_card, tasks, workers))
 
         full_html = f"""
         <div class="row">
@@ -741,15 +4393,21 @@ class Report:
         </div>
         """
 
-        self._render_in_notebook(full_html)
+        self._render_in_notebook(full_html, requires=["plotly"])
         
         if return_html:
             return full_html
     
-    def violin(self, df: pd.DataFrame, title: Optional[str] = None,
+    @traced
+    @budgeted
+    @cached_fragment
+    def violin(self, df: DataSource, title: Optional[str] = None,
                height: int = 300, include_cols: Optional[List[str]] = None,
                exclude_cols: Optional[List[str]] = None, max_plots: Optional[int] = None,
-               class_name: Optional[str] = None, return_html: bool = False) -> Optional[str]:
+               class_name: Optional[str] = None, stats: str = "client", max_outliers: int = 200,
+               quantile_accuracy: Optional[float] = None, bandwidth: Union[str, float] = "scott",
+               grid_size: int = 128, workers: Optional[int] = None,
+               return_html: bool = False) -> Optional[str]:
         """
         Generates and renders a grid of Plotly violin plots for numeric columns in the given DataFrame.
 
@@ -758,7 +4416,9 @@ class Report:
         Optionally, the resulting HTML string can be returned for further use or export.
 
         Args:
-            df (pd.DataFrame): The input DataFrame containing numeric data to visualize.
+            df (DataSource): The input DataFrame containing numeric data to visualize.
+                Also accepts DataFrame chunks or a CSV / parquet path, profiled in one bounded-memory pass;
+                such data is always summarized on the server.
             title (Optional[str], optional): Optional title displayed above the grid of violin plots.
             height (int, optional): Height of each violin plot chart in pixels. Defaults to 300.
             include_cols (Optional[List[str]], optional): A list of numeric column names to include in the plots.
@@ -767,6 +4427,18 @@ class Report:
             max_plots (Optional[int], optional): Maximum number of violin plots to generate. If None, plots all available.
             class_name (Optional[str], optional): CSS class for the outer container div of each chart card.
                 Controls layout responsiveness. Defaults to "col-xl-3 col-lg-4 col-md-6 col-sm-6 col-xs".
+            stats (str, optional): "client" embeds the raw column and lets Plotly compute the statistics in the
+                browser; "server" computes the density outline, quartiles, whiskers, mean and a capped sample of outliers in NumPy
+                for all columns at once, so each chart stays a few kilobytes. Defaults to "client".
+            max_outliers (int, optional): Maximum number of outlier points per chart with server-side statistics. Defaults to 200.
+            quantile_accuracy (Optional[float], optional): Rank error bound of the server-side quartiles; if given,
+                they come from mergeable KLL sketches updated block by block instead of an exact sort.
+                Defaults to None (exact quartiles).
+            bandwidth (Union[str, float], optional): Bandwidth rule of the server-side density outline, "scott",
+                "silverman" or a fixed bandwidth. Defaults to "scott".
+            grid_size (int, optional): Number of points of the server-side density outline. Defaults to 128.
+            workers (Optional[int], optional): Number of workers building the charts in parallel, in column order;
+                -1 uses every CPU. Defaults to the report's `workers`.
             return_html (bool, optional): If True, returns the generated HTML string instead of just rendering it in the notebook.
 
         Returns:
@@ -774,6 +4446,8 @@ class Report:
         """
         if not class_name:
             class_name = "col-xl-3 col-lg-4 col-md-6 col-sm-6 col-xs"
+        if stats not in ("client", "server"):
+            raise ValueError(f"stats must be 'client' or 'server', got {stats!r}")
         
         # Conditionally add title only if provided
         title_html = (
@@ -781,7 +4455,11 @@ class Report:
             if title else ""
         )
             
-        numeric_cols = df.select_dtypes(include=["number"]).columns
+        profile = self.profile(df, quantile_accuracy)
+        if profile.df is None:
+            # Chunked data is only available as aggregates
+            stats = "server"
+        numeric_cols = list(profile.numeric_columns)
         if include_cols:
             numeric_cols = include_cols
         elif exclude_cols:
@@ -790,21 +4468,15 @@ class Report:
         if max_plots:
             numeric_cols = numeric_cols[:max_plots]
 
-        contents = ""
-        for col in numeric_cols:
-            fig = px.violin(df, y=col, box=True, points="outliers")
-            fig.update_layout(height=height, template="plotly_white",
-                              title=dict(font=dict(size=18, weight=500), xanchor="left", yanchor="top",
-                                     x=0, y=0.97, pad={"l": 10}),
-                              margin=dict(t=20, b=10, l=10, r=10))
-            contents += f"""
-            <div class="{class_name}">
-                <div class="card">
-                    {fig.to_html(full_html=False, include_plotlyjs=True,
-                    config=plotly_config, div_id=f"plotly-{uuid.uuid4().hex}")}
-                </div>
-            </div>
-            """
+        if stats == "server":
+            box_stats = profile.box_stats(list(numeric_cols), max_outliers=max_outliers)
+            densities = profile.kde(list(numeric_cols), grid_size=grid_size,
+                                    bandwidth=bandwidth, cut=0)
+            tasks = [(col, box_stats[col], height, class_name, densities[col])
+                     for col in numeric_cols if col in box_stats and col in densities]
+        else:
+            tasks = [(col, df[col], height, class_name) for col in numeric_cols]
+        contents = "".join(self._map_columns(_violin_card, tasks, workers))
 
         full_html = f"""
         <div class="row">
@@ -813,15 +4485,86 @@ class Report:
         </div>
         """
 
-        self._render_in_notebook(full_html)
+        self._render_in_notebook(full_html, requires=["plotly"])
         
         if return_html:
             return full_html
     
+    @traced
+    @budgeted
+    @cached_fragment
+    def correlation_heatmap(self, df: pd.DataFrame, include_cols: Optional[List[str]] = None,
+                            exclude_cols: Optional[List[str]] = None, method: str = "pearson",
+                            dtype: str = "float32", title: Optional[str] = None,
+                            height: Optional[int] = None, max_annotated: int = 20,
+                            class_name: Optional[str] = None, return_html: bool = False) -> Optional[str]:
+        """
+        Generates a Plotly heatmap of the correlations between the numeric columns of the DataFrame.
+
+        Correlations are computed with `correlation_matrix` (blocked matrix products over pairwise-complete
+        rows) and cached on the DataFrame's profile, so `pairplot` and `hc_scatter` with `top_pairs` reuse them.
+        The hover shows each correlation and the number of rows it is computed from.
+
+        Args:
+            df (pd.DataFrame): The input DataFrame containing the data to visualize.
+            include_cols (Optional[List[str]], optional): Specific numeric columns to include. Defaults to None.
+            exclude_cols (Optional[List[str]], optional): Columns to exclude. Ignored if `include_cols` is provided. Defaults to None.
+            method (str, optional): "pearson" or "spearman". Defaults to "pearson".
+            dtype (str, optional): Precision of the matrix products, "float32" or "float64". Defaults to "float32".
+            title (Optional[str], optional): Title of the chart. Defaults to "Correlation Heatmap (<method>)".
+            height (Optional[int], optional): Height of the chart in pixels. Defaults to one that fits the columns.
+            max_annotated (int, optional): Largest number of columns for which the values are written in the cells.
+                Defaults to 20.
+            class_name (Optional[str], optional): CSS class for the outer container of the chart card. Defaults to "col-12".
+            return_html (bool, optional): If True, returns the generated HTML string. Defaults to False.
+
+        Returns:
+            Optional[str]: The generated HTML string if `return_html=True`; otherwise, returns None.
+        """
+        import plotly.graph_objects as go
+        if not class_name:
+            class_name = "col-12"
+        if method not in ("pearson", "spearman"):
+            raise ValueError(f"method must be 'pearson' or 'spearman', got {method!r}")
+
+        profile = self.profile(df)
+        numeric_cols = list(profile.numeric_columns)
+        if include_cols:
+            numeric_cols = [col for col in numeric_cols if col in include_cols]
+        elif exclude_cols:
+            numeric_cols = [col for col in numeric_cols if col not in exclude_cols]
+
+        corr, counts = profile.correlation(numeric_cols, method=method, dtype=dtype)
+        labels = [str(col) for col in numeric_cols]
+        annotate = len(labels) <= max_annotated
+        fig = go.Figure(go.Heatmap(
+            z=corr.to_numpy(), x=labels, y=labels, customdata=counts.to_numpy(),
+            zmin=-1, zmax=1, colorscale="RdBu", reversescale=True,
+            text=corr.round(2).to_numpy() if annotate else None, texttemplate="%{text}" if annotate else None,
+            hovertemplate="%{y} / %{x}<br>Correlation: %{z:.3f}<br>Rows: %{customdata}<extra></extra>"))
+        fig.update_layout(title=title or f"Correlation Heatmap ({method.title()})")
+        fig.update_yaxes(autorange="reversed")
+        height = height or min(max(400, 18 * len(labels) + 120), 2000)
+
+        full_html = f"""
+        <div class="row">
+            {_plotly_card(fig, height, class_name, margin_top=50)}
+        </div>
+        """
+
+        self._render_in_notebook(full_html, requires=["plotly"])
+        if return_html:
+            return full_html
+
+    @traced
+    @budgeted
+    @cached_fragment
     def pairplot(self, df: pd.DataFrame, include_cols: Optional[List[str]] = None,
                  exclude_cols: Optional[List[str]] = None, columns_per_row: int = 6,
                  max_plots: Optional[int] = None, width: int = 100, height: int = 100,
                  mark_point_size: int = 1, mark_point_opacity: float = 0.8,
+                 aggregate: Optional[str] = None, max_points: int = 5000, grid_size: int = 40,
+                 top_pairs: Optional[int] = None, method: str = "pearson",
                  return_html: bool = False) -> Optional[str]:
         """
         Generates a grid of scatter plots (pairplot) using Altair for combinations of numerical features
@@ -839,34 +4582,77 @@ class Report:
             height (int, optional): Height of each subplot in pixels. Defaults to 100.
             mark_point_size (int, optional): Size of each scatter point. Defaults to 1.
             mark_point_opacity (float, optional): Opacity of each scatter point (0 to 1). Defaults to 0.8.
+            aggregate (Optional[str], optional): What to do when the DataFrame has more than `max_points` rows.
+                "grid" reduces each pair to a `grid_size` x `grid_size` count grid drawn as a heatmap; "sample"
+                draws a uniform random sample of `max_points` rows, which preserves the point density.
+                If None, every row is plotted. Defaults to None.
+            max_points (int, optional): Row threshold above which `aggregate` applies, and the point budget of
+                the "sample" mode. Defaults to 5000.
+            grid_size (int, optional): Number of bins along each axis in the "grid" mode. Defaults to 40.
+            top_pairs (Optional[int], optional): If given, plots only the `top_pairs` distinct pairs (upper triangle,
+                no column against itself) with the largest absolute correlation, strongest first, instead of all
+                n x n combinations. Defaults to None.
+            method (str, optional): Correlation used to rank the pairs, "pearson" or "spearman". Defaults to "pearson".
             return_html (bool, optional): If True, returns the chart as an HTML string. Otherwise, shows it in a browser. Defaults to False.
 
         Returns:
             Optional[str]: An HTML string representation of the chart if `return_html` is True, otherwise None.
         """
-
-        numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
+        import altair as alt
+        if aggregate not in (None, "grid", "sample"):
+            raise ValueError(f"aggregate must be None, 'grid' or 'sample', got {aggregate!r}")
+        profile = self.profile(df)
+        large = aggregate is not None and len(df) > max_points
+        if large and aggregate == "sample":
+            df = df.sample(n=max_points, random_state=0)
+
+        numeric_cols = list(profile.numeric_columns)
         if include_cols:
             numeric_cols = [col for col in numeric_cols if col in include_cols]
         elif exclude_cols:
             numeric_cols = [col for col in numeric_cols if col not in exclude_cols]
 
-        # Generate feature pair combinations where each feature is paired with all others, skipping itself
-        pair_combos = []
-        for i in range(len(numeric_cols)):
-            for j in range(len(numeric_cols)):
-                pair_combos.append((numeric_cols[i], numeric_cols[j]))
+        if top_pairs:
+            # Only the most correlated distinct pairs, ranked on the full data
+            pair_combos = top_correlated_pairs(profile.correlation(numeric_cols, method=method)[0], top_pairs)
+        else:
+            # Generate feature pair combinations where each feature is paired with all others, skipping itself
+            pair_combos = []
+            for i in range(len(numeric_cols)):
+                for j in range(len(numeric_cols)):
+                    pair_combos.append((numeric_cols[i], numeric_cols[j]))
         
         if max_plots:
             pair_combos = pair_combos[:max_plots]
 
+        if large and aggregate == "grid":
+            grids = bin2d_numeric_pairs(df, [(x, y) for y, x in pair_combos], grid_size=grid_size,
+                                        profile=profile)
+
         # Create scatter plots for each pair
         charts = []
         for y, x in pair_combos:
-            chart = alt.Chart(df).mark_point(size=mark_point_size, opacity=mark_point_opacity).encode(
-                x=alt.X(x, scale=alt.Scale(zero=False), axis=alt.Axis(titleFontWeight='normal')),
-                y=alt.Y(y, scale=alt.Scale(zero=False), axis=alt.Axis(titleFontWeight='normal')),
-            ).properties(
+            if large and aggregate == "grid":
+                if (x, y) not in grids:
+                    continue
+                x_edges, y_edges, counts = grids[(x, y)]
+                xi, yi = np.nonzero(counts)
+                cells = pd.DataFrame({'x_start': x_edges[xi], 'x_end': x_edges[xi + 1],
+                                      'y_start': y_edges[yi], 'y_end': y_edges[yi + 1],
+                                      'count': counts[xi, yi]})
+                chart = alt.Chart(cells).mark_rect().encode(
+                    x=alt.X('x_start:Q', scale=alt.Scale(zero=False), axis=alt.Axis(title=str(x), titleFontWeight='normal')),
+                    x2='x_end:Q',
+                    y=alt.Y('y_start:Q', scale=alt.Scale(zero=False), axis=alt.Axis(title=str(y), titleFontWeight='normal')),
+                    y2='y_end:Q',
+                    color=alt.Color('count:Q', scale=alt.Scale(type='log', scheme='blues'), legend=None)
+                )
+            else:
+                chart = alt.Chart(df).mark_point(size=mark_point_size, opacity=mark_point_opacity).encode(
+                    x=alt.X(x, scale=alt.Scale(zero=False), axis=alt.Axis(titleFontWeight='normal')),
+                    y=alt.Y(y, scale=alt.Scale(zero=False), axis=alt.Axis(titleFontWeight='normal')),
+                )
+            chart = chart.properties(
                 width=width,
                 height=height
             )
@@ -897,43 +4683,112 @@ class Report:
         
         if return_html:
             # renderer: canvas, svg, png, json, none
-            return final_plot.to_html(output_div=f"altair-{uuid.uuid4().hex}",
-                                      fullhtml=False, requirejs=False, inline=False,
-                                      embed_options={'renderer': 'png'})
+            return altair_html(final_plot)
     
+    @traced
+    @budgeted
+    @cached_fragment
     def hc_scatter(self, df: pd.DataFrame, include_cols: Optional[List[str]] = None,
                        exclude_cols: Optional[List[str]] = None, class_name: Optional[str] = None,
                        max_plots: Optional[int] = None, height: int = 200, marker_radius: int = 2,
+                       payload: str = "json", payload_dtype: str = "float64",
+                       aggregate: Optional[str] = None, max_points: int = 5000, grid_size: int = 40,
+                       top_pairs: Optional[int] = None, method: str = "pearson",
                        return_html: bool = False) -> Optional[str]:
+        """
+        Generates a grid of Highcharts scatter plots for combinations of numerical features in the DataFrame.
+
+        Args:
+            df (pd.DataFrame): The input DataFrame containing the data to visualize.
+            include_cols (Optional[List[str]], optional): Specific numeric columns to include. Defaults to None.
+            exclude_cols (Optional[List[str]], optional): Columns to exclude. Ignored if `include_cols` is provided. Defaults to None.
+            class_name (Optional[str], optional): CSS class for the outer container of each chart card.
+                Defaults to "col-xl-2 col-lg-3 col-md-4 col-sm-6 col-xs-6".
+            max_plots (Optional[int], optional): Maximum number of feature pairs to plot. Defaults to None.
+            height (int, optional): Height of each chart in pixels. Defaults to 200.
+            marker_radius (int, optional): Radius of the scatter markers. Defaults to 2.
+            payload (str, optional): How the data is embedded. "json" writes a JSON array of points per chart;
+                "binary" writes every column used once as a base64 typed-array buffer that `report.js`
+                decodes in the browser. Defaults to "json".
+            payload_dtype (str, optional): Precision of binary payloads, "float32" or "float64". Defaults to "float64".
+            aggregate (Optional[str], optional): What to do when the DataFrame has more than `max_points` rows.
+                "grid" reduces each pair to a `grid_size` x `grid_size` count grid drawn as a heatmap; "sample"
+                draws a uniform random sample of `max_points` rows, which preserves the point density.
+                If None, every row is plotted. Defaults to None.
+            max_points (int, optional): Row threshold above which `aggregate` applies, and the point budget of
+                the "sample" mode. Defaults to 5000.
+            grid_size (int, optional): Number of bins along each axis in the "grid" mode. Defaults to 40.
+            top_pairs (Optional[int], optional): If given, plots only the `top_pairs` distinct pairs (upper triangle,
+                no column against itself) with the largest absolute correlation, strongest first, instead of all
+                n x n combinations. Defaults to None.
+            method (str, optional): Correlation used to rank the pairs, "pearson" or "spearman". Defaults to "pearson".
+            return_html (bool, optional): If True, returns the generated HTML string. Defaults to False.
+
+        Returns:
+            Optional[str]: The generated HTML string if `return_html=True`; otherwise, returns None.
+        """
         if not class_name:
             class_name = 'col-xl-2 col-lg-3 col-md-4 col-sm-6 col-xs-6'
-
-        numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
+        if payload not in ("json", "binary"):
+            raise ValueError(f"payload must be 'json' or 'binary', got {payload!r}")
+        if aggregate not in (None, "grid", "sample"):
+            raise ValueError(f"aggregate must be None, 'grid' or 'sample', got {aggregate!r}")
+        profile = self.profile(df)
+        large = aggregate is not None and len(df) > max_points
+        if large and aggregate == "sample":
+            df = df.sample(n=max_points, random_state=0)
+
+        numeric_cols = list(profile.numeric_columns)
         if include_cols:
             numeric_cols = [col for col in numeric_cols if col in include_cols]
         elif exclude_cols:
             numeric_cols = [col for col in numeric_cols if col not in exclude_cols]
 
-        pair_combos = []
-        for i in range(len(numeric_cols)):
-            for j in range(len(numeric_cols)):
-                pair_combos.append((numeric_cols[i], numeric_cols[j]))
+        if top_pairs:
+            # Only the most correlated distinct pairs, ranked on the full data
+            pair_combos = top_correlated_pairs(profile.correlation(numeric_cols, method=method)[0], top_pairs)
+        else:
+            pair_combos = []
+            for i in range(len(numeric_cols)):
+                for j in range(len(numeric_cols)):
+                    pair_combos.append((numeric_cols[i], numeric_cols[j]))
         
         if max_plots:
             pair_combos = pair_combos[:max_plots]
 
         cards = []
+        if large and aggregate == "grid":
+            grids = bin2d_numeric_pairs(df, pair_combos, grid_size=grid_size, profile=profile)
+            for x, y in pair_combos:
+                if (x, y) not in grids:
+                    continue
+                cards.append(self._hc_heatmap_card(x, y, *grids[(x, y)], class_name=class_name, height=height))
+
+            full_html = """
+            <div class="row">
+            """ + "\n".join(cards) + "</div>"
+
+            self._render_in_notebook(full_html, requires=["highcharts-heatmap"])
+            if return_html:
+                return full_html
+            return
+
+        payload_ids = {}
+        if payload == "binary":
+            # Each column is shipped once, however many pairs it takes part in
+            for col in dict.fromkeys(col for pair in pair_combos for col in pair):
+                payload_ids[col], payload_html = encode_payload(df[col], payload_dtype)
+                cards.append(payload_html)
+
         for _, (x, y) in enumerate(pair_combos):
             container_id = f"highchart-{uuid.uuid4().hex}"
-            data = df[[x, y]].dropna().values.tolist()
-            js_data = json.dumps(data)
+            if payload == "binary":
+                js_data = f"PyReport.points(PyReport.payload('{payload_ids[x]}'), PyReport.payload('{payload_ids[y]}'))"
+            else:
+                data = df[[x, y]].dropna().values.tolist()
+                js_data = json.dumps(data)
 
-            js_code = f"""
-            <div class="{class_name}">
-                <div class="card">
-                    <div id="{container_id}" style="width: 100%;"></div>
-                    <script>
-                    Highcharts.chart('{container_id}', {{
+            options = f"""{{
                         chart: {{
                             type: 'scatter',
                             zoomType: 'xy',
@@ -973,30 +4828,119 @@ class Report:
                         series: [{{
                             data: {js_data}
                         }}]
-                    }});
-                    </script>
+                    }}"""
+
+            script = lazy_chart_script(container_id, "highcharts", f"return Highcharts.chart(element, {options});")
+            js_code = f"""
+            <div class="{class_name}">
+                <div class="card">
+                    <div id="{container_id}" style="width: 100%; height: {height}px;"></div>
+                    {script}
                 </div>
             </div>
             """
             cards.append(js_code)
 
         full_html = """
-        <script src="https://code.highcharts.com/highcharts.js"></script>
         <div class="row">
         """ + "\n".join(cards) + "</div>"
 
-        self._render_in_notebook(full_html)
+        self._render_in_notebook(full_html, requires=["highcharts"])
         if return_html:
             return full_html
     
+    def _hc_heatmap_card(self, x: str, y: str, x_edges: np.ndarray, y_edges: np.ndarray,
+                         counts: np.ndarray, class_name: str, height: int) -> str:
+        """
+        Renders one aggregated scatter (2D count grid) as a Highcharts heatmap card.
+
+        Args:
+            x (str): Name of the x column.
+            y (str): Name of the y column.
+            x_edges (np.ndarray): Bin edges along x.
+            y_edges (np.ndarray): Bin edges along y.
+            counts (np.ndarray): Count matrix indexed as `[x bin, y bin]`.
+            class_name (str): CSS class for the outer container of the card.
+            height (int): Height of the chart in pixels.
+
+        Returns:
+            str: The card HTML.
+        """
+        container_id = f"highchart-{uuid.uuid4().hex}"
+        x_centers = (x_edges[:-1] + x_edges[1:]) / 2
+        y_centers = (y_edges[:-1] + y_edges[1:]) / 2
+        xi, yi = np.nonzero(counts)
+        js_data = json.dumps(np.column_stack([x_centers[xi], y_centers[yi], counts[xi, yi]]).tolist())
+
+        options = f"""{{
+                        chart: {{
+                            type: 'heatmap',
+                            height: {height},
+                            margin: [10, 10, 50, 20],
+                            spacing: [0, 0, 0, 0]
+                        }},
+                        title: {{ text: null }},
+                        xAxis: {{ title: {{ text: '{x}' }} }},
+                        yAxis: {{ title: {{ text: '{y}' }} }},
+                        colorAxis: {{ type: 'logarithmic', minColor: '#eef4fb', maxColor: '#1f5fa8' }},
+                        legend: {{ enabled: false }},
+                        tooltip: {{
+                            pointFormat: '{x}: {{point.x:.4g}}<br>{y}: {{point.y:.4g}}<br>Count: {{point.value}}'
+                        }},
+                        credits: {{ enabled: false }},
+                        series: [{{
+                            colsize: {x_edges[1] - x_edges[0]},
+                            rowsize: {y_edges[1] - y_edges[0]},
+                            data: {js_data}
+                        }}]
+                    }}"""
+
+        script = lazy_chart_script(container_id, "highcharts", f"return Highcharts.chart(element, {options});")
+        return f"""
+            <div class="{class_name}">
+                <div class="card">
+                    <div id="{container_id}" style="width: 100%; height: {height}px;"></div>
+                    {script}
+                </div>
+            </div>
+            """
+
+    @traced
+    @budgeted
+    @cached_fragment
     def hc_distribution(self, df: pd.DataFrame, include_cols: Optional[List[str]] = None,
                     exclude_cols: Optional[List[str]] = None, class_name: Optional[str] = None,
                     max_plots: Optional[int] = None,
-                    height: int = 250, return_html: bool = False) -> Optional[str]:
+                    height: int = 250, payload: str = "json", payload_dtype: str = "float64",
+                    workers: Optional[int] = None, return_html: bool = False) -> Optional[str]:
+        """
+        Generates a grid of Highcharts bell-curve distribution charts for numeric columns in the DataFrame.
+
+        Args:
+            df (pd.DataFrame): The input DataFrame containing the data to visualize.
+            include_cols (Optional[List[str]], optional): Specific numeric columns to include. Defaults to None.
+            exclude_cols (Optional[List[str]], optional): Columns to exclude. Ignored if `include_cols` is provided. Defaults to None.
+            class_name (Optional[str], optional): CSS class for the outer container of each chart card.
+                Defaults to "col-xl-3 col-lg-3 col-md-4 col-sm-6 col-xs-6".
+            max_plots (Optional[int], optional): Maximum number of charts to generate. Defaults to None.
+            height (int, optional): Height of each chart in pixels. Defaults to 250.
+            payload (str, optional): How the data is embedded. "json" writes a JSON array per chart;
+                "binary" writes a base64 typed-array buffer that `report.js` decodes in the browser. Defaults to "json".
+            payload_dtype (str, optional): Precision of binary payloads, "float32" or "float64". Defaults to "float64".
+            workers (Optional[int], optional): Number of workers building the charts in parallel, in column order;
+                -1 uses every CPU. Defaults to the report's `workers`.
+            return_html (bool, optional): If True, returns the generated HTML string. Defaults to False.
+
+        Returns:
+            Optional[str]: The generated HTML string if `return_html=True`; otherwise, returns None.
+        """
         if not class_name:
             class_name = 'col-xl-3 col-lg-3 col-md-4 col-sm-6 col-xs-6'
+        if payload not in ("json", "binary"):
+            raise ValueError(f"payload must be 'json' or 'binary', got {payload!r}")
             
-        numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
+        profile = self.profile(df)
+        numeric_cols = list(profile.numeric_columns)
 
         if include_cols:
             numeric_cols = [col for col in numeric_cols if col in include_cols]
@@ -1006,89 +4950,34 @@ class Report:
         if max_plots:
             numeric_cols = numeric_cols[:max_plots]
 
-        cards = []
-        for col in numeric_cols:
-            data = df[col].dropna().tolist()
-            js_data = json.dumps(data)
-            container_id = f"highchart-{uuid.uuid4().hex}"
-
-            js_code = f"""
-            <div class="{class_name}">
-                <div class="card">
-                    <div id="{container_id}" style="width: 100%;"></div>
-                    <script>
-                    Highcharts.chart('{container_id}', {{
-                        chart: {{
-                            height: {height},
-                            spacing: [0, 10, 0, 0]
-                        }},
-                        title: {{
-                            text: null
-                        }},
-                        xAxis: [{{
-                            title: {{
-                                text: '{col}'
-                            }},
-                            alignTicks: false
-                        }}, {{
-                            title: {{
-                                text: null
-                            }},
-                            alignTicks: false,
-                            opposite: true
-                        }}],
-                        yAxis: [{{
-                            title: {{ text: '{col}' }}
-                        }}, {{
-                            title: {{ text: null }},
-                            opposite: true
-                        }}],
-                        legend: {{ enabled: false }},
-                        series: [{{
-                            name: 'Bell curve',
-                            type: 'bellcurve',
-                            xAxis: 1,
-                            yAxis: 1,
-                            baseSeries: 1,
-                            zIndex: -1
-                        }}, {{
-                            name: 'Data',
-                            type: 'scatter',
-                            data: {js_data},
-                            marker: {{
-                                radius: 1.5
-                            }},
-                            accessibility: {{
-                                exposeAsGroupOnly: true
-                            }}
-                        }}],
-                        credits: {{ enabled: false }}
-                    }});
-                    </script>
-                </div>
-            </div>
-            """
-            cards.append(js_code)
+        cards = self._map_columns(
+            _bellcurve_card, [(col, df[col], height, class_name, payload, payload_dtype) for col in numeric_cols],
+            workers)
 
         full_html = """
-        <script src="https://code.highcharts.com/highcharts.js"></script>
-        <script src="https://code.highcharts.com/modules/histogram-bellcurve.js"></script>
         <div class="row">
         """ + "\n".join(cards) + "</div>"
 
-        self._render_in_notebook(full_html)
+        self._render_in_notebook(full_html, requires=["highcharts-bellcurve"])
         if return_html:
             return full_html
 
-    def histoplot(self, df: pd.DataFrame, include_cols: Optional[List[str]] = None,
+    @traced
+    @budgeted
+    @cached_fragment
+    def histoplot(self, df: DataSource, include_cols: Optional[List[str]] = None,
                   exclude_cols: Optional[List[str]] = None, columns_per_row: int = 4,
                   max_plots: Optional[int] = None, width: int = 200, height: int = 150,
-                  bin_step: Optional[float] = None, return_html: bool = False) -> Optional[str]:
+                  bin_step: Optional[float] = None, binning: str = "client", bin_rule: str = "fd",
+                  workers: Optional[int] = None,
+                  return_html: bool = False) -> Optional[str]:
         """
         Generates a grid of histograms using Altair for each numerical feature in the input DataFrame.
 
         Args:
-            df (pd.DataFrame): Input DataFrame containing data to visualize.
+            df (DataSource): Input DataFrame containing data to visualize.
+                Also accepts DataFrame chunks or a CSV / parquet path, profiled in one bounded-memory pass;
+                such data is always summarized on the server.
             include_cols (Optional[List[str]], optional): Specific numeric columns to include. Defaults to None.
             exclude_cols (Optional[List[str]], optional): Columns to exclude from plotting. Ignored if `include_cols` is provided. Defaults to None.
             columns_per_row (int, optional): Number of histogram plots per row. Defaults to 6.
@@ -1096,12 +4985,26 @@ class Report:
             width (int, optional): Width of each histogram in pixels. Defaults to 100.
             height (int, optional): Height of each histogram in pixels. Defaults to 100.
             bin_step (Optional[float], optional): Step size for binning. If None, Altair will use automatic binning. Defaults to None.
+            binning (str, optional): "client" embeds the raw data and lets Vega bin it; "server" computes the
+                bins in NumPy and only embeds edges and counts. Defaults to "client".
+            bin_rule (str, optional): Rule used for server-side binning when `bin_step` is None, "fd"
+                (Freedman–Diaconis) or "sturges". Defaults to "fd".
+            workers (Optional[int], optional): Number of workers building the charts in parallel, in column order;
+                -1 uses every CPU. Defaults to the report's `workers`.
             return_html (bool, optional): If True, returns the chart as HTML string. Otherwise displays in browser. Defaults to False.
 
         Returns:
             Optional[str]: HTML string if `return_html` is True; otherwise None.
         """
-        numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
+        import altair as alt
+        if binning not in ("client", "server"):
+            raise ValueError(f"binning must be 'client' or 'server', got {binning!r}")
+
+        profile = self.profile(df)
+        if profile.df is None:
+            # Chunked data is only available as aggregates
+            binning = "server"
+        numeric_cols = list(profile.numeric_columns)
         if include_cols:
             numeric_cols = [col for col in numeric_cols if col in include_cols]
         elif exclude_cols:
@@ -1110,17 +5013,12 @@ class Report:
         if max_plots:
             numeric_cols = numeric_cols[:max_plots]
 
-        charts = []
-        for col in numeric_cols:
-            chart = alt.Chart(df).mark_bar(opacity=0.75).encode(
-                x=alt.X(col, bin=alt.Bin(step=bin_step) if bin_step else True,
-                        axis=alt.Axis(titleFontWeight='normal')),
-                y=alt.Y('count()', axis=alt.Axis(title='Count', titleFontWeight='normal'))
-            ).properties(
-                width=width,
-                height=height
-            )
-            charts.append(chart)
+        if binning == "server":
+            binned = profile.bins(numeric_cols, bin_step=bin_step, rule=bin_rule)
+            tasks = [(col, binned[col], width, height) for col in numeric_cols if col in binned]
+        else:
+            tasks = [(col, df[col], width, height, bin_step) for col in numeric_cols]
+        charts = self._map_columns(_histoplot_chart, tasks, workers)
 
         grid = alt.vconcat(*[
             alt.hconcat(*charts[i:i + columns_per_row])
@@ -1144,31 +5042,50 @@ class Report:
         final_plot.show()
         
         if return_html:
-            return final_plot.to_html(output_div=f"altair-{uuid.uuid4().hex}",
-                                      fullhtml=False, requirejs=False, inline=False,
-                                      embed_options={'renderer': 'png'})
+            return altair_html(final_plot)
     
-    def boxplot(self, df: pd.DataFrame, include_cols: Optional[List[str]] = None,
+    @traced
+    @budgeted
+    @cached_fragment
+    def boxplot(self, df: DataSource, include_cols: Optional[List[str]] = None,
                 exclude_cols: Optional[List[str]] = None, columns_per_row: int = 4,
                 max_plots: Optional[int] = None, width: int = 180, height: int = 150,
+                stats: str = "client", max_outliers: int = 200, quantile_accuracy: Optional[float] = None,
                 return_html: bool = False) -> Optional[str]:
         """
         Generates a grid of box plots using Altair for each numerical feature in the input DataFrame.
 
         Args:
-            df (pd.DataFrame): Input DataFrame containing data to visualize.
+            df (DataSource): Input DataFrame containing data to visualize.
+                Also accepts DataFrame chunks or a CSV / parquet path, profiled in one bounded-memory pass;
+                such data is always summarized on the server.
             include_cols (Optional[List[str]], optional): Specific numeric columns to include. Defaults to None.
             exclude_cols (Optional[List[str]], optional): Columns to exclude from plotting. Ignored if `include_cols` is provided. Defaults to None.
             columns_per_row (int, optional): Number of box plots per row. Defaults to 6.
             max_plots (Optional[int], optional): Maximum number of features to include. Useful for large datasets. Defaults to None.
             width (int, optional): Width of each box plot in pixels. Defaults to 100.
             height (int, optional): Height of each box plot in pixels. Defaults to 100.
+            stats (str, optional): "client" embeds the raw data and lets Vega compute the statistics; "server"
+                computes quartiles, whiskers and a capped sample of outliers in NumPy for all columns at once
+                and draws the boxes from them. Defaults to "client".
+            max_outliers (int, optional): Maximum number of outlier points per chart with server-side statistics. Defaults to 200.
+            quantile_accuracy (Optional[float], optional): Rank error bound of the server-side quartiles; if given,
+                they come from mergeable KLL sketches updated block by block instead of an exact sort.
+                Defaults to None (exact quartiles).
             return_html (bool, optional): If True, returns the chart as an HTML string. Otherwise displays in browser. Defaults to False.
 
         Returns:
             Optional[str]: HTML string if `return_html` is True; otherwise None.
         """
-        numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
+        import altair as alt
+        if stats not in ("client", "server"):
+            raise ValueError(f"stats must be 'client' or 'server', got {stats!r}")
+
+        profile = self.profile(df, quantile_accuracy)
+        if profile.df is None:
+            # Chunked data is only available as aggregates
+            stats = "server"
+        numeric_cols = list(profile.numeric_columns)
         if include_cols:
             numeric_cols = [col for col in numeric_cols if col in include_cols]
         elif exclude_cols:
@@ -1177,11 +5094,28 @@ class Report:
         if max_plots:
             numeric_cols = numeric_cols[:max_plots]
 
+        if stats == "server":
+            box_stats = profile.box_stats(numeric_cols, max_outliers=max_outliers)
+
         charts = []
         for col in numeric_cols:
-            box = alt.Chart(df).mark_boxplot(size=30).encode(
-                y=alt.Y(col, axis=alt.Axis(titleFontWeight='normal'))
-            ).properties(
+            if stats == "server":
+                if col not in box_stats:
+                    continue
+                col_stats = box_stats[col]
+                axis = alt.Axis(title=str(col), titleFontWeight='normal')
+                summary = alt.Chart(pd.DataFrame([{k: col_stats[k] for k in
+                                                   ('lowerfence', 'q1', 'median', 'q3', 'upperfence')}]))
+                whiskers = summary.mark_rule().encode(y=alt.Y('lowerfence:Q', axis=axis), y2='upperfence:Q')
+                quartile_box = summary.mark_bar(size=30).encode(y='q1:Q', y2='q3:Q')
+                median = summary.mark_tick(color='white', size=30).encode(y='median:Q')
+                outliers = alt.Chart(pd.DataFrame({'value': col_stats['outliers']})).mark_point().encode(y='value:Q')
+                box = alt.layer(whiskers, quartile_box, median, outliers)
+            else:
+                box = alt.Chart(df).mark_boxplot(size=30).encode(
+                    y=alt.Y(col, axis=alt.Axis(titleFontWeight='normal'))
+                )
+            box = box.properties(
                 width=width,
                 height=height
             )
@@ -1209,31 +5143,49 @@ class Report:
         final_plot.show()
         
         if return_html:
-            return final_plot.to_html(output_div=f"altair-{uuid.uuid4().hex}",
-                                      fullhtml=False, requirejs=False, inline=False,
-                                      embed_options={'renderer': 'png'})
+            return altair_html(final_plot)
     
-    def densityplot(self, df: pd.DataFrame, include_cols: Optional[List[str]] = None,
+    @traced
+    @budgeted
+    @cached_fragment
+    def densityplot(self, df: DataSource, include_cols: Optional[List[str]] = None,
                     exclude_cols: Optional[List[str]] = None, columns_per_row: int = 4,
                     max_plots: Optional[int] = None, width: int = 150, height: int = 150,
+                    kde: str = "client", bandwidth: Union[str, float] = "scott", grid_size: int = 256,
                     return_html: bool = False) -> Optional[str]:
         """
         Generates a grid of KDE-based density plots using Altair for numerical features in a DataFrame.
 
         Args:
-            df (pd.DataFrame): Input DataFrame.
+            df (DataSource): Input DataFrame.
+                Also accepts DataFrame chunks or a CSV / parquet path, profiled in one bounded-memory pass;
+                such data is always summarized on the server.
             include_cols (Optional[List[str]], optional): Specific numeric columns to include. Defaults to None.
             exclude_cols (Optional[List[str]], optional): Columns to exclude. Ignored if `include_cols` is provided. Defaults to None.
             columns_per_row (int, optional): Number of plots per row. Defaults to 6.
             max_plots (Optional[int], optional): Maximum number of features to plot. Defaults to None.
             width (int, optional): Width of each plot. Defaults to 100.
             height (int, optional): Height of each plot. Defaults to 100.
+            kde (str, optional): "client" embeds the raw data and lets Vega estimate the density in the browser;
+                "server" estimates all densities in NumPy (binned FFT KDE) and only embeds the curve points,
+                so the output size does not depend on the number of rows. Defaults to "client".
+            bandwidth (Union[str, float], optional): Bandwidth rule for server-side estimation, "scott",
+                "silverman" or a fixed bandwidth. Defaults to "scott".
+            grid_size (int, optional): Number of curve points per column for server-side estimation. Defaults to 256.
             return_html (bool, optional): If True, returns the chart as HTML. Otherwise, displays it. Defaults to False.
 
         Returns:
             Optional[str]: HTML string if `return_html` is True; otherwise None.
         """
-        numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
+        import altair as alt
+        if kde not in ("client", "server"):
+            raise ValueError(f"kde must be 'client' or 'server', got {kde!r}")
+
+        profile = self.profile(df)
+        if profile.df is None:
+            # Chunked data is only available as aggregates
+            kde = "server"
+        numeric_cols = list(profile.numeric_columns)
         if include_cols:
             numeric_cols = [col for col in numeric_cols if col in include_cols]
         elif exclude_cols:
@@ -1242,15 +5194,28 @@ class Report:
         if max_plots:
             numeric_cols = numeric_cols[:max_plots]
 
+        if kde == "server":
+            densities = profile.kde(numeric_cols, grid_size=grid_size, bandwidth=bandwidth)
+
         charts = []
         for col in numeric_cols:
-            chart = alt.Chart(df).transform_density(
-                density=col,
-                as_=[col, 'density']
-            ).mark_area(opacity=0.6).encode(
-                x=alt.X(col, axis=alt.Axis(titleFontWeight='normal')),
-                y=alt.Y('density:Q', axis=alt.Axis(title='Density', titleFontWeight='normal'))
-            ).properties(
+            if kde == "server":
+                if col not in densities:
+                    continue
+                x, density = densities[col]
+                chart = alt.Chart(pd.DataFrame({'x': x, 'density': density})).mark_area(opacity=0.6).encode(
+                    x=alt.X('x:Q', axis=alt.Axis(title=str(col), titleFontWeight='normal')),
+                    y=alt.Y('density:Q', axis=alt.Axis(title='Density', titleFontWeight='normal'))
+                )
+            else:
+                chart = alt.Chart(df).transform_density(
+                    density=col,
+                    as_=[col, 'density']
+                ).mark_area(opacity=0.6).encode(
+                    x=alt.X(col, axis=alt.Axis(titleFontWeight='normal')),
+                    y=alt.Y('density:Q', axis=alt.Axis(title='Density', titleFontWeight='normal'))
+                )
+            chart = chart.properties(
                 width=width,
                 height=height
             )
@@ -1278,39 +5243,69 @@ class Report:
         final_plot.show()
         
         if return_html:
-            return final_plot.to_html(output_div=f"altair-{uuid.uuid4().hex}",
-                                      fullhtml=False, requirejs=False, inline=False,
-                                      embed_options={'renderer': 'png'})
+            return altair_html(final_plot)
     
-    def run_server(self, port: Optional[int] = None) -> None:
+    def run_server(self, port: Optional[int] = None, host: str = "", block: bool = True,
+                   open_browser: bool = True, compress: bool = True, live: bool = False) -> ReportServer:
         """
-        Launches a local HTTP server to serve the report HTML file.
+        Launches a local HTTP server (see `ReportServer`) to serve the report.
+
+        The report is finalized first, so the served file is complete. The server runs on a background
+        thread; with `block=True` this call waits until interrupted (Ctrl+C) and then stops it,
+        otherwise it returns at once and the caller stops the server with `stop()`.
+
+        With `live=True` the report stays open and every node added afterwards is pushed to the open
+        pages over Server-Sent Events (see `LiveChannel`), where `report.js` appends it; browsers only
+        download the new fragments instead of reloading the page. Use it with `block=False`, keep
+        adding content, and stop the server (or `close()` the report) when done.
 
         Args:
-            port (int, optional): The port number to run the server on. If None, a random port between 8000 and 8999 is used.
+            port (Optional[int], optional): The port number to run the server on. If None, a free port is picked.
+            host (str, optional): Interface to bind, "" for all of them. Defaults to "".
+            block (bool, optional): Whether to wait until interrupted. Defaults to True.
+            open_browser (bool, optional): Whether to open the report in a browser tab. Defaults to True.
+            compress (bool, optional): Whether to send gzip / brotli variants. Defaults to True.
+            live (bool, optional): Whether to push content added later to the open pages. Defaults to False.
+
+        Returns:
+            ReportServer: The (stopped, if `block`) server.
+
+        Raises:
+            ValueError: If `live` is set for a deferred or multi-page report, which is not streamed.
         """
-        port = port or random.randint(8000, 8999)
+        import webbrowser
+
+        if live:
+            if self.deferred:
+                raise ValueError("live updates need a streaming report (deferred=False, output='file')")
+            if self._live is not None:
+                self._live.close()
+            self._live = LiveChannel()
+            with self._live.condition:
+                # Records the sequence number in the file served from now on
+                self._writer.marker = self._live.marker()
+                self._writer.write("")
+        else:
+            self.close()
         directory, filename = os.path.split(os.path.abspath(self.filepath))
-        
-        class Handler(http.server.SimpleHTTPRequestHandler):
-            def __init__(self, *args, **kwargs):
-                super().__init__(*args, directory=directory, **kwargs)
-        
-        def open_browser():
-            url = f"http://0.0.0.0:{port}/{filename}"
+        server = ReportServer(directory, port=port or 0, host=host, compress=compress,
+                              live=self._live if live else None).start()
+        url = f"{server.url}{filename}"
+        print(f"Serving '{filename}' at {url}")
+        if open_browser:
             webbrowser.open_new_tab(url)
+        if not block:
+            return server
+
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print("Shutting down server.")
+        finally:
+            server.stop()
+        return server
 
-        thread = threading.Thread(target=open_browser)
-        thread.start()
-
-        with socketserver.TCPServer(("", port), Handler) as httpd:
-            print(f"Serving '{filename}' at http://0.0.0.0:{port}")
-            try:
-                httpd.serve_forever()
-            except KeyboardInterrupt:
-                print("Shutting down server.")
-                httpd.shutdown()
-                
 def histogram_plot(df: pd.DataFrame, bins: Optional[int] = None,
                    default_col: Optional[str] = None) -> go.Figure:
     """
@@ -1324,6 +5319,7 @@ def histogram_plot(df: pd.DataFrame, bins: Optional[int] = None,
     Returns:
         go.Figure: A Plotly Figure object containing the histogram plot.
     """
+    import plotly.graph_objects as go
     if default_col is None:
         default_col = df.select_dtypes(include='number').columns.tolist()[0]
     
@@ -1375,6 +5371,7 @@ def violin_plot(df: pd.DataFrame, default_col: Optional[str] = None) -> go.Figur
     Returns:
         go.Figure: A Plotly Figure object containing the violin plot.
     """
+    import plotly.graph_objects as go
     
     if default_col is None:
         default_col = df.select_dtypes(include='number').columns.tolist()[0]
@@ -1423,7 +5420,9 @@ def violin_plot(df: pd.DataFrame, default_col: Optional[str] = None) -> go.Figur
     return fig
 
 def histogram_subplot(df: pd.DataFrame, bins: Optional[int] = None, max_cols_per_row: int = 3,
-                      horizontal_spacing: float = 0.03, vertical_spacing: float = 0.1) -> go.Figure:
+                      horizontal_spacing: float = 0.03, vertical_spacing: float = 0.1,
+                      binning: str = "client", bin_rule: str = "fd",
+                      profile: Optional[ColumnProfile] = None) -> go.Figure:
     """
     Generates a subplot of histograms for each numeric column in a DataFrame.
 
@@ -1433,12 +5432,24 @@ def histogram_subplot(df: pd.DataFrame, bins: Optional[int] = None, max_cols_per
         max_cols_per_row (int, optional): The maximum number of columns to display per row in the subplot. Defaults to 3.
         horizontal_spacing (float, optional): The horizontal space between subplots. Defaults to 0.03.
         vertical_spacing (float, optional): The vertical space between subplots. Defaults to 0.1.
+        binning (str, optional): "client" lets Plotly bin the raw values in the browser; "server" bins all
+            columns in NumPy and only embeds edges and counts. Defaults to "client".
+        bin_rule (str, optional): Rule used for server-side binning when `bins` is None, "fd"
+            (Freedman–Diaconis) or "sturges". Defaults to "fd".
+        profile (Optional[ColumnProfile], optional): Precomputed statistics of `df` to reuse
+            (e.g. `report.profile(df)`). Defaults to None.
 
     Returns:
         go.Figure: A Plotly Figure object containing the subplot of histograms.
     """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    if binning not in ("client", "server"):
+        raise ValueError(f"binning must be 'client' or 'server', got {binning!r}")
     
-    numeric_cols = df.select_dtypes(include='number').columns.tolist()
+    if profile is None:
+        profile = ColumnProfile(df)
+    numeric_cols = list(profile.numeric_columns)
     rows = int(np.ceil(len(numeric_cols) / max_cols_per_row))
     cols = min(len(numeric_cols), max_cols_per_row)
 
@@ -1448,29 +5459,42 @@ def histogram_subplot(df: pd.DataFrame, bins: Optional[int] = None, max_cols_per
         subplot_titles=numeric_cols,
         horizontal_spacing=horizontal_spacing, vertical_spacing=vertical_spacing)
 
+    if binning == "server":
+        binned = profile.bins(numeric_cols, bins=bins, rule=bin_rule)
+
     # Add histogram trace for each numeric column
     for i, col in enumerate(numeric_cols):
         r = i // cols + 1
         c = i % cols + 1
-        fig = go.Histogram(
-            x=df[col],
-            name="",
-            nbinsx=bins,
-            marker=dict(line=dict(width=0.5, color='gray'))
-        )
+        if binning == "server":
+            if col not in binned:
+                continue
+            fig = binned_bar_trace(*binned[col])
+            fig.update(marker=dict(line=dict(width=0.5, color='gray')))
+        else:
+            fig = go.Histogram(
+                x=df[col],
+                name="",
+                nbinsx=bins,
+                marker=dict(line=dict(width=0.5, color='gray'))
+            )
         subplot_fig.add_trace(fig, row=r, col=c)
 
     # Update layout for subplots
     subplot_fig.update_layout(
         height=300 * rows,
         title_text="Distribution of All Numeric Features",
-        showlegend=False
+        showlegend=False,
+        bargap=0 if binning == "server" else None
     )
 
     return subplot_fig
 
 def violin_subplot(df: pd.DataFrame, max_cols_per_row: int = 3, 
-                   horizontal_spacing: float = 0.03, vertical_spacing: float = 0.08) -> go.Figure:
+                   horizontal_spacing: float = 0.03, vertical_spacing: float = 0.08,
+                   stats: str = "client", max_outliers: int = 200, quantile_accuracy: Optional[float] = None,
+                   bandwidth: Union[str, float] = "scott", grid_size: int = 128,
+                   profile: Optional[ColumnProfile] = None) -> go.Figure:
     """
     Generates a subplot of violin plots for each numeric column in a DataFrame.
 
@@ -1479,12 +5503,29 @@ def violin_subplot(df: pd.DataFrame, max_cols_per_row: int = 3,
         max_cols_per_row (int, optional): The maximum number of columns to display per row in the subplot. Defaults to 3.
         horizontal_spacing (float, optional): The horizontal space between subplots. Defaults to 0.03.
         vertical_spacing (float, optional): The vertical space between subplots. Defaults to 0.08.
+        stats (str, optional): "client" embeds the raw columns and lets Plotly compute the violins; "server"
+            computes density outlines, quartiles, whiskers and a capped sample of outliers in NumPy. Defaults to "client".
+        max_outliers (int, optional): Maximum number of outlier points per violin with server-side statistics. Defaults to 200.
+        quantile_accuracy (Optional[float], optional): Rank error bound of the server-side quartiles; if given,
+            they come from mergeable KLL sketches updated block by block instead of an exact sort.
+            Defaults to None (exact quartiles).
+        bandwidth (Union[str, float], optional): Bandwidth rule of the server-side density outlines. Defaults to "scott".
+        grid_size (int, optional): Number of points of each server-side density outline. Defaults to 128.
+        profile (Optional[ColumnProfile], optional): Precomputed statistics of `df` to reuse
+            (e.g. `report.profile(df)`). Defaults to None.
 
     Returns:
         go.Figure: A Plotly Figure object containing the subplot of violin plots.
     """
+    import plotly.graph_objects as go
+    import plotly.express as px
+    from plotly.subplots import make_subplots
+    if stats not in ("client", "server"):
+        raise ValueError(f"stats must be 'client' or 'server', got {stats!r}")
     
-    numeric_cols = df.select_dtypes(include='number').columns.tolist()
+    if profile is None:
+        profile = ColumnProfile(df, quantile_accuracy=quantile_accuracy)
+    numeric_cols = list(profile.numeric_columns)
     rows = int(np.ceil(len(numeric_cols) / max_cols_per_row))
     cols = min(len(numeric_cols), max_cols_per_row)
 
@@ -1494,15 +5535,27 @@ def violin_subplot(df: pd.DataFrame, max_cols_per_row: int = 3,
         subplot_titles=numeric_cols,
         horizontal_spacing=horizontal_spacing, vertical_spacing=vertical_spacing)
 
+    if stats == "server":
+        box_stats = profile.box_stats(numeric_cols, max_outliers=max_outliers)
+        densities = profile.kde(numeric_cols, grid_size=grid_size, bandwidth=bandwidth, cut=0)
+        colors = px.colors.qualitative.Plotly
+
     # Function to add violin trace with unique colors for each subplot
     def add_violin_trace(col, row, col_num):
-        fig = go.Violin(
-            y=df[col],  # For violin plot, use 'y' data
-            name=col,  # You can keep this as col for legend or an empty string ""
-            box_visible=True,
-            meanline_visible=True
-        )
-        subplot_fig.add_trace(fig, row=row, col=col_num)
+        if stats == "server":
+            if col not in box_stats or col not in densities:
+                return
+            color = colors[numeric_cols.index(col) % len(colors)]
+            for trace in violin_stats_traces(col, box_stats[col], *densities[col], color=color):
+                subplot_fig.add_trace(trace, row=row, col=col_num)
+        else:
+            fig = go.Violin(
+                y=df[col],  # For violin plot, use 'y' data
+                name=col,  # You can keep this as col for legend or an empty string ""
+                box_visible=True,
+                meanline_visible=True
+            )
+            subplot_fig.add_trace(fig, row=row, col=col_num)
 
         # Remove axis titles, but keep axis ticks
         subplot_fig.update_xaxes(title_text='', showticklabels=False, row=row, col=col_num)